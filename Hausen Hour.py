@@ -10,6 +10,8 @@ import json
 import uuid
 from datetime import datetime, timedelta
 
+from task_store import create_task, open_store, period_bounds
+
 # --- 페이지 설정 ---
 st.set_page_config(
     page_title="아이젠하워 매트릭스 Pro", 
@@ -17,10 +19,16 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# 사분면에 한 번에 그리는 미완료 할 일 수 (나머지는 "더 보기"로 펼침)
+PAGE_SIZE = 20
+
 # --- 다크모드 토글 초기화 ---
 if 'dark_mode' not in st.session_state:
     st.session_state.dark_mode = False
 
+# 스크립트 실행 횟수 (상호작용 한 번 = 실행 한 번인지 확인용)
+st.session_state.run_count = st.session_state.get('run_count', 0) + 1
+
 # --- 스타일 커스텀 ---
 def get_theme_colors():
     if st.session_state.dark_mode:
@@ -211,9 +219,20 @@ st.markdown(f"""
     </style>
     """, unsafe_allow_html=True)
 
-# --- 데이터 관리 로직 ---
-if 'tasks' not in st.session_state:
-    st.session_state.tasks = []
+# --- 데이터 관리 로직 (SQLite 저장소, 여러 워커 프로세스가 공유. 소유자별로 자기 할 일만 조회/변경) ---
+# 할 일 소유자: 로그인한 사용자는 이메일, 아니면 URL의 owner 값 (처음 방문 때 발급해 새로고침해도 유지)
+def get_owner():
+    if st.user.get("is_logged_in"):
+        return st.user.email
+    if "owner" not in st.query_params:
+        st.query_params["owner"] = uuid.uuid4().hex
+    return st.query_params["owner"]
+
+@st.cache_resource
+def get_store(owner):
+    return open_store("eisenhower_matrix_pro", owner)
+
+store = get_store(get_owner())
 
 if 'show_stats' not in st.session_state:
     st.session_state.show_stats = True
@@ -223,25 +242,42 @@ if 'view_mode' not in st.session_state:
 
 def add_task(text, quadrant_num, date, priority=1, note=""):
     if not text.strip(): return
-    config = {
-        1: {"urgent": True, "important": True},
-        2: {"urgent": False, "important": True},
-        3: {"urgent": True, "important": False},
-        4: {"urgent": False, "important": False}
-    }[quadrant_num]
-    
-    st.session_state.tasks.append({
-        "id": str(uuid.uuid4()), 
-        "text": text,
-        "urgent": config["urgent"],
-        "important": config["important"],
-        "completed": False,
-        "date": str(date),
-        "quadrant": quadrant_num,
-        "priority": priority,
-        "note": note,
-        "created_at": datetime.now().strftime("%Y-%m-%d %H:%M")
-    })
+    store.add(create_task(text, quadrant_num, date, priority, note))
+
+# --- 변경 콜백: 스크립트 실행 전에 저장소를 갱신하므로 st.rerun() 없이 한 번만 렌더링됨 ---
+# 변경된 사분면과 그 수치에 의존하는 통계/주간 뷰 프래그먼트만 다시 실행
+def rerun_quadrant(q_num):
+    st.rerun([f"quadrant_{q_num}", "summary"])
+
+def on_add(q_num, selected_date):
+    ss = st.session_state
+    add_task(ss[f"in_{q_num}"], q_num, selected_date, ss[f"priority_{q_num}"], ss[f"note_{q_num}"])
+    ss[f"in_{q_num}"] = ""
+    ss[f"note_{q_num}"] = ""
+    rerun_quadrant(q_num)
+
+def on_toggle(task_id, q_num):
+    store.set_completed(task_id, st.session_state[f"chk_{task_id}"])
+    rerun_quadrant(q_num)
+
+def on_delete(task_id, q_num):
+    store.delete(task_id)
+    rerun_quadrant(q_num)
+
+# 목록 창 크기/완료 그룹 펼침 상태 (버튼이 프래그먼트 안에 있어 해당 사분면만 다시 실행됨)
+def on_more(list_key):
+    st.session_state[f"limit_{list_key}"] = st.session_state.get(f"limit_{list_key}", PAGE_SIZE) + PAGE_SIZE
+
+def on_toggle_done(q_num):
+    st.session_state[f"show_done_{q_num}"] = not st.session_state.get(f"show_done_{q_num}", False)
+
+def on_delete_completed():
+    store.delete_completed()
+    st.session_state.flash = "완료된 할 일이 삭제되었습니다!"
+
+def on_clear():
+    store.clear()
+    st.session_state.flash = "모든 데이터가 초기화되었습니다!"
 
 def get_ai_suggestions(quadrant_num):
     suggestions = {
@@ -252,14 +288,14 @@ def get_ai_suggestions(quadrant_num):
     }
     return suggestions.get(quadrant_num, [])
 
-def calculate_stats(tasks, date):
-    date_tasks = [t for t in tasks if t['date'] == str(date)]
-    if not date_tasks:
+def calculate_stats(counts):
+    # 저장소의 날짜별 집계(counts)만 사용하고 할 일 목록은 읽지 않음
+    if not counts['total']:
         return {"total": 0, "completed": 0, "rate": 0, "urgent": 0}
     
-    total = len(date_tasks)
-    completed = len([t for t in date_tasks if t['completed']])
-    urgent = len([t for t in date_tasks if t['urgent']])
+    total = counts['total']
+    completed = counts['completed']
+    urgent = counts['urgent']
     
     return {
         "total": total,
@@ -268,108 +304,173 @@ def calculate_stats(tasks, date):
         "urgent": urgent
     }
 
+# --- 히트맵: 날짜별 집계만으로 그림 ---
+WEEKDAYS = ["월", "화", "수", "목", "금", "토", "일"]
+
+def heat_color(total, peak):
+    """할 일 수를 4단계 농도로 (할 일이 없으면 테두리 색)"""
+    if not total:
+        return colors['border']
+    level = min(4, -(-4 * total // peak))
+    return f"rgba(102, 126, 234, {[0, 0.3, 0.5, 0.75, 1][level]})"
+
+def period_summary(counts, label):
+    stats = calculate_stats(counts)
+    quadrant_counts = " · ".join(f"Q{q} {counts[f'q{q}']}" for q in range(1, 5))
+    st.caption(f"{label}: 완료 {stats['completed']}/{stats['total']} ({stats['rate']}%) · 긴급 {stats['urgent']} · {quadrant_counts}")
+
+def render_month_heatmap(selected_date):
+    month_start, month_end = period_bounds(selected_date, 'month')
+    days = store.day_stats(month_start, month_end)
+    peak = max((c['total'] for c in days.values()), default=0)
+    empty = dict.fromkeys(('total', 'completed'), 0)
+    
+    cells = [f"<div style='text-align:center; font-size:0.75rem; color:{colors['text_muted']};'>{w}</div>" for w in WEEKDAYS]
+    cells += ["<div></div>"] * month_start.weekday()
+    for offset in range((month_end - month_start).days + 1):
+        day = month_start + timedelta(days=offset)
+        counts = days.get(day, empty)
+        border = "2px solid #667eea" if day == selected_date else "2px solid transparent"
+        cells.append(f"""<div title='{day}: 완료 {counts['completed']}/{counts['total']}' style='background:{heat_color(counts['total'], peak)}; border:{border}; border-radius:6px; padding:6px; min-height:52px; color:{colors['text']};'>
+            <div style='font-size:0.75rem; font-weight:700;'>{day.day}</div>
+            <div style='font-size:0.8rem; text-align:right;'>{f"{counts['completed']}/{counts['total']}" if counts['total'] else ""}</div></div>""")
+    
+    st.markdown(f"### 🗓️ {selected_date.year}년 {selected_date.month}월")
+    period_summary(store.range_stats(month_start, month_end), "이번 달")
+    st.markdown(f"<div style='display:grid; grid-template-columns:repeat(7, 1fr); gap:4px;'>{''.join(cells)}</div>", unsafe_allow_html=True)
+
+def render_year_heatmap(selected_date):
+    year_start, year_end = period_bounds(selected_date, 'year')
+    days = store.day_stats(year_start, year_end)
+    peak = max((c['total'] for c in days.values()), default=0)
+    
+    # 주 단위 열(월요일 시작) x 요일 행
+    cells = ["<div></div>"] * year_start.weekday()
+    for offset in range((year_end - year_start).days + 1):
+        day = year_start + timedelta(days=offset)
+        counts = days.get(day)
+        total, completed = (counts['total'], counts['completed']) if counts else (0, 0)
+        outline = "outline:2px solid #667eea;" if day == selected_date else ""
+        cells.append(f"<div title='{day}: 완료 {completed}/{total}' style='background:{heat_color(total, peak)}; border-radius:2px; {outline}'></div>")
+    
+    st.markdown(f"### 🗓️ {selected_date.year}년")
+    period_summary(store.range_stats(year_start, year_end), "올해")
+    quarters = [period_bounds(year_start.replace(month=m), 'quarter') for m in (1, 4, 7, 10)]
+    st.caption(" · ".join(f"{i}분기 {c['completed']}/{c['total']}"
+                          for i, c in enumerate((store.range_stats(*q) for q in quarters), 1)))
+    st.markdown(f"<div style='display:grid; grid-auto-flow:column; grid-template-rows:repeat(7, 11px); grid-auto-columns:11px; gap:3px; overflow-x:auto;'>{''.join(cells)}</div>", unsafe_allow_html=True)
+
 # --- 사이드바 ---
 with st.sidebar:
     st.markdown("### ⚙️ 설정")
     
-    # 다크모드 토글
-    if st.toggle("🌙 다크모드", value=st.session_state.dark_mode):
-        st.session_state.dark_mode = True
-        st.rerun()
-    else:
-        st.session_state.dark_mode = False
-        st.rerun()
+    # 다크모드 토글 (key로 세션 상태를 직접 갱신하므로 색상은 이번 실행에 바로 반영됨)
+    st.toggle("🌙 다크모드", key="dark_mode")
     
     st.markdown("---")
     
     # 뷰 모드 선택
-    st.session_state.view_mode = st.radio("📅 보기 모드", ["일간", "주간"], horizontal=True)
+    view_mode = st.radio("📅 보기 모드", ["일간", "주간", "월간", "연간"], horizontal=True, key="view_mode")
     
     st.markdown("---")
     
     # 통계 토글
-    st.session_state.show_stats = st.checkbox("📊 통계 표시", value=st.session_state.show_stats)
+    show_stats = st.checkbox("📊 통계 표시", key="show_stats")
     
     st.markdown("---")
     
     # 데이터 관리
     st.markdown("### 🗂️ 데이터 관리")
-    if st.button("🗑️ 완료된 할 일 삭제", use_container_width=True):
-        st.session_state.tasks = [t for t in st.session_state.tasks if not t['completed']]
-        st.success("완료된 할 일이 삭제되었습니다!")
-        st.rerun()
+    st.button("🗑️ 완료된 할 일 삭제", use_container_width=True, on_click=on_delete_completed)
+    st.button("⚠️ 모든 데이터 초기화", use_container_width=True, on_click=on_clear)
+    if 'flash' in st.session_state:
+        st.success(st.session_state.pop('flash'))
     
-    if st.button("⚠️ 모든 데이터 초기화", use_container_width=True):
-        st.session_state.tasks = []
-        st.success("모든 데이터가 초기화되었습니다!")
-        st.rerun()
+    st.caption(f"🔁 스크립트 실행 횟수: {st.session_state.run_count}")
 
 # --- 상단 헤더 ---
 c_title, c_date = st.columns([1.2, 0.8])
 with c_title: 
     st.markdown("<div class='app-title'>📋 아이젠하워 매트릭스 Pro</div>", unsafe_allow_html=True)
 with c_date: 
-    selected_date = st.date_input("날짜", datetime.now(), label_visibility="collapsed")
-
-# --- 통계 대시보드 ---
-if st.session_state.show_stats:
-    stats = calculate_stats(st.session_state.tasks, selected_date)
-    
-    stat_cols = st.columns(4)
-    with stat_cols[0]:
-        st.markdown(f"""
-        <div class='stats-card'>
-            <div class='stat-number'>{stats['total']}</div>
-            <div class='stat-label'>전체 할 일</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with stat_cols[1]:
-        st.markdown(f"""
-        <div class='stats-card'>
-            <div class='stat-number'>{stats['completed']}</div>
-            <div class='stat-label'>완료된 할 일</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with stat_cols[2]:
-        st.markdown(f"""
-        <div class='stats-card'>
-            <div class='stat-number'>{stats['rate']}%</div>
-            <div class='stat-label'>완료율</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with stat_cols[3]:
-        st.markdown(f"""
-        <div class='stats-card'>
-            <div class='stat-number'>{stats['urgent']}</div>
-            <div class='stat-label'>긴급 할 일</div>
-        </div>
-        """, unsafe_allow_html=True)
-
-# --- 주간 뷰 ---
-if st.session_state.view_mode == "주간":
-    st.markdown("### 📅 주간 뷰")
-    week_cols = st.columns(7)
-    
-    for i in range(7):
-        day = selected_date - timedelta(days=selected_date.weekday()) + timedelta(days=i)
-        day_tasks = [t for t in st.session_state.tasks if t['date'] == str(day)]
-        completed = len([t for t in day_tasks if t['completed']])
+    selected_date = st.date_input("날짜", datetime.now(), label_visibility="collapsed", key="selected_date")
+
+# --- 통계/주간 뷰 (프래그먼트: 할 일이 바뀌면 사분면과 함께 이 부분만 다시 실행) ---
+# 위젯 값은 본문 실행에서 읽어 인자로 넘김 (프래그먼트만 다시 실행되면 본문 위젯 키가 세션에서 빠질 수 있음)
+def render_summary(selected_date, show_stats, view_mode):
+    # --- 통계 대시보드 ---
+    if show_stats:
+        # 통계는 선택 날짜의 집계만 사용
+        stats = calculate_stats(store.range_stats(selected_date, selected_date))
+        
+        stat_cols = st.columns(4)
+        with stat_cols[0]:
+            st.markdown(f"""
+            <div class='stats-card'>
+                <div class='stat-number'>{stats['total']}</div>
+                <div class='stat-label'>전체 할 일</div>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with stat_cols[1]:
+            st.markdown(f"""
+            <div class='stats-card'>
+                <div class='stat-number'>{stats['completed']}</div>
+                <div class='stat-label'>완료된 할 일</div>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with stat_cols[2]:
+            st.markdown(f"""
+            <div class='stats-card'>
+                <div class='stat-number'>{stats['rate']}%</div>
+                <div class='stat-label'>완료율</div>
+            </div>
+            """, unsafe_allow_html=True)
         
-        with week_cols[i]:
-            is_today = day == selected_date
-            border = "3px solid #667eea" if is_today else f"1px solid {colors['border']}"
+        with stat_cols[3]:
             st.markdown(f"""
-            <div style='border: {border}; border-radius: 8px; padding: 12px; background: {colors['card']}; text-align: center;'>
-                <div style='font-weight: 700; color: {colors['text']};'>{day.strftime('%m/%d')}</div>
-                <div style='font-size: 0.8rem; color: {colors['text_muted']};'>{day.strftime('%a')}</div>
-                <div style='font-size: 1.2rem; font-weight: 700; margin-top: 8px; color: #667eea;'>{completed}/{len(day_tasks)}</div>
+            <div class='stats-card'>
+                <div class='stat-number'>{stats['urgent']}</div>
+                <div class='stat-label'>긴급 할 일</div>
             </div>
             """, unsafe_allow_html=True)
+
+    # --- 주간 뷰 ---
+    if view_mode == "주간":
+        st.markdown("### 📅 주간 뷰")
+        week_cols = st.columns(7)
+        week_start, week_end = period_bounds(selected_date, 'week')
+        # 이번 주 날짜별 집계만 조회
+        week_stats = store.day_stats(week_start, week_end)
+        
+        for i in range(7):
+            day = week_start + timedelta(days=i)
+            day_stats = week_stats.get(day, {'total': 0, 'completed': 0})
+            completed = day_stats['completed']
+            
+            with week_cols[i]:
+                is_today = day == selected_date
+                border = "3px solid #667eea" if is_today else f"1px solid {colors['border']}"
+                st.markdown(f"""
+                <div style='border: {border}; border-radius: 8px; padding: 12px; background: {colors['card']}; text-align: center;'>
+                    <div style='font-weight: 700; color: {colors['text']};'>{day.strftime('%m/%d')}</div>
+                    <div style='font-size: 0.8rem; color: {colors['text_muted']};'>{day.strftime('%a')}</div>
+                    <div style='font-size: 1.2rem; font-weight: 700; margin-top: 8px; color: #667eea;'>{completed}/{day_stats['total']}</div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        st.markdown("---")
     
-    st.markdown("---")
+    # --- 월간/연간 히트맵 ---
+    elif view_mode == "월간":
+        render_month_heatmap(selected_date)
+        st.markdown("---")
+    elif view_mode == "연간":
+        render_year_heatmap(selected_date)
+        st.markdown("---")
+
+st.fragment(render_summary, key="summary")(selected_date, show_stats, view_mode)
 
 # --- 매트릭스 사분면 설정 ---
 quadrants = [
@@ -379,7 +480,80 @@ quadrants = [
     {"num": 4, "title": "비중요 & 비긴급", "color": colors['q4'], "icon": "☕"}
 ]
 
-visible_tasks = [t for t in st.session_state.tasks if t['date'] == str(selected_date) or (t['date'] < str(selected_date) and not t['completed'])]
+# --- 사분면 하나 그리기 (프래그먼트로 감싸 사분면별로 따로 다시 실행됨) ---
+def render_quadrant(q, selected_date):
+    # 헤더
+    st.markdown(f'<div class="q-header" style="background-color: {q["color"]};">{q["icon"]} {q["title"]}</div>', unsafe_allow_html=True)
+    
+    # ➕ 할 일 추가
+    with st.popover("➕ 새 할 일 추가", use_container_width=True):
+        st.text_input("할 일", key=f"in_{q['num']}", label_visibility="collapsed", placeholder="할 일을 입력하세요...")
+        st.text_area("메모 (선택)", key=f"note_{q['num']}", label_visibility="collapsed", placeholder="상세 메모...", height=80)
+        st.select_slider("우선순위", options=[1, 2, 3, 4, 5], value=3, key=f"priority_{q['num']}")
+        
+        col_save, col_ai = st.columns([1, 1])
+        with col_save:
+            st.button("💾 저장", key=f"btn_{q['num']}", use_container_width=True, on_click=on_add, args=(q['num'], selected_date))
+        
+        with col_ai:
+            if st.button("🤖 AI 추천", key=f"ai_{q['num']}", use_container_width=True):
+                suggestions = get_ai_suggestions(q['num'])
+                for suggestion in suggestions:
+                    st.markdown(f'<div class="ai-suggestion">💡 {suggestion}</div>', unsafe_allow_html=True)
+    
+    # 목록 영역 (선택 날짜의 할 일 + 이전 미완료 할 일 중 이 사분면 것만 저장소에서 조회)
+    q_tasks = sorted(store.load(selected_date, quadrant=q['num']), 
+                    key=lambda x: (x['completed'], -x.get('priority', 1)))
+    open_tasks = [t for t in q_tasks if not t['completed']]
+    done_tasks = [t for t in q_tasks if t['completed']]
+    
+    st.markdown('<div class="quadrant-content">', unsafe_allow_html=True)
+    if not q_tasks:
+        st.markdown(f"<div style='text-align:center; padding-top:50px; color:{colors['text_muted']}; font-size:0.9rem;'>할 일이 없습니다</div>", unsafe_allow_html=True)
+    
+    render_window(open_tasks, f"open_{q['num']}", q['num'], selected_date)
+    
+    # 완료 항목은 접어 두고 펼쳤을 때만 위젯 생성
+    if done_tasks:
+        show_done = st.session_state.get(f"show_done_{q['num']}", False)
+        st.button(f"{'▾' if show_done else '▸'} 완료된 할 일 {len(done_tasks)}개", key=f"done_btn_{q['num']}",
+                  use_container_width=True, on_click=on_toggle_done, args=(q['num'],))
+        if show_done:
+            render_window(done_tasks, f"done_{q['num']}", q['num'], selected_date)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+# --- 할 일 목록 창: 앞쪽 limit개만 위젯으로 그리고 나머지는 "더 보기" ---
+def render_window(tasks, list_key, q_num, selected_date):
+    limit = st.session_state.get(f"limit_{list_key}", PAGE_SIZE)
+    for task in tasks[:limit]:
+        render_task(task, q_num, selected_date)
+    if len(tasks) > limit:
+        st.button(f"더 보기 ({len(tasks) - limit}개 남음)", key=f"more_{list_key}",
+                  use_container_width=True, on_click=on_more, args=(list_key,))
+
+def render_task(task, q_num, selected_date):
+    t_col1, t_col2, t_col3 = st.columns([0.12, 0.76, 0.12])
+    
+    with t_col1:
+        st.checkbox("", value=task['completed'], key=f"chk_{task['id']}",
+                    on_change=on_toggle, args=(task['id'], q_num))
+    
+    with t_col2:
+        txt = task['text']
+        style = f"color:{colors['text_muted']}; text-decoration:line-through;" if task['completed'] else f"color:{colors['text']};"
+        if task['date'] < str(selected_date): 
+            txt = f"⏳ {txt}"
+        
+        priority_color = ["#ef4444", "#f97316", "#eab308", "#84cc16", "#22c55e"][task.get('priority', 3) - 1]
+        priority_badge = f'<span class="priority-badge" style="background: {priority_color}22; color: {priority_color};">P{task.get("priority", 3)}</span>'
+        
+        st.markdown(f"<div class='task-text-container' style='{style}'>{txt}{priority_badge}</div>", unsafe_allow_html=True)
+        
+        if task.get('note'):
+            st.markdown(f"<div class='note-text'>📝 {task['note']}</div>", unsafe_allow_html=True)
+    
+    with t_col3:
+        st.button("×", key=f"del_{task['id']}", on_click=on_delete, args=(task['id'], q_num))
 
 # --- 2x2 그리드 배치 ---
 row1 = st.columns(2)
@@ -388,63 +562,7 @@ grid = [row1[0], row1[1], row2[0], row2[1]]
 
 for i, q in enumerate(quadrants):
     with grid[i]:
-        # 헤더
-        st.markdown(f'<div class="q-header" style="background-color: {q["color"]};">{q["icon"]} {q["title"]}</div>', unsafe_allow_html=True)
-        
-        # ➕ 할 일 추가
-        with st.popover("➕ 새 할 일 추가", use_container_width=True):
-            in_val = st.text_input("할 일", key=f"in_{q['num']}", label_visibility="collapsed", placeholder="할 일을 입력하세요...")
-            in_note = st.text_area("메모 (선택)", key=f"note_{q['num']}", label_visibility="collapsed", placeholder="상세 메모...", height=80)
-            in_priority = st.select_slider("우선순위", options=[1, 2, 3, 4, 5], value=3, key=f"priority_{q['num']}")
-            
-            col_save, col_ai = st.columns([1, 1])
-            with col_save:
-                if st.button("💾 저장", key=f"btn_{q['num']}", use_container_width=True):
-                    add_task(in_val, q['num'], selected_date, in_priority, in_note)
-                    st.rerun()
-            
-            with col_ai:
-                if st.button("🤖 AI 추천", key=f"ai_{q['num']}", use_container_width=True):
-                    suggestions = get_ai_suggestions(q['num'])
-                    for suggestion in suggestions:
-                        st.markdown(f'<div class="ai-suggestion">💡 {suggestion}</div>', unsafe_allow_html=True)
-        
-        # 목록 영역
-        q_tasks = sorted([t for t in visible_tasks if t['quadrant'] == q['num']], 
-                        key=lambda x: (x['completed'], -x.get('priority', 1)))
-        
-        st.markdown('<div class="quadrant-content">', unsafe_allow_html=True)
-        if not q_tasks:
-            st.markdown(f"<div style='text-align:center; padding-top:50px; color:{colors['text_muted']}; font-size:0.9rem;'>할 일이 없습니다</div>", unsafe_allow_html=True)
-        
-        for task in q_tasks:
-            t_col1, t_col2, t_col3 = st.columns([0.12, 0.76, 0.12])
-            
-            with t_col1:
-                new_status = st.checkbox("", value=task['completed'], key=f"chk_{task['id']}")
-                if new_status != task['completed']:
-                    task['completed'] = new_status
-                    st.rerun()
-            
-            with t_col2:
-                txt = task['text']
-                style = f"color:{colors['text_muted']}; text-decoration:line-through;" if task['completed'] else f"color:{colors['text']};"
-                if task['date'] < str(selected_date): 
-                    txt = f"⏳ {txt}"
-                
-                priority_color = ["#ef4444", "#f97316", "#eab308", "#84cc16", "#22c55e"][task.get('priority', 3) - 1]
-                priority_badge = f'<span class="priority-badge" style="background: {priority_color}22; color: {priority_color};">P{task.get("priority", 3)}</span>'
-                
-                st.markdown(f"<div class='task-text-container' style='{style}'>{txt}{priority_badge}</div>", unsafe_allow_html=True)
-                
-                if task.get('note'):
-                    st.markdown(f"<div class='note-text'>📝 {task['note']}</div>", unsafe_allow_html=True)
-            
-            with t_col3:
-                if st.button("×", key=f"del_{task['id']}"):
-                    st.session_state.tasks = [t for t in st.session_state.tasks if t['id'] != task['id']]
-                    st.rerun()
-        st.markdown('</div>', unsafe_allow_html=True)
+        st.fragment(render_quadrant, key=f"quadrant_{q['num']}")(q, selected_date)
 
 st.markdown("---")
 st.caption("아이젠하워 매트릭스 Pro v5.0 | Enhanced with AI & Analytics")
@@ -1,13 +1,55 @@
 import streamlit as st
 import pandas as pd
-from datetime import datetime
+import uuid
+from datetime import date
+
+from task_store import create_task, open_store
 
 # 페이지 설정
 st.set_page_config(page_title="아이젠하워 매트릭스 플래너", layout="wide")
 
-# 세션 상태 초기화 (데이터 저장용)
-if 'tasks' not in st.session_state:
-    st.session_state.tasks = []
+# 할 일 소유자: 로그인한 사용자는 이메일, 아니면 URL의 owner 값 (처음 방문 때 발급해 새로고침해도 유지)
+def get_owner():
+    if st.user.get("is_logged_in"):
+        return st.user.email
+    if "owner" not in st.query_params:
+        st.query_params["owner"] = uuid.uuid4().hex
+    return st.query_params["owner"]
+
+# 할 일 저장소 (SQLite, 여러 워커 프로세스가 공유). 소유자별로 자기 할 일만 조회/변경
+@st.cache_resource
+def get_store(owner):
+    return open_store("eisenhower_pro", owner)
+
+store = get_store(get_owner())
+
+# 사분면에 한 번에 그리는 할 일 수 (나머지는 "더 보기"로 펼침)
+PAGE_SIZE = 20
+
+# 스크립트 실행 횟수 (상호작용 한 번 = 실행 한 번인지 확인용)
+st.session_state.run_count = st.session_state.get('run_count', 0) + 1
+
+# --- 변경 콜백: 스크립트 실행 전에 저장소를 갱신하므로 st.rerun() 없이 한 번만 렌더링됨 ---
+def add_task():
+    text = st.session_state.new_task
+    if text:
+        store.add(create_task(text, int(st.session_state.category[1]), date.today()))
+        st.session_state.new_task = ""
+
+def toggle_task(task_id):
+    store.set_completed(task_id, st.session_state[f"check_{task_id}"])
+
+def delete_task(task_id):
+    store.delete(task_id)
+
+def delete_completed():
+    store.delete_completed()
+
+def show_more(q_id):
+    st.session_state[f"limit_{q_id}"] = st.session_state.get(f"limit_{q_id}", PAGE_SIZE) + PAGE_SIZE
+
+# 전체/사분면별 통계는 저장소의 날짜별 집계 합으로 조회 (할 일 목록 전체를 읽거나 인덱스를 다시 만들지 않음)
+counts = store.range_stats(date.min, date.max)
 
 # 제목 섹션
 st.title("🚀 Eisenhower Matrix Pro")
@@ -17,25 +59,17 @@ st.write("중요도와 긴급성에 따라 작업을 분류하세요.")
 with st.container():
     col1, col2, col3 = st.columns([4, 2, 1])
     with col1:
-        new_task = st.text_input("새로운 할 일", placeholder="무엇을 해야 하나요?")
+        st.text_input("새로운 할 일", placeholder="무엇을 해야 하나요?", key="new_task")
     with col2:
-        category = st.selectbox("분류 선택", [
+        st.selectbox("분류 선택", [
             "Q1: 긴급 & 중요 (Do First)",
             "Q2: 안 긴급 & 중요 (Schedule)",
             "Q3: 긴급 & 안 중요 (Delegate)",
             "Q4: 안 긴급 & 안 중요 (Eliminate)"
-        ])
+        ], key="category")
     with col3:
         st.write("##") # 간격 조절
-        if st.button("추가", use_container_width=True):
-            if new_task:
-                st.session_state.tasks.append({
-                    "text": new_task,
-                    "quadrant": category.split(":")[0],
-                    "completed": False,
-                    "time": datetime.now().strftime("%H:%M")
-                })
-                st.rerun()
+        st.button("추가", use_container_width=True, on_click=add_task)
 
 st.divider()
 
@@ -54,36 +88,36 @@ for i, q_id in enumerate(["Q1", "Q2", "Q3", "Q4"]):
         st.subheader(q_info[q_id]["title"])
         st.caption(f"{q_info[q_id]['desc']} (위치: {q_id})")
         
-        # 해당 사분면의 할 일 필터링
-        q_tasks = [t for t in st.session_state.tasks if t["quadrant"] == q_id]
+        # 해당 사분면에서 화면에 보이는 앞쪽 limit개만 조회
+        q_total = counts[f"q{q_id[1]}"]
+        limit = st.session_state.get(f"limit_{q_id}", PAGE_SIZE)
+        q_tasks = store.load(quadrant=int(q_id[1]), limit=limit)
         
         if not q_tasks:
             st.info("비어 있습니다.")
         else:
-            for idx, task in enumerate(q_tasks):
+            for task in q_tasks:
                 # 할 일 표시 레이아웃
                 t_col1, t_col2 = st.columns([5, 1])
                 with t_col1:
-                    is_done = st.checkbox(f"{task['text']} ({task['time']})", key=f"check_{q_id}_{idx}", value=task['completed'])
-                    # 완료 상태 업데이트
-                    for t in st.session_state.tasks:
-                        if t == task:
-                            t['completed'] = is_done
+                    # 완료 상태는 값이 바뀐 경우에만 콜백에서 저장
+                    st.checkbox(f"{task['text']} ({task['created_at'][-5:]})", key=f"check_{task['id']}",
+                                value=task['completed'], on_change=toggle_task, args=(task['id'],))
                 with t_col2:
-                    if st.button("🗑️", key=f"del_{q_id}_{idx}"):
-                        st.session_state.tasks.remove(task)
-                        st.rerun()
+                    st.button("🗑️", key=f"del_{task['id']}", on_click=delete_task, args=(task['id'],))
+            if q_total > limit:
+                st.button(f"더 보기 ({q_total - limit}개 남음)", key=f"more_{q_id}",
+                          use_container_width=True, on_click=show_more, args=(q_id,))
 
 # 하단 통계
 st.sidebar.title("📊 통계")
-total = len(st.session_state.tasks)
-done = len([t for t in st.session_state.tasks if t['completed']])
+total = counts['total']
+done = counts['completed']
 if total > 0:
     st.sidebar.progress(done / total)
     st.sidebar.write(f"진행률: {int(done/total*100)}% ({done}/{total})")
 else:
     st.sidebar.write("등록된 작업이 없습니다.")
 
-if st.sidebar.button("완료 항목 모두 삭제"):
-    st.session_state.tasks = [t for t in st.session_state.tasks if not t['completed']]
-    st.rerun()
+st.sidebar.button("완료 항목 모두 삭제", on_click=delete_completed)
+st.sidebar.caption(f"🔁 스크립트 실행 횟수: {st.session_state.run_count}")
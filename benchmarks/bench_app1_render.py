@@ -0,0 +1,80 @@
+"""app1 사분면 렌더링 벤치마크: 기존 dict 비교 동기화 루프 vs id 인덱스 vs 현재 app1 (SQLite 저장소)
+
+위젯 생성은 제외하고, 렌더링 한 번에 수행되는 사분면 조회와 완료 상태 반영만 측정한다.
+현재 app1은 체크 변경 하나를 콜백에서 id로 저장하고, 통계는 날짜별 집계 합,
+사분면은 화면에 보이는 PAGE_SIZE개만 임시 SQLite 저장소에서 읽는다.
+실행: python benchmarks/bench_app1_render.py
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from task_store import SQLiteStore, TaskIndex, create_task
+
+SIZES = [1_000, 10_000]
+QUADRANTS = ["Q1", "Q2", "Q3", "Q4"]
+# app1.PAGE_SIZE와 같은 사분면 창 크기
+PAGE_SIZE = 20
+
+
+def make_tasks(n, seed=0):
+    rng = random.Random(seed)
+    # 같은 텍스트가 반복되는 현실적인 목록 (기존 방식에서는 dict 비교가 충돌함)
+    return [create_task(f"할 일 {rng.randint(0, n // 10)}", rng.randint(1, 4), date.today()) for _ in range(n)]
+
+
+def legacy_render(tasks, checked):
+    """기존 app1: 사분면마다 전체 필터 + 체크박스마다 전체 목록과 dict 비교"""
+    for q_id in QUADRANTS:
+        q_tasks = [t for t in tasks if t["quadrant"] == int(q_id[1])]
+        for task in q_tasks:
+            is_done = task['id'] in checked
+            for t in tasks:
+                if t == task:
+                    t['completed'] = is_done
+
+
+def indexed_render(index, checked):
+    """TaskIndex 방식 (user-010 시점 app1): 사분면 버킷 조회 + id로 O(1) 갱신"""
+    for q_id in QUADRANTS:
+        for task in index.in_quadrant(int(q_id[1])):
+            is_done = task['id'] in checked
+            if is_done != task['completed']:
+                index.set_completed(task['id'], is_done)
+
+
+def store_render(store, task_id):
+    """현재 app1: 체크 콜백 하나(set_completed) + 전체 통계 집계 + 사분면별 앞쪽 PAGE_SIZE개 조회"""
+    store.set_completed(task_id, True)
+    store.range_stats(date.min, date.max)
+    for q_id in QUADRANTS:
+        store.load(quadrant=int(q_id[1]), limit=PAGE_SIZE)
+
+
+def make_store(tasks):
+    store = SQLiteStore(os.path.join(tempfile.mkdtemp(), 'app1.sqlite3'), 'bench')
+    for task in tasks:
+        store.add(task)
+    return store
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    print(f"{'tasks':>8} {'legacy(s)':>10} {'indexed(s)':>11} {'sqlite app1(s)':>15} {'speedup':>8}")
+    for n in SIZES:
+        tasks = make_tasks(n)
+        checked = {t['id'] for t in random.Random(1).sample(tasks, n // 3)}
+        t_old = timed(legacy_render, [dict(t) for t in tasks], checked)
+        t_index = timed(indexed_render, TaskIndex(dict(t) for t in tasks), checked)
+        t_store = timed(store_render, make_store(tasks), tasks[n // 2]['id'])
+        print(f"{n:>8,} {t_old:>10.3f} {t_index:>11.4f} {t_store:>15.4f} {t_old / t_store:>7.0f}x")
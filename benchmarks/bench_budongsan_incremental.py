@@ -0,0 +1,75 @@
+"""증분 갱신 벤치마크: 새 달 데이터 추가 시 전체 재계산 vs PriceStore.append + 누적 통계량 예측
+
+증분 결과가 전체를 다시 합쳐 forecast_all로 계산한 값과 같은지(대체된 행 포함) 확인한다.
+같은 확인은 tests/test_budongsan_store.py에서 파일 단위(새 달 추가, 기존 파일 교체)로도 실행된다.
+실행: python benchmarks/bench_budongsan_incremental.py [지역 수]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from budongsan_core import compact_frame, concat_compact
+from budongsan_forecast import forecast_all
+from budongsan_ingest import DEDUP_COLS
+from budongsan_store import PriceStore
+
+REGIONS = 500
+SIZES = ['모든면적', '전용면적 60제곱미터이하', '전용면적 60제곱미터초과 85제곱미터이하',
+         '전용면적 85제곱미터초과 102제곱미터이하', '전용면적 102제곱미터초과']
+YEARS = range(2000, 2026)
+
+
+def month_frame(regions, year, month, seed):
+    """한 달치 정규화 데이터 (지역 x 규모 한 행씩)"""
+    rng = np.random.default_rng(seed)
+    n = len(regions) * len(SIZES)
+    price = rng.normal(3000 + (year - 2000) * 120, 300, n)
+    df = pd.DataFrame({
+        '지역명': np.repeat(regions, len(SIZES)),
+        '규모구분': np.tile(SIZES, len(regions)),
+        '연도': year,
+        '월': month,
+        '분양가격': price,
+        '날짜': pd.Timestamp(year=year, month=month, day=1),
+        '평당가': price * 3.3,
+    })
+    return compact_frame(df)
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def full_refresh(history, new):
+    df = concat_compact([history, new]).drop_duplicates(subset=DEDUP_COLS, keep='last')
+    return forecast_all(df)
+
+
+if __name__ == '__main__':
+    n_regions = int(sys.argv[1]) if len(sys.argv) > 1 else REGIONS
+    regions = np.array([f'지역{i:04}' for i in range(n_regions)])
+    months = [month_frame(regions, y, m, seed=y * 12 + m) for y in YEARS for m in range(1, 13)
+              if (y, m) < (2025, 12)]
+    history = concat_compact(months)
+    # 새 달 데이터 + 지난달 일부 정정분 (같은 키 대체)
+    new = concat_compact([month_frame(regions, 2025, 12, seed=1),
+                          month_frame(regions[: n_regions // 10], 2025, 11, seed=2)])
+
+    store, t_build = timed(PriceStore, history)
+    expected, t_full = timed(full_refresh, history, new)
+    counts, t_append = timed(store.append, new)
+    actual, t_table = timed(store.forecasts)
+    pd.testing.assert_frame_equal(actual, expected, check_exact=False, rtol=1e-9)
+    assert len(store.frame()) == len(history) + counts[0]
+
+    print(f"history {len(history):,} rows, new {len(new):,} rows (added {counts[0]:,}, replaced {counts[1]:,})")
+    print(f"{'full refit(s)':>14} {'append(s)':>10} {'forecast(s)':>12} {'store build(s)':>15}")
+    print(f"{t_full:>14.3f} {t_append:>10.3f} {t_table:>12.4f} {t_build:>15.2f}")
@@ -0,0 +1,53 @@
+"""여러 파일 적재 벤치마크: 순차 파싱 vs 프로세스 풀, 매니페스트 재사용(재시작) 시간
+
+병렬 결과가 순차 결과와 같고 (지역명, 규모구분, 연도, 월) 중복이 없는지도 확인한다.
+실행: python benchmarks/bench_budongsan_ingest.py [파일 수] [파일당 행 수]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_budongsan_normalize import make_messy_frame
+from budongsan_ingest import DEDUP_COLS, load_price_files, resolve_sources
+
+FILES = 24
+ROWS = 100_000
+
+
+def timed_load(paths, workers, cache_dir):
+    start = time.perf_counter()
+    df, err = load_price_files(paths, workers=workers, cache_dir=cache_dir)
+    assert err is None, err
+    return df, time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    files = int(sys.argv[1]) if len(sys.argv) > 1 else FILES
+    rows = int(sys.argv[2]) if len(sys.argv) > 2 else ROWS
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = os.path.join(tmp, 'drops')
+        os.makedirs(data_dir)
+        for i in range(files):
+            make_messy_frame(rows, seed=i).to_csv(os.path.join(data_dir, f'price_{i:03}.csv'), index=False)
+        paths = resolve_sources(data_dir)
+
+        serial, t_serial = timed_load(paths, 1, os.path.join(tmp, 'serial'))
+        parallel, t_parallel = timed_load(paths, None, os.path.join(tmp, 'pool'))
+        pd.testing.assert_frame_equal(serial, parallel)
+        assert not parallel.duplicated(DEDUP_COLS).any()
+        _, t_warm = timed_load(paths, None, os.path.join(tmp, 'pool'))
+
+        # 파일 하나만 바뀐 경우 (해당 파일만 다시 파싱)
+        make_messy_frame(rows, seed=files).to_csv(paths[-1], index=False)
+        _, t_changed = timed_load(paths, None, os.path.join(tmp, 'pool'))
+
+        print(f"{files} files x {rows:,} rows, workers={os.cpu_count()}")
+        print(f"{'serial(s)':>10} {'pool(s)':>8} {'manifest(s)':>12} {'1 changed(s)':>13}")
+        print(f"{t_serial:>10.2f} {t_parallel:>8.2f} {t_warm:>12.2f} {t_changed:>13.2f}")
@@ -0,0 +1,96 @@
+"""정규화 벤치마크 겸 회귀 확인: 행 단위 clean_value/safe_date vs 벡터화 경로
+
+두 경로의 결과가 (PRICE_SCHEMA 변환 후) 완전히 같고 스키마를 지키는지 확인한 뒤
+시간과 결과 프레임의 메모리 사용량을 비교한다.
+결과 동일성 확인은 tests/test_budongsan_normalize.py에서 수백 행 표본으로도 실행된다.
+실행: python benchmarks/bench_budongsan_normalize.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from budongsan_core import clean_value, compact_frame, normalize_frame, schema_errors
+from csv_loader import read_csv_auto
+from shared_frame import frame_mb
+
+SIZES = [10_000, 100_000, 1_000_000]
+
+
+def legacy_normalize(df):
+    """벡터화 이전의 행 단위 정규화 (clean_value apply + safe_date apply)"""
+    new_df = pd.DataFrame()
+    new_df['지역명'] = df['지역명'].astype(str)
+    new_df['규모구분'] = df['규모구분'].astype(str)
+    new_df['연도'] = pd.to_numeric(df['연도'], errors='coerce')
+    new_df['월'] = pd.to_numeric(df['월'], errors='coerce')
+    new_df['분양가격'] = df['분양가격(제곱미터)'].apply(clean_value)
+    new_df = new_df.dropna(subset=['연도', '월', '분양가격'])
+
+    def safe_date(row):
+        try:
+            return pd.Timestamp(year=int(row['연도']), month=int(row['월']), day=1)
+        except:
+            return pd.NaT
+
+    new_df['날짜'] = new_df.apply(safe_date, axis=1)
+    new_df = new_df.dropna(subset=['날짜'])
+    new_df['평당가'] = new_df['분양가격'] * 3.3
+    return new_df
+
+
+def make_messy_frame(n, seed=0):
+    """콤마/단위/공백/결측/잘못된 월이 섞인 원본 형식의 데이터"""
+    rng = np.random.default_rng(seed)
+    price = rng.integers(2000, 15000, n).astype(object)
+    messy = rng.random(n)
+    price[messy < 0.05] = [f'{p:,}원' for p in price[messy < 0.05]]
+    price[(messy >= 0.05) & (messy < 0.07)] = ' - '
+    price[(messy >= 0.07) & (messy < 0.08)] = np.nan
+    price[(messy >= 0.08) & (messy < 0.09)] = '1.2.3'
+    month = rng.integers(1, 14, n).astype(object)
+    month[rng.random(n) < 0.01] = ''
+    return pd.DataFrame({
+        '지역명': rng.choice(['서울', '부산', '전남'], n),
+        '규모구분': rng.choice(['모든면적', '전용면적 60제곱미터이하'], n),
+        '연도': rng.integers(2015, 2026, n),
+        '월': month,
+        '분양가격(제곱미터)': price,
+    })
+
+
+def check_identical(raw):
+    expected = compact_frame(legacy_normalize(raw.copy()))
+    actual, err = normalize_frame(raw.copy())
+    assert err is None, err
+    assert not schema_errors(actual), schema_errors(actual)
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    sample, _ = read_csv_auto(os.path.join(ROOT, '한국부동산 가격 데이터.csv'))
+    check_identical(sample)
+    print("한국부동산 가격 데이터.csv: 기존 구현과 결과 동일")
+
+    print(f"{'rows':>10} {'row-wise(s)':>12} {'vectorized(s)':>14} {'speedup':>8} "
+          f"{'object(MB)':>11} {'compact(MB)':>12}")
+    for n in SIZES:
+        raw = make_messy_frame(n)
+        check_identical(raw)
+        t_old = timed(legacy_normalize, raw.copy())
+        t_new = timed(normalize_frame, raw.copy())
+        old_mb = frame_mb(legacy_normalize(raw.copy()))
+        new_mb = frame_mb(normalize_frame(raw.copy())[0])
+        print(f"{n:>10,} {t_old:>12.3f} {t_new:>14.3f} {t_old / t_new:>7.1f}x "
+              f"{old_mb:>11.1f} {new_mb:>12.1f}")
@@ -0,0 +1,78 @@
+"""스트리밍(청크) 로드 벤치마크: 전체 읽기 경로 vs chunksize 경로의 최대 메모리(RSS)와 시간
+
+모드마다 별도 프로세스에서 load_price_data를 실행해 최대 RSS를 비교하고,
+두 경로의 결과가 같은지 확인한다.
+실행: python benchmarks/bench_budongsan_streaming.py [행 수 ...]
+"""
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_budongsan_normalize import make_messy_frame
+from budongsan_core import load_price_data, schema_errors
+
+SIZES = [1_000_000, 3_000_000]
+CHUNKSIZE = 50_000
+
+
+def peak_rss_mb():
+    # ru_maxrss는 fork 시점의 부모 값을 물려받으므로 exec 후 새로 시작되는 VmHWM을 사용
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith('VmHWM:'):
+                return int(line.split()[1]) / 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def child(path, chunksize):
+    """하위 프로세스: 임포트 직후 RSS와 로드 후 최대 RSS, 소요 시간 출력"""
+    base = peak_rss_mb()
+    start = time.perf_counter()
+    df, err = load_price_data(path, use_cache=False, chunksize=chunksize)
+    elapsed = time.perf_counter() - start
+    assert err is None, err
+    result_mb = df.memory_usage(deep=True).sum() / 2**20
+    print(base, peak_rss_mb(), elapsed, result_mb)
+
+
+def measure(path, chunksize):
+    out = subprocess.run([sys.executable, __file__, '--child', path, str(chunksize)],
+                         check=True, capture_output=True, text=True).stdout
+    return [float(v) for v in out.split()]
+
+
+def check_same(path):
+    full, _ = load_price_data(path, use_cache=False, chunksize=0)
+    streamed, _ = load_price_data(path, use_cache=False, chunksize=CHUNKSIZE // 7)
+    assert not schema_errors(full) and not schema_errors(streamed)
+    pd.testing.assert_frame_equal(full, streamed)
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['--child']:
+        child(sys.argv[2], int(sys.argv[3]))
+        sys.exit()
+
+    sizes = [int(n) for n in sys.argv[1:]] or SIZES
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'rows':>10} {'file(MB)':>9} {'mode':>7} {'peak RSS(MB)':>13} {'+load(MB)':>10} "
+              f"{'result(MB)':>11} {'time(s)':>8}")
+        for n in sizes:
+            path = os.path.join(tmp, f'prices_{n}.csv')
+            make_messy_frame(n).to_csv(path, index=False, encoding='cp949')
+            if n == sizes[0]:
+                check_same(path)
+            file_mb = os.path.getsize(path) / 2**20
+            for mode, chunksize in [('full', 0), ('stream', CHUNKSIZE)]:
+                base, peak, elapsed, result_mb = measure(path, chunksize)
+                print(f"{n:>10,} {file_mb:>9.1f} {mode:>7} {peak:>13.1f} {peak - base:>10.1f} "
+                      f"{result_mb:>11.1f} {elapsed:>8.2f}")
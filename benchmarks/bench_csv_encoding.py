@@ -0,0 +1,63 @@
+"""인코딩 판별 벤치마크: 기존 순차 시도 루프 vs csv_loader.read_csv_auto
+
+한국부동산 가격 데이터와 같은 형식의 대용량 CSV를 인코딩별로 만들어 비교한다.
+실행: python benchmarks/bench_csv_encoding.py [행 수]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from csv_loader import read_csv_auto
+
+REGIONS = ['서울', '인천', '경기', '부산', '대구', '광주', '대전', '울산', '세종',
+           '강원', '충북', '충남', '전북', '전남', '경북', '경남', '제주']
+SIZES = ['모든면적', '전용면적 60제곱미터이하', '전용면적 60제곱미터초과 85제곱미터이하',
+         '전용면적 85제곱미터초과 102제곱미터이하', '전용면적 102제곱미터초과']
+
+
+def make_price_csv(path, n, encoding, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        '지역명': rng.choice(REGIONS, n),
+        '규모구분': rng.choice(SIZES, n),
+        '연도': rng.integers(2015, 2026, n),
+        '월': rng.integers(1, 13, n),
+        '분양가격(제곱미터)': rng.integers(2000, 15000, n),
+    })
+    df.to_csv(path, index=False, encoding=encoding)
+
+
+def legacy_read(path):
+    """기존 load_data_robust의 순차 시도 루프"""
+    for enc in ['utf-8-sig', 'cp949', 'utf-8', 'euc-kr']:
+        try:
+            return pd.read_csv(path, encoding=enc), enc
+        except:
+            continue
+    return None, None
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'encoding':>10} {'MB':>7} {'legacy(s)':>10} {'auto(s)':>9} {'chosen':>10}")
+        for encoding in ['utf-8-sig', 'utf-8', 'cp949']:
+            path = os.path.join(tmp, f'price_{encoding}.csv')
+            make_price_csv(path, n, encoding)
+            size_mb = os.path.getsize(path) / 1e6
+            t_old, (old_df, _) = timed(legacy_read, path)
+            t_new, (new_df, chosen) = timed(read_csv_auto, path)
+            pd.testing.assert_frame_equal(old_df, new_df)
+            print(f"{encoding:>10} {size_mb:>7.1f} {t_old:>10.3f} {t_new:>9.3f} {chosen:>10}")
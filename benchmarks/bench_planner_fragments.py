@@ -0,0 +1,97 @@
+"""플래너 상호작용 지연 벤치마크: 전체 스크립트 실행 vs 사분면 프래그먼트만 다시 실행
+
+사분면마다 할 일 N개가 있는 SQLite 저장소로 앱을 띄운 뒤, Q2의 미완료 할 일을 하나씩 체크할 때의
+지연(프래그먼트 실행)을 페이지 전체 실행과 비교한다. streamlit AppTest로 측정한다.
+측정 전에 전체 실행 없이 프래그먼트 상호작용을 연달아 해도 예외가 없는지 먼저 확인한다.
+실행: python benchmarks/bench_planner_fragments.py [사분면당 할 일 수 ...]
+"""
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+DB_DIR = tempfile.mkdtemp()
+# 앱이 불러오기 전에 저장소 위치를 정해야 함
+os.environ['TASK_STORE_BACKEND'] = 'sqlite'
+os.environ['TASK_DB_DIR'] = DB_DIR
+
+from streamlit.testing.v1 import AppTest
+
+from task_store import SQLiteStore, create_task
+
+SIZES = [25, 100, 250, 1000]
+APPS = {'hausenhour.py': 'hausen', 'Hausen Hour.py': 'eisenhower_matrix_pro'}
+REPEAT = 5
+# 앱은 URL의 owner 값으로 사용자를 구분하므로 미리 채운 저장소와 같은 값으로 띄움
+OWNER = 'bench'
+
+
+def fill_store(name, per_quadrant):
+    """사분면마다 오늘 날짜 할 일 per_quadrant개를 넣고 체크할 Q2 할 일 id 목록 반환"""
+    store = SQLiteStore(os.path.join(DB_DIR, f"{name}.sqlite3"), OWNER)
+    store.clear()
+    for q in range(1, 5):
+        for i in range(per_quadrant):
+            store.add(create_task(f"Q{q} 할 일 {i}", q, date.today()))
+    return [t['id'] for t in store.load(quadrant=2)[:REPEAT]]
+
+
+def open_app(script):
+    at = AppTest.from_file(os.path.join(ROOT, script), default_timeout=120)
+    at.query_params['owner'] = OWNER
+    return at.run()
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def measure(script, per_quadrant):
+    """(전체 실행 초, Q2 체크 초, 체크 중 전체 실행 횟수 증가분)"""
+    task_ids = fill_store(APPS[script], per_quadrant)
+    at = open_app(script)
+    full, partial, runs = [], [], 0
+    # 체크한 할 일은 접힌 완료 그룹으로 옮겨지므로 매번 다른 할 일을 체크
+    for task_id in task_ids:
+        full.append(timed(at.run))
+        before = at.session_state['run_count']
+        box = at.checkbox(key=f"chk_{task_id}")
+        partial.append(timed(lambda: box.check().run()))
+        runs += at.session_state['run_count'] - before
+        assert not at.exception, [e.value for e in at.exception]
+    return statistics.median(full), statistics.median(partial), runs
+
+
+def check_consecutive(script, per_quadrant=30):
+    """전체 실행 없이 프래그먼트 상호작용을 연달아 해도 예외가 없고 새 할 일이 선택 날짜에 저장되는지 확인"""
+    task_ids = fill_store(APPS[script], per_quadrant)
+    at = open_app(script)
+    target = date.today() + timedelta(days=3)
+    at.date_input(key='selected_date').set_value(target).run()
+    for task_id in task_ids:
+        at.checkbox(key=f"chk_{task_id}").check().run()
+        assert not at.exception, (script, [e.value for e in at.exception])
+    at.text_input(key='in_2').input('연속 상호작용')
+    at.button(key='btn_2').click().run()
+    assert not at.exception, (script, [e.value for e in at.exception])
+    store = SQLiteStore(os.path.join(DB_DIR, f"{APPS[script]}.sqlite3"), OWNER)
+    assert [t['date'] for t in store.load(quadrant=2) if t['text'] == '연속 상호작용'] == [str(target)]
+
+
+if __name__ == '__main__':
+    logging.disable(logging.WARNING)
+    for script in APPS:
+        check_consecutive(script)
+    sizes = [int(a) for a in sys.argv[1:]] or SIZES
+    print(f"{'app':<16} {'tasks/Q':>8} {'full(s)':>9} {'Q2 check(s)':>13} {'speedup':>8} {'full runs':>10}")
+    for script in APPS:
+        for n in sizes:
+            t_full, t_frag, runs = measure(script, n)
+            print(f"{script:<16} {n:>8,} {t_full:>9.3f} {t_frag:>12.3f} {t_full / t_frag:>7.1f}x {runs:>10}")
@@ -0,0 +1,81 @@
+"""공유 데이터셋 벤치마크: st.cache_data(호출마다 역직렬화 복사) vs st.cache_resource(같은 객체 공유)
+
+세션 수만큼 캐시된 로더를 호출해 결과를 붙잡아 두고, 호출당 시간과 늘어난 RSS를 비교한다.
+공유 프레임을 세션 쪽에서 수정해도 원본이 바뀌지 않는지(Copy-on-Write)도 확인한다.
+실행: python benchmarks/bench_shared_dataset.py [행 수]
+"""
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+ROWS = 1_000_000
+SESSIONS = [1, 10, 50]
+
+
+def rss_mb():
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def child(mode, path, sessions):
+    """하위 프로세스: 첫 로드 후 sessions번 더 호출하며 결과를 유지했을 때의 RSS 증가량"""
+    import streamlit as st
+    from budongsan_core import load_price_data
+    from shared_frame import enable_copy_on_write, frame_mb, session_view
+
+    # 런타임 없이 캐시 데코레이터를 쓸 때 나오는 경고 숨김
+    logging.getLogger('streamlit').setLevel(logging.ERROR)
+    enable_copy_on_write()
+    decorator = st.cache_data if mode == 'data' else st.cache_resource
+
+    @decorator
+    def load(source):
+        return load_price_data(source, use_cache=False)
+
+    df, err = load(path)
+    assert err is None, err
+    base = rss_mb()
+    start = time.perf_counter()
+    held = [session_view(load(path)[0]) for _ in range(sessions)]
+    per_call = (time.perf_counter() - start) / sessions
+
+    # 세션 쪽 수정은 자기 복사본에만 적용되어야 함
+    view = held[-1]
+    before = float(load(path)[0]['평당가'].iloc[0])
+    view.loc[view.index[0], '평당가'] = -1.0
+    assert float(load(path)[0]['평당가'].iloc[0]) == before
+    print(frame_mb(df), rss_mb() - base, per_call * 1000)
+
+
+def measure(mode, path, sessions):
+    out = subprocess.run([sys.executable, __file__, '--child', mode, path, str(sessions)],
+                         check=True, capture_output=True, text=True).stdout
+    return [float(v) for v in out.split()]
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['--child']:
+        child(sys.argv[2], sys.argv[3], int(sys.argv[4]))
+        sys.exit()
+
+    from bench_budongsan_normalize import make_messy_frame
+
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else ROWS
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'prices.csv')
+        make_messy_frame(rows).to_csv(path, index=False)
+        print(f"{'sessions':>8} {'mode':>15} {'frame(MB)':>10} {'+RSS(MB)':>9} {'per call(ms)':>13}")
+        for sessions in SESSIONS:
+            for mode, label in [('data', 'cache_data'), ('resource', 'cache_resource')]:
+                frame, grown, per_call = measure(mode, path, sessions)
+                print(f"{sessions:>8} {label:>15} {frame:>10.1f} {grown:>9.1f} {per_call:>13.2f}")
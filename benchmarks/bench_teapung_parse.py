@@ -0,0 +1,48 @@
+"""전국(전남) 피해 컬럼 파싱 벤치마크: 기존 parse_val apply vs 벡터화 추출
+
+실행: python benchmarks/bench_teapung_parse.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from teapung_core import parse_val, parse_damage_column
+
+SIZES = [10_000, 100_000, 1_000_000]
+
+
+def make_column(n, seed=0):
+    """'1,385(0.04)' 형태의 셀을 n개 생성 (결측/괄호 없는 값 일부 포함)"""
+    rng = np.random.default_rng(seed)
+    national = rng.integers(0, 20000, n)
+    jeonnam = np.round(rng.random(n) * national, 2)
+    cells = pd.Series([f'{a:,}({b:g})' for a, b in zip(national, jeonnam)], dtype=object)
+    cells[rng.random(n) < 0.01] = np.nan
+    cells[rng.random(n) < 0.01] = '-'
+    return cells
+
+
+def legacy(col):
+    return col.apply(lambda x: parse_val(x, 'national')), col.apply(lambda x: parse_val(x, 'jeonnam'))
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+if __name__ == '__main__':
+    print(f"{'rows':>10} {'parse_val(s)':>14} {'vectorized(s)':>14} {'speedup':>8}")
+    for n in SIZES:
+        col = make_column(n)
+        t_old, (old_nat, old_jn) = timed(legacy, col)
+        t_new, (new_nat, new_jn) = timed(parse_damage_column, col)
+        assert np.array_equal(old_nat.to_numpy(), new_nat.to_numpy())
+        assert np.array_equal(old_jn.to_numpy(), new_jn.to_numpy())
+        print(f"{n:>10,} {t_old:>14.3f} {t_new:>14.3f} {t_old / t_new:>7.1f}x")
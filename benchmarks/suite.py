@@ -0,0 +1,297 @@
+"""전체 벤치마크 모음: 두 CSV 형식의 합성 데이터를 1x / 100x / 10,000x 규모로 만들어
+로더, 지역/규모 필터, 추세 예측, 할 일 인덱스와 SQLite 할 일 저장소 연산 시간을 재고 JSON 기록에 누적한다.
+
+직전 실행 기록과 비교해 threshold배 이상 느려진 항목은 REGRESSION으로 표시한다.
+실행: python benchmarks/suite.py [--scales 1 100 10000] [--only price] [--history 경로] [--check]
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import closing
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from budongsan_core import build_series_index, load_price_data, time_index
+from budongsan_forecast import forecast_all
+from csv_loader import read_csv_auto
+from task_store import TASK_COLUMNS, TASK_FIELDS, SQLiteStore, TaskIndex, create_task, period_bounds
+from teapung_core import TARGET_COLS, add_damage_columns
+
+SCALES = [1, 100, 10_000]
+HISTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'history.json')
+# 원본 파일 행 수 (1x 기준)
+TYPHOON_ROWS = 23
+PRICE_ROWS = 500
+# 할 일은 1x = 100개 (100x에서 1만 개, 10,000x에서 100만 개)
+TASK_ROWS = 100
+# SQLite 저장소는 사용자당 이 행 수까지만 채움 (10,000x에서도 채우는 시간을 제한)
+SQLITE_MAX_ROWS = 200_000
+# 앱이 사분면에 한 번에 그리는 할 일 수
+PAGE_SIZE = 20
+# 한 항목을 반복 측정하는 최소 시간 / 최대 횟수
+MIN_TIME = 0.2
+MAX_RUNS = 5
+# 이보다 짧은 항목은 측정 잡음이 커서 REGRESSION 판정에서 제외
+NOISE_FLOOR_S = 0.001
+
+REGIONS = ['서울', '인천', '경기', '부산', '대구', '광주', '대전', '울산', '세종',
+           '강원', '충북', '충남', '전북', '전남', '경북', '경남', '제주']
+SIZES = ['모든면적', '전용면적 60제곱미터이하', '전용면적 60제곱미터초과 85제곱미터이하',
+         '전용면적 85제곱미터초과 102제곱미터이하', '전용면적 102제곱미터초과']
+
+
+def make_typhoon_csv(path, rows, seed=0):
+    """전라남도_연도별 태풍피해 현황 형식 (cp949, '전국(전남)' 문자열 셀)"""
+    rng = np.random.default_rng(seed)
+    years = np.sort(rng.integers(2005, 2026, rows))
+
+    def cells(high):
+        national = rng.integers(0, high, rows)
+        jeonnam = np.round(rng.random(rows) * national, 2)
+        return [f'{a:,}({b:g})' for a, b in zip(national, jeonnam)]
+
+    df = pd.DataFrame({
+        '연도': years,
+        '태풍명': [f'태풍{i}' for i in range(rows)],
+        '발생기간': [f'{y}-09-06~{y}-09-18' for y in years],
+        TARGET_COLS['인명']: cells(50),
+        TARGET_COLS['재산']: cells(20000),
+        TARGET_COLS['복구']: cells(40000),
+    })
+    df.to_csv(path, index=False, encoding='cp949')
+
+
+def make_price_csv(path, rows, seed=0):
+    """한국부동산 가격 데이터 형식 (utf-8-sig, 분양가격은 콤마/공백/결측이 섞인 문자열)"""
+    rng = np.random.default_rng(seed)
+    price = rng.integers(2000, 15000, rows).astype(object)
+    messy = rng.random(rows)
+    price[messy < 0.05] = [f'{p:,}' for p in price[messy < 0.05]]
+    price[(messy >= 0.05) & (messy < 0.07)] = ' '
+    df = pd.DataFrame({
+        '지역명': rng.choice(REGIONS, rows),
+        '규모구분': rng.choice(SIZES, rows),
+        '연도': rng.integers(2015, 2026, rows),
+        '월': rng.integers(1, 13, rows),
+        '분양가격(제곱미터)': price,
+    })
+    df.to_csv(path, index=False, encoding='utf-8-sig')
+
+
+def make_tasks(n, seed=0, days=90, done=0.33):
+    """days일에 걸쳐 분포한 할 일 n개 (done 비율만큼 완료)"""
+    rng = random.Random(seed)
+    today = date.today()
+    tasks = []
+    for i in range(n):
+        task = create_task(f"할 일 {i}", rng.randint(1, 4), today - timedelta(days=rng.randint(0, days - 1)))
+        task['completed'] = rng.random() < done
+        tasks.append(task)
+    return tasks
+
+
+def load_typhoon(path):
+    """teapungapp.load_data와 같은 경로 (인코딩 판별 + 한 번 파싱 + 벡터화 추출)"""
+    df, encoding = read_csv_auto(path)
+    df.attrs['encoding'] = encoding
+    return add_damage_columns(df)
+
+
+def polyfit_one(df, region, size):
+    """벡터화 이전 앱의 선택 시계열 하나에 대한 np.polyfit 예측"""
+    filtered = df[(df['지역명'] == region) & (df['규모구분'] == size)]
+    slope, intercept = np.polyfit(time_index(filtered), filtered['평당가'].to_numpy(dtype='float64'), 1)
+    return intercept + slope * 2026
+
+
+def typhoon_cases(tmp, scale):
+    path = os.path.join(tmp, f'typhoon_{scale}.csv')
+    make_typhoon_csv(path, TYPHOON_ROWS * scale)
+    return {'typhoon.load_data': (TYPHOON_ROWS * scale, lambda: load_typhoon(path))}
+
+
+def price_cases(tmp, scale):
+    rows = PRICE_ROWS * scale
+    path = os.path.join(tmp, f'price_{scale}.csv')
+    make_price_csv(path, rows)
+    cache_dir = os.path.join(tmp, 'cache')
+    df, err = load_price_data(path, cache_dir=cache_dir)
+    assert err is None, err
+    index = build_series_index(df)
+    return {
+        'price.load_data_robust': (rows, lambda: load_price_data(path, use_cache=False)),
+        'price.load_data_robust_cached': (rows, lambda: load_price_data(path, cache_dir=cache_dir)),
+        'price.filter_mask': (rows, lambda: df[(df['지역명'] == '전남') & (df['규모구분'] == '모든면적')]),
+        'price.filter_index': (rows, lambda: index['groups'].get(('전남', '모든면적'))),
+        'price.polyfit_one': (rows, lambda: polyfit_one(df, '전남', '모든면적')),
+        'price.forecast_all': (rows, lambda: forecast_all(df)),
+    }
+
+
+def task_cases(tmp, scale):
+    n = TASK_ROWS * scale
+    tasks = make_tasks(n)
+    index = TaskIndex(tasks)
+    # 3년치 기록 대부분이 완료된 목록 (이월 조회가 완료된 과거 할 일을 건너뛰는지 확인)
+    history = TaskIndex(make_tasks(n, days=1095, done=0.99))
+    ids = [t['id'] for t in random.Random(1).sample(tasks, min(n, 1000))]
+    today = date.today()
+
+    def toggle():
+        for task_id in ids:
+            index.set_completed(task_id, not index.get(task_id)['completed'])
+
+    return {
+        'tasks.add': (n, lambda: TaskIndex(tasks)),
+        'tasks.toggle_1000': (n, toggle),
+        'tasks.stats': (n, lambda: (index.stats(), index.stats(today))),
+        'tasks.visible': (n, lambda: index.visible(today)),
+        'tasks.visible_quadrant': (n, lambda: index.visible(today, 2)),
+        'tasks.visible_history': (n, lambda: history.visible(today)),
+        'tasks.open_quarter': (n, lambda: index.open_between(*period_bounds(today, 'quarter'))),
+        'tasks.in_range_month': (n, lambda: index.in_range(*period_bounds(today, 'month'))),
+        'tasks.range_stats_quarter': (n, lambda: index.range_stats(*period_bounds(today, 'quarter'))),
+        'tasks.daily_stats_year': (n, lambda: index.daily_stats(*period_bounds(today, 'year'))),
+        'tasks.in_quadrant': (n, lambda: [index.in_quadrant(q) for q in range(1, 5)]),
+    }
+
+
+def fill_sqlite(path, owner, tasks):
+    """SQLiteStore.add와 같은 INSERT를 한 트랜잭션으로 실행 (트리거가 task_days도 함께 채움)"""
+    SQLiteStore(path, owner)
+    rows = [[int(t[f]) if f == 'completed' else t[f] for f in TASK_FIELDS] + [owner] for t in tasks]
+    with closing(sqlite3.connect(path)) as conn, conn:
+        conn.executemany(f"INSERT INTO tasks ({TASK_COLUMNS}, owner) VALUES ({', '.join('?' * (len(TASK_FIELDS) + 1))})",
+                         rows)
+
+
+def task_sqlite_cases(tmp, scale):
+    """플래너 기본 저장소(SQLiteStore) 경로: 다른 사용자 행이 같은 수만큼 섞인 임시 DB"""
+    n = min(TASK_ROWS * scale, SQLITE_MAX_ROWS)
+    path = os.path.join(tmp, f'tasks_{scale}.sqlite3')
+    tasks = make_tasks(n)
+    fill_sqlite(path, 'bench', tasks)
+    fill_sqlite(path, 'other', make_tasks(n, seed=1))
+    store = SQLiteStore(path, 'bench')
+    sample = random.Random(1).sample(tasks, min(n, 100))
+    completed = {t['id']: t['completed'] for t in sample}
+    today = date.today()
+
+    def add():
+        for i in range(100):
+            store.add(create_task(f"새 할 일 {i}", i % 4 + 1, today))
+
+    def toggle():
+        for task_id, done in completed.items():
+            completed[task_id] = not done
+            store.set_completed(task_id, not done)
+
+    return {
+        'tasks_sqlite.add_100': (n, add),
+        'tasks_sqlite.toggle_100': (n, toggle),
+        'tasks_sqlite.load_visible_quadrant': (n, lambda: store.load(today, 2, limit=PAGE_SIZE)),
+        'tasks_sqlite.load_quadrant_window': (n, lambda: store.load(quadrant=2, limit=PAGE_SIZE)),
+        'tasks_sqlite.day_stats_year': (n, lambda: store.day_stats(*period_bounds(today, 'year'))),
+        'tasks_sqlite.range_stats_quarter': (n, lambda: store.range_stats(*period_bounds(today, 'quarter'))),
+        'tasks_sqlite.range_stats_all': (n, lambda: store.range_stats(date.min, date.max)),
+    }
+
+
+GROUPS = {'typhoon': typhoon_cases, 'price': price_cases, 'tasks': task_cases, 'tasks_sqlite': task_sqlite_cases}
+
+
+def measure(fn):
+    """MIN_TIME을 채우거나 MAX_RUNS에 도달할 때까지 반복 측정"""
+    times = []
+    while len(times) < MAX_RUNS and sum(times) < MIN_TIME:
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return {'min_s': min(times), 'median_s': statistics.median(times), 'runs': len(times)}
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def read_history(path):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return []
+
+
+def previous_result(history, case, scale):
+    """같은 항목/규모의 가장 최근 기록"""
+    for run in reversed(history):
+        result = run['results'].get(case, {}).get(str(scale))
+        if result:
+            return result
+    return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="합성 데이터 벤치마크 모음")
+    parser.add_argument('--scales', type=int, nargs='+', default=SCALES)
+    parser.add_argument('--only', nargs='+', choices=sorted(GROUPS), default=sorted(GROUPS))
+    parser.add_argument('--history', default=HISTORY, help="결과를 누적할 JSON 파일")
+    parser.add_argument('--threshold', type=float, default=1.25, help="이 배수 이상 느려지면 REGRESSION 표시")
+    parser.add_argument('--check', action='store_true', help="REGRESSION이 있으면 종료 코드 1")
+    args = parser.parse_args(argv)
+
+    history = read_history(args.history)
+    results, regressions = {}, []
+    print(f"{'case':<36} {'scale':>7} {'rows':>10} {'min(s)':>10} {'prev(s)':>10} {'ratio':>7}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for group in args.only:
+            for scale in args.scales:
+                for case, (rows, fn) in GROUPS[group](tmp, scale).items():
+                    result = measure(fn)
+                    result['rows'] = rows
+                    results.setdefault(case, {})[str(scale)] = result
+                    prev = previous_result(history, case, scale)
+                    prev_s, ratio_s, flag = '-', '-', ''
+                    if prev and prev['min_s'] > 0:
+                        ratio = result['min_s'] / prev['min_s']
+                        prev_s, ratio_s = f"{prev['min_s']:.4f}", f"{ratio:.2f}x"
+                        if ratio >= args.threshold and result['min_s'] >= NOISE_FLOOR_S:
+                            flag = ' REGRESSION'
+                            regressions.append((case, scale, ratio))
+                    print(f"{case:<36} {scale:>7,} {rows:>10,} {result['min_s']:>10.4f} {prev_s:>10} "
+                          f"{ratio_s:>7}{flag}")
+
+    history.append({
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'machine': platform.machine(),
+        'results': results,
+    })
+    with open(args.history, 'w', encoding='utf-8') as f:
+        json.dump(history, f, ensure_ascii=False, indent=1)
+    print(f"기록 저장: {args.history} (총 {len(history)}회)")
+    return 1 if args.check and regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,95 +1,97 @@
 import streamlit as st
-import pandas as pd
 import numpy as np
 import plotly.express as px
 import os
-import re
+import threading
+
+from budongsan_core import build_series_index, load_price_data
+from budongsan_forecast import forecast_all
+from budongsan_ingest import resolve_sources, source_signature
+from budongsan_store import sync_store
+from fig_cache import FigureCache, dataset_hash
+from shared_frame import enable_copy_on_write, session_view
 
 # 1. 페이지 설정 (가장 먼저 실행되어야 함)
 st.set_page_config(page_title="부동산 가격 예측기", layout="wide", page_icon="🏠")
 
-def clean_value(val):
-    """문자열에서 숫자와 소수점만 추출하는 안전한 함수"""
-    if pd.isna(val) or val == '': return np.nan
-    s = str(val).strip()
-    # 숫자와 마침표(.)를 제외한 모든 문자 제거 (콤마, 한글 등)
-    s = re.sub(r'[^0-9.]', '', s)
-    if s == '' or s == '.': return np.nan
-    try:
-        return float(s)
-    except:
-        return np.nan
-
-@st.cache_data
-def load_data_robust(file_source):
-    """모든 인코딩 및 컬럼 형식을 지원하는 강력한 데이터 로더"""
-    try:
-        df = None
-        # 인코딩 순차 시도
-        encodings = ['utf-8-sig', 'cp949', 'utf-8', 'euc-kr']
-        for enc in encodings:
-            try:
-                if isinstance(file_source, str):
-                    df = pd.read_csv(file_source, encoding=enc)
-                else:
-                    file_source.seek(0)
-                    df = pd.read_csv(file_source, encoding=enc)
-                if df is not None: break
-            except:
-                continue
-        
-        if df is None:
-            return None, "파일 내용을 읽을 수 없습니다. 인코딩이나 파일 형식을 확인해주세요."
+# 차트 템플릿 (figure 캐시 키에 포함)
+THEME = "plotly_white"
 
-        # 컬럼명 정리
-        df.columns = [str(col).strip() for col in df.columns]
-        
-        # 데이터 매핑
-        new_df = pd.DataFrame()
-        
-        # 컬럼 검색 패턴
-        col_patterns = {
-            '지역명': ['지역', '시도', 'city'],
-            '규모구분': ['규모', '면적', 'size'],
-            '연도': ['연도', 'year'],
-            '월': ['월', 'month'],
-            '분양가격': ['분양가격', '가격', 'price']
-        }
-        
-        found_mapping = {}
-        for key, patterns in col_patterns.items():
-            for col in df.columns:
-                if any(p in col for p in patterns):
-                    found_mapping[key] = col
-                    break
-        
-        # 필수 컬럼 체크
-        if len(found_mapping) < 4:
-            return None, f"필수 컬럼을 찾을 수 없습니다. (인식된 컬럼: {list(df.columns)})"
-
-        new_df['지역명'] = df[found_mapping['지역명']].astype(str)
-        new_df['규모구분'] = df[found_mapping['규모구분']].astype(str)
-        new_df['연도'] = pd.to_numeric(df[found_mapping['연도']], errors='coerce')
-        new_df['월'] = pd.to_numeric(df[found_mapping['월']], errors='coerce')
-        new_df['분양가격'] = df[found_mapping['분양가격']].apply(clean_value)
-
-        # 데이터 청소
-        new_df = new_df.dropna(subset=['연도', '월', '분양가격'])
-        
-        def safe_date(row):
-            try:
-                return pd.Timestamp(year=int(row['연도']), month=int(row['월']), day=1)
-            except:
-                return pd.NaT
-
-        new_df['날짜'] = new_df.apply(safe_date, axis=1)
-        new_df = new_df.dropna(subset=['날짜'])
-        new_df['평당가'] = new_df['분양가격'] * 3.3
-        
-        return new_df, None
+# 세션 간 공유하는 데이터셋/조회 인덱스/예측표 캐시의 항목 수 상한 (BUDONGSAN_CACHE_ENTRIES로 설정)
+# 파일이 추가/변경될 때마다 새 항목이 생기므로 상한을 넘으면 오래 쓰이지 않은 것부터 제거
+DATASET_CACHE_ENTRIES = int(os.environ.get('BUDONGSAN_CACHE_ENTRIES', '4'))
+
+# 로드한 프레임과 예측표는 모든 세션이 같은 객체를 공유하므로 수정 시 복사되도록 Copy-on-Write 사용
+enable_copy_on_write()
 
-    except Exception as e:
-        return None, f"전처리 중 오류 발생: {str(e)}"
+@st.cache_resource
+def get_price_stores():
+    """폴더/패턴별 추가 전용 저장소 {패턴: PriceStore} (세션 간 공유)"""
+    return {'lock': threading.Lock(), 'stores': {}}
+
+def sync_price_store(file_source):
+    """(패턴, 파일 서명) 기준으로 저장소 갱신 (새 파일만 추가로 읽고 예측 통계량을 누적 갱신)"""
+    pattern, signature = file_source
+    holder = get_price_stores()
+    with holder['lock']:
+        store, _ = sync_store(holder['stores'].get(pattern), [path for path, _, _ in signature])
+        holder['stores'][pattern] = store
+    return store
+
+@st.cache_resource(max_entries=DATASET_CACHE_ENTRIES)
+def load_data_robust(file_source):
+    """모든 인코딩 및 컬럼 형식을 지원하는 강력한 데이터 로더 (내용 해시 기반 Feather 캐시 사용,
+    BUDONGSAN_CHUNKSIZE 설정 시 청크 단위 스트리밍 로드). 세션 간 공유, 읽기 전용
+
+    file_source가 (패턴, 파일 서명) 튜플이면 폴더 모드 저장소에서 읽는다.
+    파일이 추가/변경되면 서명이 바뀌어 다시 로드되며, 새 파일만 추가로 읽는다."""
+    if isinstance(file_source, tuple):
+        try:
+            return sync_price_store(file_source).frame(), None
+        except ValueError as e:
+            return None, str(e)
+    return load_price_data(file_source)
+
+@st.cache_resource(max_entries=DATASET_CACHE_ENTRIES)
+def load_series_index(file_source):
+    """(지역명, 규모구분)별 정렬된 슬라이스 인덱스 (세션 간 공유, 읽기 전용)"""
+    df, err = load_data_robust(file_source)
+    if err:
+        return None
+    return build_series_index(df)
+
+@st.cache_resource(max_entries=DATASET_CACHE_ENTRIES)
+def load_forecasts(file_source):
+    """전체 (지역명, 규모구분) 조합의 2026 예측표 (한 번에 계산 후 세션 간 공유, 읽기 전용)"""
+    df, err = load_data_robust(file_source)
+    if err:
+        return None
+    if isinstance(file_source, tuple):
+        # 폴더 모드는 저장소에 누적된 충분통계량으로 계산 (원본 행을 다시 보지 않음)
+        return sync_price_store(file_source).forecasts()
+    return forecast_all(df)
+
+@st.cache_resource
+def get_figure_cache():
+    """전체 세션이 공유하는 차트 JSON LRU 캐시 (FIG_CACHE_MAX_MB로 용량 설정)"""
+    return FigureCache()
+
+def trend_figure(filtered):
+    fig = px.line(filtered, x='날짜', y='평당가', markers=True,
+                  labels={'평당가': '평당가(만원)', '날짜': '조사시점'},
+                  template=THEME)
+    return fig
+
+def forecast_figure(filtered, fc):
+    # 예측 선 그래프
+    p = np.poly1d([fc['slope'], fc['intercept']])
+    future_x = np.linspace(filtered['time_idx'].min(), 2026, 50)
+    future_y = p(future_x)
+    fig_p = px.scatter(filtered, x='time_idx', y='평당가', opacity=0.4, labels={'time_idx': '연도'}, template=THEME)
+    fig_p.add_traces(px.line(x=future_x, y=future_y).data)
+    fig_p.data[1].line.color = 'red'
+    fig_p.data[1].name = '예측 추세선'
+    return fig_p
 
 # --- UI 메인 ---
 st.title("🏠 부동산 지역별 분양가 분석 및 2026 예측")
@@ -100,10 +102,19 @@ csv_files = [f for f in os.listdir('.') if f.endswith('.csv')]
 
 st.sidebar.header("📁 데이터 설정")
 uploaded_file = st.sidebar.file_uploader("CSV 파일 업로드", type=['csv'])
+# 월별로 나뉜 여러 파일을 한 번에 읽기 (폴더 경로 또는 glob 패턴)
+multi_source = st.sidebar.text_input("📂 폴더/패턴으로 여러 파일 읽기",
+                                     value=os.environ.get('BUDONGSAN_DATA_GLOB', ''),
+                                     placeholder="data/ 또는 data/*.csv")
+multi_paths = resolve_sources(multi_source) if multi_source else []
+if multi_source and not multi_paths:
+    st.sidebar.warning("해당 경로에서 CSV 파일을 찾지 못했습니다.")
 
 target = None
 if uploaded_file:
     target = uploaded_file
+elif multi_paths:
+    target = (multi_source, source_signature(multi_paths))
 elif os.path.exists(FILE_NAME):
     target = FILE_NAME
 elif csv_files:
@@ -112,67 +123,84 @@ elif csv_files:
 
 if target:
     df, err = load_data_robust(target)
+    # 공유 프레임의 세션용 뷰 (데이터 복사 없음)
+    df = session_view(df)
     
     if err:
         st.error(f"❌ 데이터 로드 실패: {err}")
     else:
-        st.sidebar.success(f"✅ 로드됨: {target if isinstance(target, str) else target.name}")
+        if isinstance(target, tuple):
+            st.sidebar.success(f"✅ 로드됨: 파일 {df.attrs['files']}개 (중복 제거 후 {len(df):,}행)")
+            for name, reason in df.attrs['skipped'].items():
+                st.sidebar.warning(f"건너뜀: {name} ({reason})")
+        else:
+            st.sidebar.success(f"✅ 로드됨: {target if isinstance(target, str) else target.name}")
+        st.sidebar.caption(f"인코딩: {df.attrs.get('encoding', '알 수 없음')}")
         
+        series_index = load_series_index(target)
+
         # 필터 설정
         st.markdown("### 🔍 데이터 필터링")
         c1, c2 = st.columns(2)
         with c1:
-            regions = sorted(df['지역명'].unique())
+            regions = series_index['regions']
             sel_region = st.selectbox("📍 지역 선택", regions)
         with c2:
-            sizes = sorted(df['규모구분'].unique())
+            sizes = series_index['sizes']
             sel_size = st.selectbox("📏 면적 규모 선택", sizes)
 
-        filtered = df[(df['지역명'] == sel_region) & (df['규모구분'] == sel_size)].sort_values('날짜')
+        # 미리 정렬해 둔 슬라이스를 O(1)로 조회 (공유 객체이므로 수정하지 않음)
+        filtered = series_index['groups'].get((sel_region, sel_size), series_index['empty'])
 
         if filtered.empty:
             st.warning("선택한 조건의 데이터가 없습니다. 다른 지역이나 규모를 선택해 주세요.")
         else:
             # 1. 시각화
             st.subheader(f"📈 {sel_region} ({sel_size}) 가격 추이")
-            fig = px.line(filtered, x='날짜', y='평당가', markers=True,
-                          labels={'평당가': '평당가(만원)', '날짜': '조사시점'},
-                          template="plotly_white")
+            fig_cache = get_figure_cache()
+            # (데이터셋 해시, 차트, 선택 조합, 테마) 단위로 차트 JSON 재사용
+            data_key = dataset_hash(df)
+            fig = fig_cache.get_figure(fig_cache.make_key(data_key, 'trend', (sel_region, sel_size), THEME),
+                                       lambda: trend_figure(filtered))
             st.plotly_chart(fig, use_container_width=True)
 
             # 2. 예측
             st.divider()
             st.subheader("🔮 2026년 예측 데이터 (선형 분석)")
             
-            filtered['time_idx'] = filtered['연도'] + (filtered['월'] - 1) / 12
-            x = filtered['time_idx'].values
-            y = filtered['평당가'].values
-
-            if len(x) >= 2:
-                # Numpy를 이용한 1차 회귀
-                z = np.polyfit(x, y, 1)
-                p = np.poly1d(z)
-                pred_2026 = p(2026.0)
-                last_val = y[-1]
+            # 전체 조합을 한 번에 계산해 둔 예측표에서 선택한 조합만 조회
+            forecasts = load_forecasts(target)
+            fc = forecasts.loc[(sel_region, sel_size)]
+
+            if fc['n'] >= 2 and not np.isnan(fc['slope']):
+                # 1차 회귀 (최소제곱 기울기/절편)
+                pred_2026 = fc['pred_2026']
+                last_val = fc['last_val']
                 
                 m1, m2, m3 = st.columns(3)
                 m1.metric("최근 실거래가", f"{last_val:,.0f} 만원")
                 m2.metric("2026년 예상가", f"{max(0, pred_2026):,.0f} 만원")
                 m3.metric("예상 등락률", f"{((pred_2026 - last_val) / last_val) * 100:+.1f}%")
 
-                # 예측 선 그래프
-                future_x = np.linspace(x.min(), 2026, 50)
-                future_y = p(future_x)
-                fig_p = px.scatter(filtered, x='time_idx', y='평당가', opacity=0.4, labels={'time_idx': '연도'})
-                fig_p.add_traces(px.line(x=future_x, y=future_y).data)
-                fig_p.data[1].line.color = 'red'
-                fig_p.data[1].name = '예측 추세선'
+                fig_p = fig_cache.get_figure(fig_cache.make_key(data_key, 'forecast', (sel_region, sel_size), THEME),
+                                             lambda: forecast_figure(filtered, fc))
                 st.plotly_chart(fig_p, use_container_width=True)
             else:
                 st.info("시계열 데이터가 부족하여 2026년 가격 예측을 진행할 수 없습니다.")
 
         with st.expander("📄 데이터 상세 확인"):
             st.dataframe(filtered.drop(columns=['time_idx'], errors='ignore'))
+
+        with st.expander("📊 전체 지역/규모 2026 예측표"):
+            all_forecasts = load_forecasts(target)
+            st.dataframe(all_forecasts)
+            st.download_button("⬇️ CSV 다운로드", all_forecasts.to_csv().encode('utf-8-sig'),
+                               file_name="forecast_2026.csv", mime="text/csv")
+
+        # 차트 캐시 적중/미스 현황
+        fig_stats = get_figure_cache().stats()
+        st.sidebar.caption(f"차트 캐시: 적중 {fig_stats['hits']} · 미스 {fig_stats['misses']} · "
+                           f"{fig_stats['entries']}개 ({fig_stats['bytes'] / 2**20:.1f}/{fig_stats['max_bytes'] / 2**20:.0f}MB)")
 else:
     # 파일이 전혀 없을 때 안내
     st.warning("### ⚠️ 데이터를 찾을 수 없습니다.")
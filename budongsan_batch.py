@@ -0,0 +1,102 @@
+"""Streamlit 없이 분양가 예측표를 만드는 배치 모듈/CLI
+
+사용 예:
+    python budongsan_batch.py data/ -o forecasts.parquet --workers 4
+    python budongsan_batch.py "drops/*.csv" "한국부동산 가격 데이터.csv" -o out.json
+"""
+import argparse
+import os
+import sys
+
+from budongsan_core import CACHE_DIR, load_price_data
+from budongsan_forecast import forecast_all
+from budongsan_ingest import load_price_files, resolve_sources
+
+# 출력 확장자 -> 형식
+FORMATS = {'.csv': 'csv', '.parquet': 'parquet', '.json': 'json'}
+
+
+def expand_sources(sources):
+    """파일/폴더/glob 패턴 목록을 중복 없는 CSV 경로 목록으로 변환"""
+    paths = []
+    for source in sources:
+        found = [os.path.abspath(source)] if os.path.isfile(source) else resolve_sources(source)
+        paths.extend(p for p in found if p not in paths)
+    return paths
+
+
+def forecast_sources(sources, workers=None, cache_dir=CACHE_DIR):
+    """CSV들을 읽어 전체 (지역명, 규모구분) 예측표 반환. (table, 오류 메시지)
+
+    파일이 여러 개면 프로세스 풀로 병렬 파싱하고 (지역명, 규모구분, 연도, 월) 기준으로 중복을 제거한다.
+    """
+    paths = expand_sources(sources)
+    if not paths:
+        return None, "읽을 CSV 파일이 없습니다."
+    if len(paths) == 1:
+        df, err = load_price_data(paths[0], cache_dir=cache_dir)
+    else:
+        df, err = load_price_files(paths, workers=workers, cache_dir=cache_dir)
+    if err:
+        return None, err
+    table = forecast_all(df)
+    table.attrs['files'] = df.attrs.get('files', 1)
+    table.attrs['skipped'] = df.attrs.get('skipped', {})
+    return table, None
+
+
+def output_format(path, fmt=None):
+    """출력 형식 결정 (지정하지 않으면 확장자로 판단)"""
+    fmt = fmt or FORMATS.get(os.path.splitext(path)[1].lower())
+    if fmt is None:
+        raise ValueError(f"출력 형식을 알 수 없습니다: {path} (--format으로 지정)")
+    return fmt
+
+
+def write_forecasts(table, path, fmt=None):
+    """예측표를 CSV/Parquet/JSON으로 저장 (형식을 주지 않으면 확장자로 판단)"""
+    fmt = output_format(path, fmt)
+    out = table.reset_index()
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    if fmt == 'csv':
+        # 엑셀에서 한글이 깨지지 않도록 BOM 포함
+        out.to_csv(path, index=False, encoding='utf-8-sig')
+    elif fmt == 'parquet':
+        out.to_parquet(path, index=False)
+    else:
+        out.to_json(path, orient='records', force_ascii=False, indent=1)
+    return fmt
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="지역/규모별 분양가 추세와 2026 예측표 생성")
+    parser.add_argument('sources', nargs='+', help="CSV 파일, 폴더 또는 glob 패턴")
+    parser.add_argument('-o', '--output', required=True, help="출력 파일 (.csv / .parquet / .json)")
+    parser.add_argument('--format', choices=sorted(set(FORMATS.values())), help="출력 형식 (기본: 확장자로 판단)")
+    parser.add_argument('--workers', type=int, default=None, help="파싱 프로세스 수 (기본: CPU 수)")
+    parser.add_argument('--cache-dir', default=CACHE_DIR, help="정규화 결과 Feather 캐시 폴더")
+    args = parser.parse_args(argv)
+    # 오래 걸리는 파싱 전에 출력 형식부터 확인
+    try:
+        output_format(args.output, args.format)
+    except ValueError as e:
+        parser.error(str(e))
+
+    table, err = forecast_sources(args.sources, workers=args.workers, cache_dir=args.cache_dir)
+    if err:
+        print(f"오류: {err}", file=sys.stderr)
+        return 1
+    for name, reason in table.attrs['skipped'].items():
+        print(f"건너뜀: {name} ({reason})", file=sys.stderr)
+    try:
+        fmt = write_forecasts(table, args.output, args.format)
+    except (ValueError, ImportError, OSError) as e:
+        print(f"오류: {e}", file=sys.stderr)
+        return 1
+    print(f"{table.attrs['files']}개 파일, {len(table)}개 시계열 -> {args.output} ({fmt})")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,300 @@
+import hashlib
+import os
+import re
+
+import numpy as np
+import pandas as pd
+import pyarrow.feather as feather
+from pandas.api.types import union_categoricals
+
+from csv_loader import encoding_order, read_csv_auto
+
+# 정규화된 결과를 저장하는 컬럼형(Feather) 캐시 폴더
+CACHE_DIR = os.environ.get('BUDONGSAN_CACHE_DIR', '.cache/budongsan')
+# 정규화 로직이 바뀌면 올려서 기존 캐시를 무효화
+CACHE_VERSION = 4
+# 0보다 크면 CSV를 이 행 수만큼씩 나눠 읽는 스트리밍 모드로 로드 (대용량 전국 데이터용)
+CHUNKSIZE = int(os.environ.get('BUDONGSAN_CHUNKSIZE', '0'))
+# 해시 계산 시 한 번에 읽는 바이트 수
+HASH_BLOCK = 1 << 20
+
+# 시계열을 구분하는 키 컬럼
+GROUP_COLS = ['지역명', '규모구분']
+
+# 컬럼 검색 패턴
+COL_PATTERNS = {
+    '지역명': ['지역', '시도', 'city'],
+    '규모구분': ['규모', '면적', 'size'],
+    '연도': ['연도', 'year'],
+    '월': ['월', 'month'],
+    '분양가격': ['분양가격', '가격', 'price']
+}
+
+# 정규화 결과의 컬럼 순서와 타입 (반복 문자열은 범주형, 연/월은 작은 정수,
+# 가격은 만원 단위 유효숫자 7자리면 충분하므로 float32)
+PRICE_SCHEMA = {
+    '지역명': 'category',
+    '규모구분': 'category',
+    '연도': 'int16',
+    '월': 'int8',
+    '분양가격': 'float32',
+    '날짜': 'datetime64[us]',
+    '평당가': 'float32',
+}
+
+
+def clean_value(val):
+    """문자열에서 숫자와 소수점만 추출하는 안전한 함수"""
+    if pd.isna(val) or val == '': return np.nan
+    s = str(val).strip()
+    # 숫자와 마침표(.)를 제외한 모든 문자 제거 (콤마, 한글 등)
+    s = re.sub(r'[^0-9.]', '', s)
+    if s == '' or s == '.': return np.nan
+    try:
+        return float(s)
+    except:
+        return np.nan
+
+
+def clean_values(series):
+    """clean_value의 벡터화 버전 (str.replace + to_numeric, 결과 동일)"""
+    s = series.astype(str).str.replace(r'[^0-9.]', '', regex=True)
+    # 결측값은 'nan' 문자열이 되어 숫자가 남지 않으므로 NaN으로 처리됨
+    return pd.to_numeric(s, errors='coerce').astype('float64')
+
+
+def build_dates(year, month):
+    """연도/월 컬럼으로 매월 1일 날짜를 한 번에 생성 (변환 불가 행은 NaT)"""
+    # 기존 int() 변환과 같이 소수점 이하는 버리고, 무한대는 결측으로 처리
+    parts = pd.DataFrame({
+        'year': np.trunc(year.where(np.isfinite(year))),
+        'month': np.trunc(month.where(np.isfinite(month))),
+        'day': 1
+    })
+    return pd.to_datetime(parts, errors='coerce')
+
+
+def find_columns(columns):
+    """COL_PATTERNS로 {표준 컬럼명: 원본 컬럼명} 매핑을 찾음"""
+    found_mapping = {}
+    for key, patterns in COL_PATTERNS.items():
+        for col in columns:
+            if any(p in col for p in patterns):
+                found_mapping[key] = col
+                break
+    return found_mapping
+
+
+def normalize_frame(df):
+    """원본 컬럼을 (지역명, 규모구분, 연도, 월, 분양가격, 날짜, 평당가)로 정규화"""
+    # 컬럼명 정리
+    df.columns = [str(col).strip() for col in df.columns]
+
+    found_mapping = find_columns(df.columns)
+
+    # 필수 컬럼 체크
+    if len(found_mapping) < 4:
+        return None, f"필수 컬럼을 찾을 수 없습니다. (인식된 컬럼: {list(df.columns)})"
+
+    new_df = pd.DataFrame()
+    new_df['지역명'] = df[found_mapping['지역명']].astype(str)
+    new_df['규모구분'] = df[found_mapping['규모구분']].astype(str)
+    new_df['연도'] = pd.to_numeric(df[found_mapping['연도']], errors='coerce')
+    new_df['월'] = pd.to_numeric(df[found_mapping['월']], errors='coerce')
+    new_df['분양가격'] = clean_values(df[found_mapping['분양가격']])
+
+    # 데이터 청소
+    new_df = new_df.dropna(subset=['연도', '월', '분양가격'])
+
+    new_df['날짜'] = build_dates(new_df['연도'], new_df['월'])
+    new_df = new_df.dropna(subset=['날짜'])
+    new_df['평당가'] = new_df['분양가격'] * 3.3
+
+    return compact_frame(new_df), None
+
+
+def compact_frame(df):
+    """정규화된 프레임을 PRICE_SCHEMA로 변환 (연/월은 날짜 생성과 같이 소수점 이하 버림)"""
+    df = df.assign(연도=np.trunc(df['연도']), 월=np.trunc(df['월']))
+    # 평당가는 float64로 계산한 뒤 변환해 반올림 오차가 한 번만 생기도록 함
+    return df[list(PRICE_SCHEMA)].astype(PRICE_SCHEMA)
+
+
+def schema_errors(df):
+    """PRICE_SCHEMA와 다른 컬럼 목록 (비어 있으면 스키마 일치)"""
+    if list(df.columns) != list(PRICE_SCHEMA):
+        return [f"컬럼 순서 불일치: {list(df.columns)}"]
+    return [f"{col}: {df[col].dtype} != {dtype}"
+            for col, dtype in PRICE_SCHEMA.items() if df[col].dtype != dtype]
+
+
+def concat_compact(frames):
+    """압축된 조각들을 컬럼별로 이어 붙임 (범주형은 범주를 합쳐 범주형 그대로 유지)"""
+    data = {}
+    for col in frames[0].columns:
+        parts = [frame[col] for frame in frames]
+        if isinstance(parts[0].dtype, pd.CategoricalDtype):
+            data[col] = union_categoricals(parts, sort_categories=True)
+        else:
+            data[col] = np.concatenate([part.to_numpy() for part in parts])
+    return pd.DataFrame(data)
+
+
+def _rewind(source):
+    if not isinstance(source, str):
+        source.seek(0)
+    return source
+
+
+def read_price_chunks(file_source, chunksize):
+    """CSV를 chunksize 행씩 읽어 조각마다 정규화/압축한 뒤 합침. (df, 인코딩, 오류 메시지) 반환
+
+    원본 object 컬럼은 한 조각 분량만 메모리에 머물기 때문에
+    최대 메모리가 파일 크기가 아니라 chunksize와 압축된 결과 크기에 비례한다.
+    """
+    for enc in encoding_order(file_source):
+        try:
+            header = pd.read_csv(_rewind(file_source), encoding=enc, nrows=0).columns
+            columns = [str(col).strip() for col in header]
+            # 필요한 컬럼만 파싱 (컬럼을 찾지 못하면 전체를 읽어 normalize_frame이 오류를 보고)
+            mapping = find_columns(columns)
+            usecols = [i for i, col in enumerate(columns) if col in mapping.values()] if len(mapping) >= 4 else None
+
+            frames = []
+            reader = pd.read_csv(_rewind(file_source), encoding=enc, chunksize=chunksize, usecols=usecols)
+            for chunk in reader:
+                part, err = normalize_frame(chunk)
+                if err:
+                    return None, enc, err
+                frames.append(part)
+            if not frames:
+                part, err = normalize_frame(pd.DataFrame(columns=columns))
+                if err:
+                    return None, enc, err
+                frames.append(part)
+            return concat_compact(frames), enc, None
+        except UnicodeDecodeError:
+            continue
+    return None, None, "파일 내용을 읽을 수 없습니다. 인코딩이나 파일 형식을 확인해주세요."
+
+
+def time_index(df):
+    """연도 + (월 - 1) / 12 형태의 연속 시간축"""
+    return df['연도'].to_numpy(dtype='float64') + (df['월'].to_numpy(dtype='float64') - 1) / 12
+
+
+def build_series_index(df):
+    """(지역명, 규모구분)별로 날짜순 정렬된 슬라이스를 미리 만들어 두는 조회용 인덱스
+
+    반환값: {'regions': 지역 목록, 'sizes': 규모 목록, 'groups': {(지역, 규모): DataFrame},
+             'empty': 같은 컬럼의 빈 DataFrame}
+    각 슬라이스에는 예측 그래프용 time_idx 컬럼이 미리 계산되어 있다.
+    """
+    df = df.assign(time_idx=time_index(df)).sort_values('날짜', kind='stable')
+    # 범주형 키로 한 번만 그룹화 (문자열 비교 반복 없음)
+    keys = [df[col].astype('category') for col in GROUP_COLS]
+    groups = {key: g for key, g in df.groupby(keys, sort=True, observed=True)}
+    return {
+        'regions': sorted(keys[0].cat.categories),
+        'sizes': sorted(keys[1].cat.categories),
+        'groups': groups,
+        'empty': df.iloc[:0],
+    }
+
+
+def source_digest(file_source):
+    """파일 경로 또는 업로드 객체의 내용 해시 (블록 단위로 읽어 전체를 메모리에 올리지 않음)"""
+    h = hashlib.sha256()
+    f = open(file_source, 'rb') if isinstance(file_source, str) else _rewind(file_source)
+    try:
+        for block in iter(lambda: f.read(HASH_BLOCK), b''):
+            h.update(block)
+    finally:
+        if isinstance(file_source, str):
+            f.close()
+        else:
+            f.seek(0)
+    return h.hexdigest()[:32]
+
+
+def source_name(file_source):
+    return os.path.basename(file_source if isinstance(file_source, str) else getattr(file_source, 'name', 'upload'))
+
+
+def source_key(file_source):
+    """원본 식별자: 정규화한 전체 경로(업로드는 파일명)의 해시. 다른 폴더의 같은 이름 파일을 구분"""
+    if isinstance(file_source, str):
+        ident = os.path.normcase(os.path.abspath(file_source))
+    else:
+        ident = source_name(file_source)
+    return hashlib.sha256(ident.encode()).hexdigest()[:12]
+
+
+def cache_path(digest, file_source, cache_dir=CACHE_DIR):
+    """원본 경로 해시 + 내용 해시 기반 캐시 경로 (원본이 바뀌면 경로도 바뀜)"""
+    stem = os.path.splitext(source_name(file_source))[0]
+    return os.path.join(cache_dir, f"{stem}.{source_key(file_source)}.v{CACHE_VERSION}.{digest}.feather")
+
+
+def read_cache(path):
+    """Feather 캐시를 메모리 맵으로 읽음"""
+    table = feather.read_table(path, memory_map=True)
+    return table.to_pandas()
+
+
+def write_cache(path, df):
+    """캐시 저장 후 같은 원본 경로의 이전 버전 캐시만 정리 (다른 폴더의 같은 이름 파일 캐시는 유지)"""
+    cache_dir = os.path.dirname(path)
+    os.makedirs(cache_dir, exist_ok=True)
+    # {파일명}.{경로 해시} 까지가 원본 하나를 가리킴 (.v{버전}.{내용 해시}.feather 앞부분)
+    prefix = os.path.basename(path).rsplit('.', 3)[0]
+    for name in os.listdir(cache_dir):
+        if name.startswith(f"{prefix}.v") and name.endswith('.feather'):
+            os.remove(os.path.join(cache_dir, name))
+    # 다른 워커가 읽는 도중 깨진 파일을 보지 않도록 임시 파일에 쓴 뒤 교체
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    # 무압축으로 저장해야 읽을 때 메모리 맵이 그대로 사용됨
+    feather.write_feather(df, tmp_path, compression='uncompressed')
+    os.replace(tmp_path, path)
+
+
+def load_price_data(file_source, use_cache=True, cache_dir=CACHE_DIR, chunksize=CHUNKSIZE):
+    """원본 CSV를 정규화해 반환 (df, 오류 메시지). 내용이 같으면 Feather 캐시 사용
+
+    chunksize가 0보다 크면 조각 단위 스트리밍 모드로 읽는다. 어느 경로든 결과는 PRICE_SCHEMA를 따른다.
+    """
+    try:
+        digest = source_digest(file_source)
+        path = cache_path(digest, file_source, cache_dir) if use_cache else None
+        if path and os.path.exists(path):
+            try:
+                cached = read_cache(path)
+                if not schema_errors(cached):
+                    return cached, None
+            except Exception:
+                pass  # 손상되었거나 스키마가 다른 캐시는 무시하고 다시 생성
+
+        if chunksize:
+            new_df, encoding, err = read_price_chunks(file_source, chunksize)
+        else:
+            df, encoding = read_csv_auto(file_source)
+            if df is None:
+                return None, "파일 내용을 읽을 수 없습니다. 인코딩이나 파일 형식을 확인해주세요."
+            new_df, err = normalize_frame(df)
+            del df
+        if err:
+            return None, err
+        new_df = new_df.reset_index(drop=True)
+        # 판별된 인코딩과 원본 해시는 attrs로 전달 (Feather 캐시에도 함께 저장됨)
+        new_df.attrs['encoding'] = encoding
+        new_df.attrs['source_hash'] = digest
+
+        if path:
+            try:
+                write_cache(path, new_df)
+            except OSError:
+                pass  # 읽기 전용 환경에서는 캐시 없이 동작
+        return new_df, None
+
+    except Exception as e:
+        return None, f"전처리 중 오류 발생: {str(e)}"
@@ -0,0 +1,145 @@
+import numpy as np
+import pandas as pd
+
+from budongsan_core import GROUP_COLS, time_index
+
+TARGET_YEAR = 2026.0
+# 제곱합의 자릿수 손실을 줄이기 위해 시간축을 이 값만큼 이동해 계산
+X_OFFSET = 2000.0
+
+# n·Σx² - (Σx)² 가 n·Σx² 의 이 비율 이하이면 x가 모두 같은 것으로 보고 추세를 구하지 않음
+# (같은 시점 행만 있을 때 반올림 오차로 남는 작은 값이 큰 기울기를 만들지 않도록)
+DEGENERATE_RTOL = 1e-9
+
+FORECAST_COLS = ['n', 'slope', 'intercept', 'last_val', 'pred_2026', 'change_pct']
+# 그룹별로 누적해 두는 충분통계량 (x는 X_OFFSET 기준 시간축)
+SUM_COLS = ['n', 'sx', 'sy', 'sxy', 'sxx']
+
+
+def fit_from_sums(n, sx, sy, sxy, sxx):
+    """충분통계량(n, Σx, Σy, Σxy, Σx²)으로 1차 회귀 기울기/절편을 한 번에 계산 (x는 X_OFFSET 기준)"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        denom = n * sxx - sx * sx
+        slope = np.where((n >= 2) & (denom > DEGENERATE_RTOL * n * sxx), (n * sxy - sx * sy) / denom, np.nan)
+        intercept = (sy - slope * sx) / n
+    # 원래 시간축(연도) 기준 절편으로 변환
+    return slope, intercept - slope * X_OFFSET
+
+
+def group_codes(df):
+    """행별 (지역명, 규모구분) 그룹 번호와 그룹 MultiIndex
+
+    두 컬럼의 범주 코드를 하나의 정수로 합쳐 O(행 수)로 번호를 매긴다
+    (문자열 MultiIndex factorize보다 대용량에서 수 배 빠름).
+    """
+    cols = [df[col] if isinstance(df[col].dtype, pd.CategoricalDtype) else df[col].astype(str).astype('category')
+            for col in GROUP_COLS]
+    width = max(len(cols[1].cat.categories), 1)
+    combined = cols[0].cat.codes.to_numpy().astype('int64') * width + cols[1].cat.codes.to_numpy()
+    # 실제로 나타난 조합만 0..k-1 번호로 압축
+    present = np.flatnonzero(np.bincount(combined, minlength=len(cols[0].cat.categories) * width))
+    remap = np.zeros(len(cols[0].cat.categories) * width, dtype='int64')
+    remap[present] = np.arange(len(present))
+    groups = pd.MultiIndex.from_arrays([
+        np.asarray(cols[0].cat.categories.astype(str))[present // width],
+        np.asarray(cols[1].cat.categories.astype(str))[present % width],
+    ], names=GROUP_COLS)
+    return remap[combined], groups
+
+
+def group_sums(df, sign=1.0):
+    """(지역명, 규모구분)별 충분통계량 표 (n, Σx, Σy, Σxy, Σx²)와 그룹별 최근 시점(last_x, last_val)
+
+    sign=-1이면 통계량에 음수를 곱해 해당 행들을 빼는 용도로 쓴다.
+    """
+    codes, groups = group_codes(df)
+    k = len(groups)
+    x = time_index(df) - X_OFFSET
+    y = df['평당가'].to_numpy(dtype='float64')
+
+    n = np.bincount(codes, minlength=k).astype('float64')
+    sx = np.bincount(codes, weights=x, minlength=k)
+    sy = np.bincount(codes, weights=y, minlength=k)
+    sxy = np.bincount(codes, weights=x * y, minlength=k)
+    sxx = np.bincount(codes, weights=x * x, minlength=k)
+
+    # 그룹별 가장 최근 시점의 평당가 (그룹 -> 시간 순 정렬 후 마지막 행)
+    order = np.lexsort((x, codes))
+    last_pos = np.searchsorted(codes[order], np.arange(k), side='right') - 1
+
+    return pd.DataFrame({
+        'n': sign * n, 'sx': sign * sx, 'sy': sign * sy, 'sxy': sign * sxy, 'sxx': sign * sxx,
+        'last_x': x[order][last_pos],
+        'last_val': y[order][last_pos],
+    }, index=groups)
+
+
+def forecast_table(sums, target_year=TARGET_YEAR):
+    """group_sums 형식의 통계량 표로 예측표 계산 (그룹 수에 비례, 원본 행은 보지 않음)"""
+    slope, intercept = fit_from_sums(*(sums[col].to_numpy() for col in SUM_COLS))
+    last_val = sums['last_val'].to_numpy()
+
+    pred = intercept + slope * target_year
+    with np.errstate(divide='ignore', invalid='ignore'):
+        change_pct = (pred - last_val) / last_val * 100
+
+    table = pd.DataFrame({
+        # 더하고 뺀 누적값이라 반올림해서 정수로 변환
+        'n': np.rint(sums['n'].to_numpy()).astype('int64'),
+        'slope': slope,
+        'intercept': intercept,
+        'last_val': last_val,
+        'pred_2026': pred,
+        'change_pct': change_pct,
+    }, index=sums.index)
+    return table[table['n'] > 0].sort_index()
+
+
+def forecast_all(df, target_year=TARGET_YEAR):
+    """모든 (지역명, 규모구분) 시계열의 선형 추세와 target_year 예측을 한 번에 계산
+
+    반환값은 (지역명, 규모구분) MultiIndex를 가진 표이며 컬럼은
+    n, slope, intercept, last_val(최근 평당가), pred_2026, change_pct(예상 등락률 %)이다.
+    """
+    return forecast_table(group_sums(df), target_year)
+
+
+class ForecastState:
+    """그룹별 충분통계량을 유지하면서 추가/대체된 행만 반영해 예측을 갱신
+
+    apply()는 바뀐 행 수와 그 행들이 속한 그룹 수에만 비례하며 기존 행은 다시 보지 않는다.
+    """
+
+    def __init__(self, sums):
+        self.sums = sums
+
+    @classmethod
+    def from_frame(cls, df):
+        return cls(group_sums(df))
+
+    def apply(self, added, removed=None):
+        """새 행(added)을 더하고, 같은 키로 대체된 기존 행(removed)은 뺌"""
+        for rows, sign in [(removed, -1.0), (added, 1.0)]:
+            if rows is None or rows.empty:
+                continue
+            delta = group_sums(rows, sign)
+            if self.sums is None:
+                self.sums = delta
+                continue
+            new_groups = delta.index.difference(self.sums.index)
+            if len(new_groups):
+                self.sums = pd.concat([self.sums, delta.loc[new_groups]])
+                delta = delta.drop(new_groups)
+            if delta.empty:
+                continue
+            self.sums.loc[delta.index, SUM_COLS] += delta[SUM_COLS]
+            if sign > 0:
+                # 더 최근(또는 같은 시점을 대체한) 값이면 최근 평당가 갱신
+                newer = delta['last_x'] >= self.sums.loc[delta.index, 'last_x']
+                idx = delta.index[newer.to_numpy()]
+                self.sums.loc[idx, ['last_x', 'last_val']] = delta.loc[idx, ['last_x', 'last_val']]
+
+    def table(self, target_year=TARGET_YEAR):
+        if self.sums is None:
+            return pd.DataFrame(columns=FORECAST_COLS)
+        return forecast_table(self.sums, target_year)
@@ -0,0 +1,142 @@
+import glob
+import hashlib
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from budongsan_core import (CACHE_DIR, CACHE_VERSION, cache_path, concat_compact, load_price_data,
+                            read_cache, schema_errors)
+
+# 같은 시점의 가격이 여러 파일에 있으면 하나만 남기는 키
+DEDUP_COLS = ['지역명', '규모구분', '연도', '월']
+# 파일별 (크기, 수정 시각, 내용 해시)를 기록해 두는 매니페스트 파일명
+MANIFEST_NAME = 'manifest.json'
+
+
+def resolve_sources(pattern):
+    """폴더 경로 또는 glob 패턴을 정렬된 CSV 파일 목록으로 변환"""
+    if os.path.isdir(pattern):
+        pattern = os.path.join(pattern, '*.csv')
+    return sorted(os.path.abspath(p) for p in glob.glob(pattern) if os.path.isfile(p))
+
+
+def source_signature(paths):
+    """(경로, 크기, 수정 시각) 튜플 목록. 파일이 추가/변경되면 값이 달라져 캐시 키로 쓸 수 있음"""
+    signature = []
+    for path in paths:
+        st = os.stat(path)
+        signature.append((path, st.st_size, st.st_mtime_ns))
+    return tuple(signature)
+
+
+def read_manifest(cache_dir=CACHE_DIR):
+    path = os.path.join(cache_dir, MANIFEST_NAME)
+    try:
+        with open(path, encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    # 정규화 로직이 바뀌면 캐시와 함께 매니페스트도 무효화
+    return manifest.get('files', {}) if manifest.get('version') == CACHE_VERSION else {}
+
+
+def write_manifest(files, cache_dir=CACHE_DIR):
+    os.makedirs(cache_dir, exist_ok=True)
+    path = os.path.join(cache_dir, MANIFEST_NAME)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'version': CACHE_VERSION, 'files': files}, f, ensure_ascii=False, indent=1)
+    os.replace(tmp_path, path)
+
+
+def parse_file(path, cache_dir=CACHE_DIR):
+    """(워커 프로세스) 파일 하나를 정규화해 Feather 캐시에 저장. (경로, 내용 해시, 오류 메시지) 반환
+
+    결과 프레임은 캐시 파일로 넘기므로 프로세스 간에 피클로 복사하지 않는다.
+    """
+    df, err = load_price_data(path, cache_dir=cache_dir)
+    if err:
+        return path, None, err
+    return path, df.attrs['source_hash'], None
+
+
+def load_cached_file(path, entry, cache_dir=CACHE_DIR):
+    """매니페스트 항목의 Feather 캐시를 읽음 (없거나 스키마가 다르면 None)"""
+    cached = cache_path(entry['hash'], path, cache_dir)
+    try:
+        df = read_cache(cached)
+    except Exception:
+        return None
+    return None if schema_errors(df) else df
+
+
+def load_price_files(paths, workers=None, cache_dir=CACHE_DIR):
+    """여러 CSV를 병렬로 정규화해 하나로 합침. (df, 오류 메시지) 반환
+
+    매니페스트의 (크기, 수정 시각)이 그대로인 파일은 다시 읽지 않고 캐시를 사용한다.
+    같은 (지역명, 규모구분, 연도, 월)이 여러 번 나오면 경로 순서상 마지막 파일의 값을 남긴다.
+    읽지 못한 파일은 건너뛰고 df.attrs['skipped']에 {파일명: 오류}로 남긴다.
+    """
+    paths = sorted(os.path.abspath(p) for p in paths)
+    if not paths:
+        return None, "읽을 CSV 파일이 없습니다."
+
+    manifest = read_manifest(cache_dir)
+    frames, skipped, todo = {}, {}, []
+    for path, size, mtime_ns in source_signature(paths):
+        entry = manifest.get(path)
+        if entry and entry['size'] == size and entry['mtime_ns'] == mtime_ns:
+            # 이전에 실패한 파일도 바뀌지 않았다면 다시 파싱하지 않음
+            if 'error' in entry:
+                skipped[os.path.basename(path)] = entry['error']
+                continue
+            df = load_cached_file(path, entry, cache_dir)
+            if df is not None:
+                frames[path] = df
+                continue
+        todo.append((path, size, mtime_ns))
+
+    if todo:
+        if len(todo) == 1 or workers == 1:
+            results = [parse_file(path, cache_dir) for path, _, _ in todo]
+        else:
+            # Streamlit 서버 스레드에서 fork하지 않도록 spawn 사용
+            ctx = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+                results = list(pool.map(parse_file, [p for p, _, _ in todo], [cache_dir] * len(todo)))
+
+        for (path, size, mtime_ns), (_, digest, err) in zip(todo, results):
+            if err:
+                skipped[os.path.basename(path)] = err
+                manifest[path] = {'size': size, 'mtime_ns': mtime_ns, 'error': err}
+                continue
+            entry = {'size': size, 'mtime_ns': mtime_ns, 'hash': digest}
+            df = load_cached_file(path, entry, cache_dir)
+            if df is None:
+                # 캐시를 쓸 수 없는 환경이면 현재 프로세스에서 직접 읽음
+                df, err = load_price_data(path, use_cache=False)
+                if err:
+                    skipped[os.path.basename(path)] = err
+                    continue
+            frames[path] = df
+            manifest[path] = entry
+        try:
+            write_manifest(manifest, cache_dir)
+        except OSError:
+            pass  # 읽기 전용 환경에서는 매번 다시 읽음
+
+    if not frames:
+        return None, "모든 파일을 읽지 못했습니다: " + "; ".join(f"{k}: {v}" for k, v in skipped.items())
+
+    ordered = [frames[path] for path in paths if path in frames]
+    df = concat_compact(ordered)
+    df = df.drop_duplicates(subset=DEDUP_COLS, keep='last').reset_index(drop=True)
+    # 파일별 인코딩 (추가 전용 저장소가 파일을 더할 때 이어서 갱신)
+    df.attrs['encodings'] = {path: frames[path].attrs.get('encoding', '?') for path in paths if path in frames}
+    df.attrs['encoding'] = ', '.join(sorted(set(df.attrs['encodings'].values())))
+    # 파일별 내용 해시를 합친 데이터셋 해시 (차트 캐시 키 등에 사용)
+    df.attrs['source_hash'] = hashlib.sha256(''.join(f.attrs['source_hash'] for f in ordered).encode()).hexdigest()[:32]
+    df.attrs['files'] = len(ordered)
+    df.attrs['skipped'] = skipped
+    return df, None
@@ -0,0 +1,136 @@
+import hashlib
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+from budongsan_core import concat_compact, load_price_data
+from budongsan_forecast import TARGET_YEAR, ForecastState
+from budongsan_ingest import DEDUP_COLS, load_price_files, source_signature
+from fig_cache import dataset_hash
+
+
+def row_keys(df):
+    """(지역명, 규모구분, 연도, 월) 키 튜플 목록"""
+    return list(zip(*(df[col].astype(str if col in ('지역명', '규모구분') else 'int64').tolist()
+                      for col in DEDUP_COLS)))
+
+
+class PriceStore:
+    """정규화된 가격 데이터를 조각(segment) 단위로 이어 붙이는 추가 전용 저장소
+
+    새 행은 조각 하나로 추가되고, 이미 있는 (지역명, 규모구분, 연도, 월) 행은 새 값으로 대체된다.
+    그룹별 회귀 충분통계량(ForecastState)도 함께 갱신하므로 예측표 갱신은 새 행 수에만 비례한다.
+    합쳐진 DataFrame은 frame()을 처음 부를 때 한 번만 만든다.
+    """
+
+    def __init__(self, df=None):
+        self.segments = []
+        self.keys = {}          # 키 -> 전체 행 번호
+        self.replaced = set()   # 새 값으로 대체된 기존 행 번호
+        self.rows = 0
+        self.files = {}         # 적재한 파일 경로 -> (크기, 수정 시각)
+        self.state = ForecastState(None)
+        self.attrs = {}
+        self._frame = None
+        self._lock = threading.Lock()
+        if df is not None:
+            self.append(df)
+
+    def append(self, df):
+        """정규화된 행을 추가 (같은 키가 있으면 대체). 반환값: (추가된 행 수, 대체된 행 수)"""
+        if df.empty:
+            return 0, 0
+        segment_hash = dataset_hash(df)
+        # 같은 배치 안의 중복은 마지막 값만 사용
+        df = df.drop_duplicates(subset=DEDUP_COLS, keep='last').reset_index(drop=True)
+        with self._lock:
+            old_pos = []
+            for i, key in enumerate(row_keys(df)):
+                pos = self.keys.get(key)
+                if pos is not None:
+                    old_pos.append(pos)
+                self.keys[key] = self.rows + i
+            removed = self._rows_at(old_pos) if old_pos else None
+            self.replaced.update(old_pos)
+            self.state.apply(df, removed)
+            self.segments.append(df)
+            self.rows += len(df)
+            # 내용이 바뀌었으므로 데이터셋 해시도 갱신 (차트 캐시 키가 바뀜)
+            chained = self.attrs.get('source_hash', '') + segment_hash
+            self.attrs['source_hash'] = hashlib.sha256(chained.encode()).hexdigest()[:32]
+            self._frame = None
+        return len(df) - len(old_pos), len(old_pos)
+
+    def _rows_at(self, positions):
+        """전체 행 번호 목록에 해당하는 기존 행"""
+        starts = np.cumsum([0] + [len(seg) for seg in self.segments])
+        positions = np.sort(np.asarray(positions))
+        seg_ids = np.searchsorted(starts, positions, side='right') - 1
+        parts = [self.segments[s].iloc[positions[seg_ids == s] - starts[s]] for s in np.unique(seg_ids)]
+        return pd.concat(parts, ignore_index=True)
+
+    def append_file(self, path):
+        """CSV 하나를 정규화해 추가 (파일별 Feather 캐시 사용). 반환값: (추가, 대체, 오류 메시지)"""
+        df, err = load_price_data(path)
+        if err:
+            return 0, 0, err
+        added, replaced = self.append(df)
+        st = os.stat(path)
+        self.files[os.path.abspath(path)] = (st.st_size, st.st_mtime_ns)
+        self.attrs['files'] = self.attrs.get('files', 0) + 1
+        # 이전 frame()이 같은 dict를 들고 있으므로 고치지 않고 새로 만듦
+        encodings = {**self.attrs.get('encodings', {}), os.path.abspath(path): df.attrs.get('encoding', '?')}
+        self.attrs['encodings'] = encodings
+        self.attrs['encoding'] = ', '.join(sorted(set(encodings.values())))
+        return added, replaced, None
+
+    @classmethod
+    def from_files(cls, paths):
+        """여러 파일을 병렬로 읽어 새 저장소 생성 (load_price_files 사용)"""
+        df, err = load_price_files(paths)
+        if err:
+            raise ValueError(err)
+        store = cls(df)
+        store.files = {path: (size, mtime) for path, size, mtime in source_signature(paths)}
+        store.attrs.update({k: v for k, v in df.attrs.items() if k != 'source_hash'})
+        return store
+
+    def frame(self):
+        """대체된 행을 뺀 전체 DataFrame (다음 추가 전까지 재사용)"""
+        with self._lock:
+            if self._frame is None:
+                df = concat_compact(self.segments) if self.segments else pd.DataFrame()
+                if self.replaced:
+                    keep = np.ones(len(df), dtype=bool)
+                    keep[list(self.replaced)] = False
+                    df = df[keep].reset_index(drop=True)
+                df.attrs.update(self.attrs)
+                self._frame = df
+            return self._frame
+
+    def forecasts(self, target_year=TARGET_YEAR):
+        """전체 (지역명, 규모구분) 예측표 (누적된 충분통계량으로 계산)"""
+        with self._lock:
+            return self.state.table(target_year)
+
+
+def sync_store(store, paths):
+    """폴더의 파일 목록에 맞춰 저장소 갱신. (저장소, 새로 읽은 파일 목록) 반환
+
+    새 파일만 늘었다면 기존 저장소에 해당 파일만 추가한다.
+    이미 적재한 파일이 바뀌거나 사라졌다면 그 행을 되돌릴 수 없으므로 전체를 다시 읽은 새 저장소를 만든다.
+    """
+    paths = [os.path.abspath(p) for p in paths]
+    signature = {path: (size, mtime) for path, size, mtime in source_signature(paths)}
+    if store is None or any(signature.get(path) != sig for path, sig in store.files.items()):
+        store = PriceStore.from_files(paths)
+        return store, sorted(signature)
+    new_paths = [path for path in sorted(signature) if path not in store.files]
+    for path in new_paths:
+        _, _, err = store.append_file(path)
+        if err:
+            store.attrs.setdefault('skipped', {})[os.path.basename(path)] = err
+            store.files[path] = signature[path]
+    return store, new_paths
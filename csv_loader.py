@@ -0,0 +1,71 @@
+import codecs
+import io
+
+import pandas as pd
+
+# 인코딩 판별에 사용할 앞부분 크기 (전체 파일을 읽지 않음)
+SAMPLE_SIZE = 64 * 1024
+
+# BOM으로 바로 확정되는 인코딩
+BOMS = [
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+]
+
+# BOM이 없을 때 엄격 디코딩으로 시험할 후보 (cp949는 euc-kr의 상위 집합)
+CANDIDATES = ['utf-8', 'cp949']
+
+
+def read_sample(source, size=SAMPLE_SIZE):
+    """경로/바이트/파일 객체에서 앞부분 바이트만 읽음"""
+    if isinstance(source, (bytes, bytearray)):
+        return bytes(source[:size])
+    if isinstance(source, str):
+        with open(source, 'rb') as f:
+            return f.read(size)
+    source.seek(0)
+    sample = source.read(size)
+    source.seek(0)
+    return sample
+
+
+def detect_encoding(sample):
+    """BOM 확인 후, 샘플을 후보 인코딩으로 엄격하게 디코딩해 첫 성공 인코딩을 반환"""
+    for bom, enc in BOMS:
+        if sample.startswith(bom):
+            return enc
+    for enc in CANDIDATES:
+        # 샘플 끝에서 잘린 멀티바이트 문자는 오류로 보지 않음 (final=False)
+        decoder = codecs.getincrementaldecoder(enc)(errors='strict')
+        try:
+            decoder.decode(sample, final=False)
+            return enc
+        except UnicodeDecodeError:
+            continue
+    return None
+
+
+def encoding_order(source):
+    """시도할 인코딩 순서 (판별된 인코딩을 먼저, 나머지 후보는 실패 시 대비)"""
+    detected = detect_encoding(read_sample(source))
+    order = [detected] if detected else []
+    return order + [enc for enc in CANDIDATES if enc not in order]
+
+
+def read_csv_auto(source, **kwargs):
+    """인코딩을 한 번만 판별하고 CSV를 한 번만 파싱. (DataFrame, 사용한 인코딩) 반환
+
+    샘플 이후 구간에서 디코딩이 실패하면 남은 후보로만 다시 시도하며,
+    어떤 인코딩으로도 읽을 수 없으면 (None, None)을 반환한다.
+    """
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+    for enc in encoding_order(source):
+        try:
+            if not isinstance(source, str):
+                source.seek(0)
+            return pd.read_csv(source, encoding=enc, **kwargs), enc
+        except UnicodeDecodeError:
+            continue
+    return None, None
@@ -0,0 +1,77 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+import plotly.io as pio
+
+# 캐시 메모리 상한 (직렬화된 JSON 기준, MB)
+DEFAULT_MAX_MB = float(os.environ.get('FIG_CACHE_MAX_MB', '64'))
+
+
+def dataset_hash(df):
+    """데이터셋 식별용 해시 (로더가 attrs에 남긴 원본 해시가 있으면 그대로 사용)"""
+    if 'source_hash' in df.attrs:
+        return df.attrs['source_hash']
+    values = pd.util.hash_pandas_object(df, index=True).to_numpy()
+    return hashlib.sha256(values.tobytes()).hexdigest()[:32]
+
+
+class FigureCache:
+    """(데이터셋 해시, 차트 이름, 필터 값, 테마) -> plotly figure JSON 의 LRU 캐시
+
+    JSON 문자열 크기 합계가 max_bytes를 넘으면 가장 오래 쓰이지 않은 항목부터 제거한다.
+    여러 세션 스레드가 함께 쓰므로 잠금으로 보호한다.
+    """
+
+    def __init__(self, max_bytes=int(DEFAULT_MAX_MB * 1024 * 1024)):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(dataset, name, params=(), theme=None):
+        return (dataset, name, tuple(params), theme)
+
+    def get_json(self, key, build):
+        """캐시된 figure JSON을 반환. 없으면 build()로 figure를 만들어 직렬화 후 저장"""
+        with self._lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return self.entries[key]
+            self.misses += 1
+
+        fig_json = build().to_json()
+        size = len(fig_json)
+        with self._lock:
+            if size <= self.max_bytes and key not in self.entries:
+                self.entries[key] = fig_json
+                self.bytes += size
+                while self.bytes > self.max_bytes:
+                    _, old = self.entries.popitem(last=False)
+                    self.bytes -= len(old)
+        return fig_json
+
+    def get_figure(self, key, build):
+        """get_json 결과를 figure로 복원 (pandas 연산/차트 구성은 다시 하지 않음)"""
+        return pio.from_json(self.get_json(key, build))
+
+    def clear(self):
+        with self._lock:
+            self.entries.clear()
+            self.bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries': len(self.entries),
+                'bytes': self.bytes,
+                'max_bytes': self.max_bytes
+            }
@@ -1,6 +1,8 @@
 import streamlit as st
-from datetime import datetime
 import uuid
+from datetime import datetime
+
+from task_store import create_task, open_store
 
 # --- 페이지 설정 ---
 st.set_page_config(page_title="하우젠 매트릭스", layout="wide", initial_sidebar_state="collapsed")
@@ -9,18 +11,22 @@ st.set_page_config(page_title="하우젠 매트릭스", layout="wide", initial_s
 if 'view_mode' not in st.session_state:
     st.session_state.view_mode = "Mobile"
 
+# 사분면에 한 번에 그리는 미완료 할 일 수 (나머지는 "더 보기"로 펼침)
+PAGE_SIZE = {"Mobile": 5, "PC": 20}
+
+# 스크립트 실행 횟수 (상호작용 한 번 = 실행 한 번인지 확인용)
+st.session_state.run_count = st.session_state.get('run_count', 0) + 1
+
 with st.sidebar:
     st.title("📱 화면 설정")
-    st.session_state.view_mode = st.radio(
-        "버전 선택", 
-        ["Mobile", "PC"], 
-        index=0 if st.session_state.view_mode == "Mobile" else 1
-    )
+    # 위젯 key로 세션 상태를 직접 갱신 (선택이 한 박자 늦게 반영되지 않음)
+    view_mode = st.radio("버전 선택", ["Mobile", "PC"], key="view_mode")
     st.divider()
     st.info("Mobile 모드는 세로 화면 비율에 최적화되어 스크롤 없이 박제됩니다.")
+    st.caption(f"🔁 스크립트 실행 횟수: {st.session_state.run_count}")
 
 # --- 디자인 개선 및 모바일 박제 스타일 ---
-if st.session_state.view_mode == "Mobile":
+if view_mode == "Mobile":
     st.markdown("""
         <style>
         /* 1. 전체 레이아웃 강제 고정 및 스크롤 차단 */
@@ -129,26 +135,56 @@ else:
         </style>
         """, unsafe_allow_html=True)
 
-# --- 데이터 관리 ---
-if 'tasks' not in st.session_state:
-    st.session_state.tasks = []
+# --- 데이터 관리 (SQLite 저장소, 여러 워커 프로세스가 공유. 소유자별로 자기 할 일만 조회/변경) ---
+# 할 일 소유자: 로그인한 사용자는 이메일, 아니면 URL의 owner 값 (처음 방문 때 발급해 새로고침해도 유지)
+def get_owner():
+    if st.user.get("is_logged_in"):
+        return st.user.email
+    if "owner" not in st.query_params:
+        st.query_params["owner"] = uuid.uuid4().hex
+    return st.query_params["owner"]
+
+@st.cache_resource
+def get_store(owner):
+    return open_store("hausen", owner)
+
+store = get_store(get_owner())
 
 def add_task(text, q_num, date):
     if not text.strip(): return
-    st.session_state.tasks.append({
-        "id": str(uuid.uuid4()),
-        "text": text,
-        "quadrant": q_num,
-        "completed": False,
-        "date": str(date)
-    })
+    store.add(create_task(text, q_num, date))
+
+# --- 변경 콜백: 스크립트 실행 전에 저장소를 갱신하므로 st.rerun() 없이 한 번만 렌더링됨 ---
+# 변경된 사분면의 프래그먼트만 다시 실행 (CSS/헤더/다른 사분면은 건너뜀)
+def rerun_quadrant(q_num):
+    st.rerun(f"quadrant_{q_num}")
+
+def on_add(q_num, selected_date):
+    add_task(st.session_state[f"in_{q_num}"], q_num, selected_date)
+    st.session_state[f"in_{q_num}"] = ""
+    rerun_quadrant(q_num)
+
+def on_toggle(task_id, q_num):
+    store.set_completed(task_id, st.session_state[f"chk_{task_id}"])
+    rerun_quadrant(q_num)
+
+def on_delete(task_id, q_num):
+    store.delete(task_id)
+    rerun_quadrant(q_num)
+
+# 목록 창 크기/완료 그룹 펼침 상태 (버튼이 프래그먼트 안에 있어 해당 사분면만 다시 실행됨)
+def on_more(list_key, page):
+    st.session_state[f"limit_{list_key}"] = st.session_state.get(f"limit_{list_key}", page) + page
+
+def on_toggle_done(q_num):
+    st.session_state[f"show_done_{q_num}"] = not st.session_state.get(f"show_done_{q_num}", False)
 
 # --- 상단 헤더 ---
 h_col1, h_col2 = st.columns([1, 1])
 with h_col1:
     st.markdown("<h3 style='color:#0f172a; font-weight:900;'>📋 하우젠</h3>", unsafe_allow_html=True)
 with h_col2:
-    selected_date = st.date_input("날짜", datetime.now(), label_visibility="collapsed")
+    selected_date = st.date_input("날짜", datetime.now(), label_visibility="collapsed", key="selected_date")
 
 # --- 매트릭스 설정 (파스텔 톤) ---
 quadrants = [
@@ -158,7 +194,60 @@ quadrants = [
     {"num": 4, "title": "비중요 / 비긴급", "color": "#E9D6FF", "icon": "☕"}
 ]
 
-visible_tasks = [t for t in st.session_state.tasks if t['date'] == str(selected_date) or (t['date'] < str(selected_date) and not t['completed'])]
+# --- 사분면 하나 그리기 (프래그먼트로 감싸 사분면별로 따로 다시 실행됨) ---
+# 날짜/페이지 크기는 본문 실행에서 읽어 인자로 넘김 (프래그먼트만 다시 실행되면 본문 위젯 키가 세션에서 빠질 수 있음)
+def render_quadrant(q, selected_date, page):
+    # Quadrant Header
+    st.markdown(f'<div class="q-header" style="background-color: {q["color"]};">{q["icon"]} {q["title"]}</div>', unsafe_allow_html=True)
+    
+    # Quadrant Container
+    st.markdown('<div class="quadrant-container">', unsafe_allow_html=True)
+    
+    # Add Task Button (Popover)
+    with st.popover("➕", use_container_width=True):
+        st.text_input("할 일", key=f"in_{q['num']}", placeholder="입력 후 엔터", label_visibility="collapsed")
+        st.button("저장", key=f"btn_{q['num']}", use_container_width=True, on_click=on_add, args=(q['num'], selected_date))
+    
+    # 선택 날짜의 할 일 + 이전 미완료 할 일 중 이 사분면 것만 저장소에서 조회
+    q_tasks = store.load(selected_date, quadrant=q['num'])
+    open_tasks = [t for t in q_tasks if not t['completed']]
+    done_tasks = [t for t in q_tasks if t['completed']]
+    
+    render_window(open_tasks, f"open_{q['num']}", q['num'], selected_date, page)
+    
+    # 완료 항목은 접어 두고 펼쳤을 때만 위젯 생성
+    if done_tasks:
+        show_done = st.session_state.get(f"show_done_{q['num']}", False)
+        st.button(f"{'▾' if show_done else '▸'} 완료 {len(done_tasks)}개", key=f"done_btn_{q['num']}",
+                  use_container_width=True, on_click=on_toggle_done, args=(q['num'],))
+        if show_done:
+            render_window(done_tasks, f"done_{q['num']}", q['num'], selected_date, page)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+# --- 할 일 목록 창: 앞쪽 limit개만 위젯으로 그리고 나머지는 "더 보기" ---
+def render_window(tasks, list_key, q_num, selected_date, page):
+    limit = st.session_state.get(f"limit_{list_key}", page)
+    for task in tasks[:limit]:
+        render_task(task, q_num, selected_date)
+    if len(tasks) > limit:
+        st.button(f"더 보기 ({len(tasks) - limit}개 남음)", key=f"more_{list_key}",
+                  use_container_width=True, on_click=on_more, args=(list_key, page))
+
+def render_task(task, q_num, selected_date):
+    # 모바일 최적화 비율
+    t_col1, t_col2, t_col3 = st.columns([0.2, 0.65, 0.15])
+    with t_col1:
+        st.checkbox("", value=task['completed'], key=f"chk_{task['id']}", label_visibility="collapsed",
+                    on_change=on_toggle, args=(task['id'], q_num))
+    with t_col2:
+        txt = task['text']
+        if task['completed']: 
+            txt = f"<span style='text-decoration: line-through; color: #94a3b8;'>{txt}</span>"
+        if task['date'] < str(selected_date): 
+            txt = f"⏳ {txt}"
+        st.markdown(f"<div style='padding-top:2px;'>{txt}</div>", unsafe_allow_html=True)
+    with t_col3:
+        st.button("×", key=f"del_{task['id']}", help="삭제", on_click=on_delete, args=(task['id'], q_num))
 
 # --- 2x2 그리드 배치 ---
 row1 = st.columns(2)
@@ -167,37 +256,4 @@ grid = [row1[0], row1[1], row2[0], row2[1]]
 
 for i, q in enumerate(quadrants):
     with grid[i]:
-        # Quadrant Header
-        st.markdown(f'<div class="q-header" style="background-color: {q["color"]};">{q["icon"]} {q["title"]}</div>', unsafe_allow_html=True)
-        
-        # Quadrant Container
-        st.markdown('<div class="quadrant-container">', unsafe_allow_html=True)
-        
-        # Add Task Button (Popover)
-        with st.popover("➕", use_container_width=True):
-            in_val = st.text_input("할 일", key=f"in_{q['num']}", placeholder="입력 후 엔터", label_visibility="collapsed")
-            if st.button("저장", key=f"btn_{q['num']}", use_container_width=True):
-                add_task(in_val, q['num'], selected_date)
-                st.rerun()
-        
-        q_tasks = [t for t in visible_tasks if t['quadrant'] == q['num']]
-        
-        for task in q_tasks:
-            # 모바일 최적화 비율
-            t_col1, t_col2, t_col3 = st.columns([0.2, 0.65, 0.15])
-            with t_col1:
-                if st.checkbox("", value=task['completed'], key=f"chk_{task['id']}", label_visibility="collapsed"):
-                    task['completed'] = not task['completed']
-                    st.rerun()
-            with t_col2:
-                txt = task['text']
-                if task['completed']: 
-                    txt = f"<span style='text-decoration: line-through; color: #94a3b8;'>{txt}</span>"
-                if task['date'] < str(selected_date): 
-                    txt = f"⏳ {txt}"
-                st.markdown(f"<div style='padding-top:2px;'>{txt}</div>", unsafe_allow_html=True)
-            with t_col3:
-                if st.button("×", key=f"del_{task['id']}", help="삭제"):
-                    st.session_state.tasks = [t for t in st.session_state.tasks if t['id'] != task['id']]
-                    st.rerun()
-        st.markdown('</div>', unsafe_allow_html=True)
+        st.fragment(render_quadrant, key=f"quadrant_{q['num']}")(q, selected_date, PAGE_SIZE[view_mode])
@@ -0,0 +1,21 @@
+import pandas as pd
+
+
+def enable_copy_on_write():
+    """st.cache_resource로 공유하는 DataFrame을 세션별 수정으로부터 보호
+
+    pandas 3.0부터는 Copy-on-Write가 항상 켜져 있어 슬라이스/열 수정이 원본에 번지지 않는다.
+    2.x에서는 옵션으로 직접 켜야 같은 보장을 받는다.
+    """
+    if int(pd.__version__.split('.')[0]) < 3:
+        pd.set_option('mode.copy_on_write', True)
+
+
+def session_view(df):
+    """공유 프레임의 세션용 얕은 복사본 (데이터는 공유, 수정하는 순간 해당 열만 복사됨)"""
+    return None if df is None else df.copy(deep=False)
+
+
+def frame_mb(df):
+    """DataFrame 메모리 사용량 (MB, 문자열 포함)"""
+    return df.memory_usage(deep=True).sum() / 2**20
@@ -0,0 +1,634 @@
+import os
+import sqlite3
+import threading
+import uuid
+from bisect import bisect_left, bisect_right, insort
+from collections import defaultdict
+from contextlib import closing
+from datetime import date as Date, datetime, timedelta
+from itertools import islice
+
+# 사분면 번호 -> (긴급, 중요)
+QUADRANT_FLAGS = {
+    1: (True, True),
+    2: (False, True),
+    3: (True, False),
+    4: (False, False)
+}
+
+# 증분 집계하는 통계 항목 (전체/완료/긴급 + 사분면별 q1~q4)
+STAT_KEYS = ('total', 'completed', 'urgent') + tuple(f"q{q}" for q in QUADRANT_FLAGS)
+
+TASK_FIELDS = ['id', 'text', 'quadrant', 'completed', 'date', 'priority', 'note', 'created_at']
+TASK_COLUMNS = ', '.join(TASK_FIELDS)
+
+# 저장소 선택: TASK_STORE_BACKEND=sqlite(기본) | memory, DB 위치: TASK_DB_DIR
+DEFAULT_BACKEND = os.environ.get('TASK_STORE_BACKEND', 'sqlite')
+DB_DIR = os.environ.get('TASK_DB_DIR', '.data')
+# TASK_INDEX_VERIFY=1 이면 TaskIndex 카운터를 변경마다 전체 재집계와 대조
+VERIFY_COUNTS = os.environ.get('TASK_INDEX_VERIFY') == '1'
+
+
+def create_task(text, quadrant, date, priority=1, note=""):
+    """새 할 일 dict 생성 (id는 uuid, 긴급/중요 여부는 사분면에서 결정)"""
+    urgent, important = QUADRANT_FLAGS[quadrant]
+    return {
+        "id": str(uuid.uuid4()),
+        "text": text,
+        "urgent": urgent,
+        "important": important,
+        "completed": False,
+        "date": str(date),
+        "quadrant": quadrant,
+        "priority": priority,
+        "note": note,
+        "created_at": datetime.now().strftime("%Y-%m-%d %H:%M")
+    }
+
+
+def to_date(value):
+    """'YYYY-MM-DD' 문자열 / date / datetime -> date"""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, Date):
+        return value
+    return Date.fromisoformat(str(value)[:10])
+
+
+# 사분면별로 할 일 하나가 세어지는 카운터 (완료 여부는 stat_keys에서 추가)
+QUADRANT_STAT_KEYS = {q: ('total', f"q{q}") + (('urgent',) if urgent else ())
+                      for q, (urgent, _) in QUADRANT_FLAGS.items()}
+
+
+def stat_keys(task):
+    """할 일 하나가 1씩 더해지는 STAT_KEYS 항목들"""
+    keys = QUADRANT_STAT_KEYS[task['quadrant']]
+    return keys + ('completed',) if task['completed'] else keys
+
+
+def period_bounds(day, period):
+    """day가 속한 주(월요일 시작)/월/분기/연도의 (시작일, 종료일)"""
+    day = to_date(day)
+    if period == 'week':
+        start = day - timedelta(days=day.weekday())
+        return start, start + timedelta(days=6)
+    if period == 'year':
+        return Date(day.year, 1, 1), Date(day.year, 12, 31)
+    months = {'month': 1, 'quarter': 3}[period]
+    first_month = (day.month - 1) // months * months + 1
+    start = Date(day.year, first_month, 1)
+    next_month = first_month + months
+    next_start = Date(day.year + 1, 1, 1) if next_month > 12 else Date(day.year, next_month, 1)
+    return start, next_start - timedelta(days=1)
+
+
+class DayFenwick:
+    """날짜별 카운터 벡터(STAT_KEYS 순서)의 구간 합을 구하는 Fenwick 트리
+
+    위치는 first_year 1월 1일부터의 일수이며, 날짜 하나의 갱신과 임의 구간 합 조회가 모두
+    O(log 일수)이다. 범위 밖 날짜는 covers()로 확인해 트리를 다시 만들어야 한다.
+    """
+
+    def __init__(self, day_counts, keys=STAT_KEYS):
+        self.keys = keys
+        days = [to_date(d) for d in day_counts]
+        first = min(days).year if days else Date.today().year
+        last = max(days).year if days else first
+        self.base = Date(first, 1, 1).toordinal() - 1
+        self.size = Date(last, 12, 31).toordinal() - self.base
+        tree = [[0] * len(keys) for _ in range(self.size + 1)]
+        for day, counts in zip(days, day_counts.values()):
+            row = tree[day.toordinal() - self.base]
+            for k, key in enumerate(keys):
+                row[k] += counts[key]
+        # 각 노드를 바로 위 노드에 더해 O(n)으로 구성
+        for i in range(1, self.size + 1):
+            j = i + (i & -i)
+            if j <= self.size:
+                parent = tree[j]
+                for k, value in enumerate(tree[i]):
+                    parent[k] += value
+        self.tree = tree
+
+    def covers(self, day):
+        return 0 < day.toordinal() - self.base <= self.size
+
+    def add(self, day, delta):
+        """day의 카운터에 delta(STAT_KEYS 순서 목록)를 더함"""
+        i = day.toordinal() - self.base
+        while i <= self.size:
+            row = self.tree[i]
+            for k, value in enumerate(delta):
+                row[k] += value
+            i += i & -i
+
+    def _prefix(self, i):
+        """1..i 위치의 합 (범위를 벗어난 i는 잘라냄)"""
+        total = [0] * len(self.keys)
+        i = min(max(i, 0), self.size)
+        while i > 0:
+            for k, value in enumerate(self.tree[i]):
+                total[k] += value
+            i -= i & -i
+        return total
+
+    def range_sum(self, start, end):
+        """start <= date <= end 구간의 카운터 합 {key: n}"""
+        high = self._prefix(to_date(end).toordinal() - self.base)
+        low = self._prefix(to_date(start).toordinal() - self.base - 1)
+        return {key: h - l for key, h, l in zip(self.keys, high, low)}
+
+
+class TaskIndex:
+    """id -> 할 일 사전과 날짜/사분면 보조 인덱스를 함께 관리 (추가/완료/삭제 시 증분 갱신)
+
+    인덱스들은 같은 dict 객체를 가리키므로 완료 상태 변경은 O(1)이며,
+    조회 결과는 등록 순서를 유지한다. 전체/날짜별 통계(total, completed, urgent)도
+    변경 시점에 누적 카운터로 갱신하므로 stats() 조회는 O(1)이다.
+    임의 날짜 구간의 합(range_stats)은 처음 조회할 때 만드는 Fenwick 트리로 구하고,
+    그 뒤로는 변경마다 트리도 함께 갱신한다.
+    날짜는 date 객체의 정렬 목록(dates, 사분면별 open_dates)으로도 관리해
+    구간 조회와 이월(미완료) 조회가 전체 스캔 없이 bisect로 해당 날짜 버킷만 읽는다.
+    verify=True이면 변경할 때마다 카운터와 인덱스를 전체 재집계와 비교한다 (테스트용).
+    """
+
+    def __init__(self, tasks=(), verify=VERIFY_COUNTS):
+        self.by_id = {}
+        self.by_date = defaultdict(dict)
+        self.by_quadrant = defaultdict(dict)
+        self.counts = dict.fromkeys(STAT_KEYS, 0)
+        self.day_counts = {}
+        # 할 일이 있는 날짜 (정렬된 date 목록), date <-> by_date 키
+        self.dates = []
+        self._date_keys = {}
+        self._key_dates = {}
+        # 사분면 -> {date: {id: 미완료 할 일}}, 사분면 -> 미완료 할 일이 있는 날짜 정렬 목록
+        self.open = defaultdict(dict)
+        self.open_dates = defaultdict(list)
+        self.verify = verify
+        self._fenwick = None
+        self._seq = {}
+        self._days = {}
+        self._next_seq = 0
+        for task in tasks:
+            self.add(task)
+
+    def __len__(self):
+        return len(self.by_id)
+
+    def __iter__(self):
+        return iter(self.by_id.values())
+
+    def add(self, task):
+        task_id = task['id']
+        day = self._key_dates.get(task['date'])
+        if day is None:
+            # 새 날짜일 때만 파싱해 정렬 목록에 삽입
+            day = self._key_dates[task['date']] = to_date(task['date'])
+            insort(self.dates, day)
+            self._date_keys[day] = task['date']
+        self.by_id[task_id] = task
+        self.by_date[task['date']][task_id] = task
+        self.by_quadrant[task['quadrant']][task_id] = task
+        self._seq[task_id] = self._next_seq
+        self._days[task_id] = day
+        self._next_seq += 1
+        if not task['completed']:
+            self._open(task)
+        self._count(task, 1)
+        if self.verify:
+            self.check_counts()
+
+    def get(self, task_id):
+        return self.by_id.get(task_id)
+
+    def set_completed(self, task_id, completed):
+        task = self.by_id.get(task_id)
+        if task is not None and task['completed'] != bool(completed):
+            self._count(task, -1)
+            task['completed'] = bool(completed)
+            self._count(task, 1)
+            if task['completed']:
+                self._close(task)
+            else:
+                self._open(task)
+            if self.verify:
+                self.check_counts()
+        return task
+
+    def delete(self, task_id):
+        task = self.by_id.pop(task_id, None)
+        if task is None:
+            return None
+        if not task['completed']:
+            self._close(task)
+        self._count(task, -1)
+        del self._seq[task_id]
+        day = self._days.pop(task_id)
+        for index, key in ((self.by_date, task['date']), (self.by_quadrant, task['quadrant'])):
+            bucket = index[key]
+            del bucket[task_id]
+            if not bucket:
+                del index[key]
+        if task['date'] not in self.by_date:
+            del self.dates[bisect_left(self.dates, day)]
+            del self._date_keys[day]
+            del self._key_dates[task['date']]
+        if self.verify:
+            self.check_counts()
+        return task
+
+    def delete_completed(self):
+        for task_id in [t['id'] for t in self.by_id.values() if t['completed']]:
+            self.delete(task_id)
+
+    def clear(self):
+        self.__init__(verify=self.verify)
+
+    def _open(self, task):
+        """미완료 인덱스에 추가 (그 사분면에 처음 나온 날짜면 정렬 목록에 삽입)"""
+        q, day = task['quadrant'], self._days[task['id']]
+        bucket = self.open[q].get(day)
+        if bucket is None:
+            bucket = self.open[q][day] = {}
+            insort(self.open_dates[q], day)
+        bucket[task['id']] = task
+
+    def _close(self, task):
+        """미완료 인덱스에서 제거 (날짜 버킷이 비면 정렬 목록에서도 제거)"""
+        q, day = task['quadrant'], self._days[task['id']]
+        bucket = self.open[q][day]
+        del bucket[task['id']]
+        if not bucket:
+            del self.open[q][day]
+            dates = self.open_dates[q]
+            del dates[bisect_left(dates, day)]
+
+    def _count(self, task, sign):
+        """task 하나만큼 전체/날짜별 카운터(와 Fenwick 트리)를 더하거나(sign=1) 뺌(sign=-1)"""
+        day = self.day_counts.setdefault(task['date'], dict.fromkeys(STAT_KEYS, 0))
+        keys = stat_keys(task)
+        for key in keys:
+            self.counts[key] += sign
+            day[key] += sign
+        if day['total'] == 0:
+            del self.day_counts[task['date']]
+        if self._fenwick is not None:
+            task_day = self._days[task['id']]
+            if self._fenwick.covers(task_day):
+                self._fenwick.add(task_day, [sign if key in keys else 0 for key in STAT_KEYS])
+            else:
+                # 트리 범위 밖 날짜: 다음 구간 조회 때 다시 만듦
+                self._fenwick = None
+
+    def stats(self, date=None):
+        """전체(date=None) 또는 날짜별 {total, completed, urgent, q1~q4} 카운터 (O(1))"""
+        if date is None:
+            return dict(self.counts)
+        return dict(self.day_counts.get(str(date), dict.fromkeys(STAT_KEYS, 0)))
+
+    def check_counts(self):
+        """카운터를 전체 재집계 결과와 비교해 다르면 AssertionError"""
+        counts = dict.fromkeys(STAT_KEYS, 0)
+        day_counts = {}
+        for task in self.by_id.values():
+            day = day_counts.setdefault(task['date'], dict.fromkeys(STAT_KEYS, 0))
+            for key in stat_keys(task):
+                counts[key] += 1
+                day[key] += 1
+        assert counts == self.counts, f"전체 통계 불일치: {self.counts} != {counts}"
+        assert day_counts == self.day_counts, "날짜별 통계 불일치"
+        if self._fenwick is not None:
+            for key, day in self._key_dates.items():
+                assert self._fenwick.range_sum(day, day) == day_counts[key], f"{key} 구간 합 불일치"
+        assert self.dates == sorted(to_date(d) for d in self.by_date), "날짜 목록 불일치"
+        open_ids = {t['id'] for t in self.by_id.values() if not t['completed']}
+        indexed = {task_id for days in self.open.values() for bucket in days.values() for task_id in bucket}
+        assert open_ids == indexed, "미완료 인덱스 불일치"
+        for q, days in self.open.items():
+            assert self.open_dates[q] == sorted(days), f"{q}사분면 미완료 날짜 목록 불일치"
+
+    def range_stats(self, start, end):
+        """start <= date <= end 구간의 카운터 합 (Fenwick 트리, O(log 일수))"""
+        if self._fenwick is None:
+            self._fenwick = DayFenwick({self._key_dates[key]: c for key, c in self.day_counts.items()})
+        return self._fenwick.range_sum(start, end)
+
+    def daily_stats(self, start, end):
+        """start <= date <= end 구간에서 할 일이 있는 날짜별 카운터 {date: {...}} (날짜순)"""
+        lo, hi = bisect_left(self.dates, to_date(start)), bisect_right(self.dates, to_date(end))
+        return {day: dict(self.day_counts[self._date_keys[day]]) for day in self.dates[lo:hi]}
+
+    def on_date(self, date):
+        return list(self.by_date.get(str(date), {}).values())
+
+    def in_quadrant(self, quadrant):
+        return list(self.by_quadrant.get(quadrant, {}).values())
+
+    def _by_seq(self, tasks):
+        return sorted(tasks, key=lambda t: self._seq[t['id']])
+
+    def in_range(self, start, end, quadrant=None):
+        """start <= date <= end 구간의 할 일 (날짜 목록을 bisect해 구간 안의 버킷만 읽음)"""
+        lo, hi = bisect_left(self.dates, to_date(start)), bisect_right(self.dates, to_date(end))
+        tasks = [t for day in self.dates[lo:hi] for t in self.by_date[self._date_keys[day]].values()
+                 if quadrant is None or t['quadrant'] == quadrant]
+        return self._by_seq(tasks)
+
+    def _open_between(self, start, end, quadrant):
+        tasks = []
+        for q in (QUADRANT_FLAGS if quadrant is None else [quadrant]):
+            dates = self.open_dates.get(q, [])
+            lo = 0 if start is None else bisect_left(dates, to_date(start))
+            hi = len(dates) if end is None else bisect_right(dates, to_date(end))
+            for day in dates[lo:hi]:
+                tasks.extend(self.open[q][day].values())
+        return tasks
+
+    def open_between(self, start=None, end=None, quadrant=None):
+        """start <= date <= end 구간의 미완료 할 일 (None이면 그쪽 끝이 열린 구간)"""
+        return self._by_seq(self._open_between(start, end, quadrant))
+
+    def visible(self, date, quadrant=None):
+        """해당 날짜의 할 일 + 이전 날짜의 미완료(이월) 할 일 (quadrant를 주면 그 사분면만)"""
+        day = to_date(date)
+        tasks = self._open_between(None, day - timedelta(days=1), quadrant)
+        today = self.by_date.get(self._date_keys.get(day), {}).values()
+        tasks.extend(t for t in today if quadrant is None or t['quadrant'] == quadrant)
+        return self._by_seq(tasks)
+
+
+class TaskStore:
+    """할 일 저장소 인터페이스. 모든 조회 결과는 등록 순서대로 정렬된 dict 리스트."""
+
+    def add(self, task):
+        raise NotImplementedError
+
+    def set_completed(self, task_id, completed):
+        raise NotImplementedError
+
+    def delete(self, task_id):
+        raise NotImplementedError
+
+    def delete_completed(self):
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+    def load(self, date=None, quadrant=None, limit=None):
+        """date가 없으면 전체, 있으면 그 날짜의 할 일과 이전 미완료 할 일만 조회 (quadrant로 사분면 한정)
+
+        limit을 주면 등록 순서상 앞쪽 limit개만 읽는다 (화면에 보이는 창만 조회할 때).
+        """
+        raise NotImplementedError
+
+    def load_range(self, start, end, quadrant=None):
+        """start <= date <= end 구간의 할 일 조회"""
+        raise NotImplementedError
+
+    def load_open(self, start=None, end=None, quadrant=None):
+        """start <= date <= end 구간의 미완료 할 일 조회 (None이면 그쪽 끝이 열린 구간)"""
+        raise NotImplementedError
+
+    def day_stats(self, start, end):
+        """구간에서 할 일이 있는 날짜별 STAT_KEYS 카운터 {date: {...}} (할 일 목록은 읽지 않음)"""
+        raise NotImplementedError
+
+    def range_stats(self, start, end):
+        """구간 전체의 STAT_KEYS 카운터 합"""
+        raise NotImplementedError
+
+
+class MemoryStore(TaskStore):
+    """프로세스 메모리에만 보관하는 저장소 (테스트/단일 프로세스용)
+
+    st.cache_resource로 여러 세션 스레드가 함께 쓰므로 TaskIndex 조회/변경은 잠금으로 보호한다.
+    """
+
+    def __init__(self):
+        self.index = TaskIndex()
+        self._lock = threading.Lock()
+
+    def add(self, task):
+        with self._lock:
+            self.index.add(dict(task))
+
+    def set_completed(self, task_id, completed):
+        with self._lock:
+            self.index.set_completed(task_id, completed)
+
+    def delete(self, task_id):
+        with self._lock:
+            self.index.delete(task_id)
+
+    def delete_completed(self):
+        with self._lock:
+            self.index.delete_completed()
+
+    def clear(self):
+        with self._lock:
+            self.index.clear()
+
+    def load(self, date=None, quadrant=None, limit=None):
+        with self._lock:
+            if date is None:
+                tasks = self.index if quadrant is None else self.index.in_quadrant(quadrant)
+            else:
+                tasks = self.index.visible(date, quadrant)
+            return [dict(t) for t in islice(tasks, limit)]
+
+    def load_range(self, start, end, quadrant=None):
+        with self._lock:
+            return [dict(t) for t in self.index.in_range(start, end, quadrant)]
+
+    def load_open(self, start=None, end=None, quadrant=None):
+        with self._lock:
+            return [dict(t) for t in self.index.open_between(start, end, quadrant)]
+
+    def day_stats(self, start, end):
+        with self._lock:
+            return self.index.daily_stats(start, end)
+
+    def range_stats(self, start, end):
+        with self._lock:
+            # 첫 구간 조회 때 Fenwick 트리를 만들므로 조회도 잠금 안에서
+            return self.index.range_stats(start, end)
+
+
+class SQLiteStore(TaskStore):
+    """SQLite(WAL) 저장소. 여러 Streamlit 워커 프로세스가 같은 파일을 공유할 수 있다.
+
+    한 파일에 여러 사용자의 할 일이 함께 저장되며, 모든 조회/변경/날짜별 집계는
+    생성할 때 준 owner의 행으로 한정된다 (초기화나 완료 항목 삭제도 그 사용자 것만).
+    """
+
+    def __init__(self, path, owner=''):
+        self.path = path
+        self.owner = owner
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS tasks (
+                    id TEXT PRIMARY KEY,
+                    text TEXT NOT NULL,
+                    quadrant INTEGER NOT NULL,
+                    completed INTEGER NOT NULL DEFAULT 0,
+                    date TEXT NOT NULL,
+                    priority INTEGER NOT NULL DEFAULT 1,
+                    note TEXT NOT NULL DEFAULT '',
+                    created_at TEXT NOT NULL,
+                    owner TEXT NOT NULL DEFAULT ''
+                )
+            """)
+            if 'owner' not in {row['name'] for row in conn.execute("PRAGMA table_info(tasks)")}:
+                # 소유자 구분 이전에 만든 DB: 기존 할 일은 빈 소유자('')로 남김
+                conn.execute("ALTER TABLE tasks ADD COLUMN owner TEXT NOT NULL DEFAULT ''")
+            for old in ('idx_tasks_date', 'idx_tasks_quadrant', 'idx_tasks_completed', 'idx_tasks_open_date'):
+                conn.execute(f"DROP INDEX IF EXISTS {old}")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_owner_date ON tasks(owner, date)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_owner_quadrant ON tasks(owner, quadrant)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_owner_completed ON tasks(owner, completed)")
+            # 이월 조회(date < ? AND completed = 0)용: 미완료 할 일만 날짜순으로 담는 부분 인덱스
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_owner_open_date ON tasks(owner, quadrant, date) "
+                         "WHERE completed = 0")
+            self._create_day_table(conn)
+
+    @staticmethod
+    def _create_day_table(conn):
+        """(소유자, 날짜)별 집계 테이블 task_days와 이를 갱신하는 트리거 생성 (기존 DB는 한 번 채움)"""
+        columns = {row['name'] for row in conn.execute("PRAGMA table_info(task_days)")}
+        if columns and 'owner' not in columns:
+            # 소유자 구분 이전의 집계 테이블/트리거는 지우고 아래에서 다시 만들어 채움
+            conn.execute("DROP TABLE task_days")
+            for event in ('insert', 'delete', 'update'):
+                conn.execute(f"DROP TRIGGER IF EXISTS task_days_{event}")
+        conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS task_days (
+                owner TEXT NOT NULL DEFAULT '',
+                date TEXT NOT NULL,
+                {', '.join(f'{key} INTEGER NOT NULL DEFAULT 0' for key in STAT_KEYS)},
+                PRIMARY KEY (owner, date)
+            )
+        """)
+        urgent = ', '.join(str(q) for q, (is_urgent, _) in QUADRANT_FLAGS.items() if is_urgent)
+
+        def adjust(row, op):
+            # 할 일 한 행(NEW/OLD)만큼 해당 날짜의 카운터를 더하거나 뺌
+            values = {'total': '1', 'completed': f'{row}.completed', 'urgent': f'({row}.quadrant IN ({urgent}))'}
+            values.update({f"q{q}": f'({row}.quadrant = {q})' for q in QUADRANT_FLAGS})
+            sets = ', '.join(f'{key} = {key} {op} {values[key]}' for key in STAT_KEYS)
+            return f"UPDATE task_days SET {sets} WHERE owner = {row}.owner AND date = {row}.date;"
+
+        add = "INSERT OR IGNORE INTO task_days (owner, date) VALUES (NEW.owner, NEW.date); " + adjust('NEW', '+')
+        remove = adjust('OLD', '-') + " DELETE FROM task_days WHERE owner = OLD.owner AND date = OLD.date AND total = 0;"
+        conn.execute(f"CREATE TRIGGER IF NOT EXISTS task_days_insert AFTER INSERT ON tasks BEGIN {add} END")
+        conn.execute(f"CREATE TRIGGER IF NOT EXISTS task_days_delete AFTER DELETE ON tasks BEGIN {remove} END")
+        conn.execute(f"CREATE TRIGGER IF NOT EXISTS task_days_update AFTER UPDATE OF completed, date, quadrant, owner ON tasks "
+                     f"BEGIN {remove} {add} END")
+        if conn.execute("SELECT 1 FROM task_days LIMIT 1").fetchone() is None:
+            sums = ', '.join(f'SUM({expr})' for expr in
+                             ['1', 'completed', f'quadrant IN ({urgent})'] + [f'quadrant = {q}' for q in QUADRANT_FLAGS])
+            conn.execute(f"INSERT OR IGNORE INTO task_days SELECT owner, date, {sums} FROM tasks GROUP BY owner, date")
+
+    def _connect(self):
+        # 호출마다 연결을 열어 스레드(세션) 간 연결 공유 문제를 피함
+        conn = sqlite3.connect(self.path, timeout=10)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _execute(self, sql, params=()):
+        with closing(self._connect()) as conn, conn:
+            conn.execute(sql, params)
+
+    def _query(self, sql, params=()):
+        with closing(self._connect()) as conn:
+            return [self._to_task(row) for row in conn.execute(sql, params)]
+
+    @staticmethod
+    def _to_task(row):
+        task = dict(row)
+        task['completed'] = bool(task['completed'])
+        task['urgent'], task['important'] = QUADRANT_FLAGS[task['quadrant']]
+        return task
+
+    def add(self, task):
+        self._execute(
+            f"INSERT INTO tasks ({TASK_COLUMNS}, owner) VALUES ({', '.join('?' * (len(TASK_FIELDS) + 1))})",
+            [int(task[f]) if f == 'completed' else task.get(f, '') for f in TASK_FIELDS] + [self.owner]
+        )
+
+    def set_completed(self, task_id, completed):
+        self._execute("UPDATE tasks SET completed = ? WHERE id = ? AND owner = ?", (int(completed), task_id, self.owner))
+
+    def delete(self, task_id):
+        self._execute("DELETE FROM tasks WHERE id = ? AND owner = ?", (task_id, self.owner))
+
+    def delete_completed(self):
+        self._execute("DELETE FROM tasks WHERE owner = ? AND completed = 1", (self.owner,))
+
+    def clear(self):
+        self._execute("DELETE FROM tasks WHERE owner = ?", (self.owner,))
+
+    def load(self, date=None, quadrant=None, limit=None):
+        where, params = ["owner = ?"], [self.owner]
+        if date is not None:
+            where.append("(date = ? OR (date < ? AND completed = 0))")
+            params += [str(date), str(date)]
+        if quadrant is not None:
+            where.append("quadrant = ?")
+            params.append(quadrant)
+        sql = f"SELECT {TASK_COLUMNS} FROM tasks WHERE {' AND '.join(where)} ORDER BY rowid"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return self._query(sql, params)
+
+    def load_range(self, start, end, quadrant=None):
+        sql = f"SELECT {TASK_COLUMNS} FROM tasks WHERE owner = ? AND date BETWEEN ? AND ?"
+        params = [self.owner, str(start), str(end)]
+        if quadrant is not None:
+            sql += " AND quadrant = ?"
+            params.append(quadrant)
+        return self._query(sql + " ORDER BY rowid", params)
+
+    def day_stats(self, start, end):
+        with closing(self._connect()) as conn:
+            rows = conn.execute("SELECT * FROM task_days WHERE owner = ? AND date BETWEEN ? AND ? ORDER BY date",
+                                (self.owner, str(start), str(end)))
+            return {to_date(row['date']): {key: row[key] for key in STAT_KEYS} for row in rows}
+
+    def range_stats(self, start, end):
+        with closing(self._connect()) as conn:
+            row = conn.execute(f"SELECT {', '.join(f'SUM({key})' for key in STAT_KEYS)} FROM task_days "
+                               "WHERE owner = ? AND date BETWEEN ? AND ?", (self.owner, str(start), str(end))).fetchone()
+        return {key: value or 0 for key, value in zip(STAT_KEYS, row)}
+
+    def load_open(self, start=None, end=None, quadrant=None):
+        where, params = ["owner = ?", "completed = 0"], [self.owner]
+        if start is not None:
+            where.append("date >= ?")
+            params.append(str(start))
+        if end is not None:
+            where.append("date <= ?")
+            params.append(str(end))
+        if quadrant is not None:
+            where.append("quadrant = ?")
+            params.append(quadrant)
+        return self._query(f"SELECT {TASK_COLUMNS} FROM tasks WHERE {' AND '.join(where)} ORDER BY rowid", params)
+
+
+BACKENDS = {
+    'sqlite': lambda name, owner: SQLiteStore(os.path.join(DB_DIR, f"{name}.sqlite3"), owner),
+    'memory': lambda name, owner: MemoryStore(),
+}
+
+
+def open_store(name, owner='', backend=DEFAULT_BACKEND):
+    """앱 이름별 저장소 생성 (backend: 'sqlite' | 'memory'). 조회/변경은 owner의 할 일로 한정
+
+    memory 저장소는 인스턴스마다 따로이므로 호출하는 쪽에서 owner별로 하나씩 유지한다.
+    """
+    return BACKENDS[backend](name, owner)
@@ -0,0 +1,131 @@
+import re
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+# 전남 및 전국 데이터 컬럼 (기존 컬럼명 기준)
+TARGET_COLS = {
+    '인명': '인명피해 규모 전국(전남)_명',
+    '재산': '재산피해규모 전국(전남)_억 원',
+    '복구': '복구액 전국(전남)_억 원'
+}
+
+# "전국(전남)" 형식을 한 번에 분리하는 패턴 (예: 15(2) -> 전국 15, 전남 2)
+DAMAGE_PATTERN = r'(?s)^(?P<national>\d+\.?\d*)?(?:.*?\((?P<jeonnam>\d+\.?\d*)\))?'
+
+
+def parse_val(text, data_type='jeonnam'):
+    """셀 하나를 파싱하는 기존 방식 (비교/검증용)"""
+    if pd.isna(text): return 0.0
+    text = str(text).replace(',', '').strip()
+
+    if data_type == 'jeonnam':
+        # 가로 안의 숫자 추출 (예: 15(2) -> 2)
+        match = re.search(r'\((\d+\.?\d*)\)', text)
+        return float(match.group(1)) if match else 0.0
+    else:
+        # 가로 앞의 숫자 추출 (예: 15(2) -> 15)
+        match = re.search(r'^(\d+\.?\d*)', text)
+        return float(match.group(1)) if match else 0.0
+
+
+def parse_damage_column(series):
+    """'전국(전남)' 컬럼을 한 번의 벡터 연산으로 (전국, 전남) float64 컬럼으로 분리"""
+    # 콤마 제거/공백 정리/정규식 추출을 모두 Arrow(RE2) 커널에서 처리
+    text = pa.array(series.astype(str), type=pa.large_string())
+    text = pc.utf8_trim_whitespace(pc.replace_substring(text, ',', ''))
+    parts = pc.extract_regex(text, DAMAGE_PATTERN)
+    missing = pa.array(series.isna().to_numpy())
+
+    def to_float(name):
+        values = parts.field(name)
+        values = pc.if_else(pc.equal(values, ''), None, values)
+        values = pc.fill_null(pc.cast(values, pa.float64()), 0.0)
+        # 결측 셀은 기존 parse_val과 동일하게 0.0 처리
+        values = pc.if_else(missing, 0.0, values).to_numpy(zero_copy_only=False, writable=True)
+        return pd.Series(values, index=series.index, dtype='float64')
+
+    return to_float('national'), to_float('jeonnam')
+
+
+def add_damage_columns(df):
+    """전남/전국 수치 컬럼(인명_전남, 인명_전국 ...)을 df에 추가"""
+    for key, col in TARGET_COLS.items():
+        if col in df.columns:
+            national, jeonnam = parse_damage_column(df[col])
+            df[f'{key}_전남'] = jeonnam
+            df[f'{key}_전국'] = national
+    return df
+
+
+# 연도 구간 합계를 미리 누적해 두는 지표 (건수와 상관계수용 제곱합 포함)
+CUBE_METRICS = ['인명_전남', '재산_전남', '복구_전남', '재산_전국', '비중']
+
+
+def build_year_cube(df):
+    """연도별 집계표와 누적합(prefix sum)을 미리 계산해 두는 조회용 구조
+
+    임의의 (시작, 끝) 연도 구간에 대해 KPI 합계와 상관계수는 O(1),
+    연도별 시계열과 원본 행은 슬라이싱으로 얻는다.
+    반환값: {'years', 'yearly', 'prefix', 'rows', 'row_start'}
+    """
+    rows = df.sort_values('연도', kind='stable').reset_index(drop=True)
+    # 전국 대비 전남 재산피해 비중 (요청마다 슬라이스를 수정하지 않도록 로드 시 계산)
+    rows['비중'] = (rows['재산_전남'] / rows['재산_전국'] * 100).fillna(0)
+
+    x, y = rows['재산_전남'], rows['복구_전남']
+    sums = rows[CUBE_METRICS].assign(
+        건수=1, sx=x, sy=y, sxx=x * x, syy=y * y, sxy=x * y
+    )
+    yearly = sums.groupby(rows['연도']).sum()
+    prefix = np.vstack([np.zeros(yearly.shape[1]), np.cumsum(yearly.to_numpy(dtype='float64'), axis=0)])
+
+    years = yearly.index.to_numpy()
+    # 연도별 첫 행 위치 (rows는 연도순 정렬)
+    row_start = np.concatenate([[0], np.cumsum(yearly['건수'].to_numpy())])
+    return {
+        'years': years,
+        'yearly': yearly.reset_index(),
+        'prefix': pd.DataFrame(prefix, columns=yearly.columns),
+        'rows': rows,
+        'row_start': row_start,
+    }
+
+
+def _year_bounds(cube, start, end):
+    """[start, end] 연도 구간에 해당하는 연도 위치 (lo, hi) (hi는 미포함)"""
+    years = cube['years']
+    return np.searchsorted(years, start, side='left'), np.searchsorted(years, end, side='right')
+
+
+def range_totals(cube, start, end):
+    """구간 합계 {지표: 합} (누적합 차이로 계산)"""
+    lo, hi = _year_bounds(cube, start, end)
+    prefix = cube['prefix']
+    return (prefix.iloc[hi] - prefix.iloc[lo]).to_dict()
+
+
+def range_yearly(cube, start, end):
+    """구간의 연도별 합계표"""
+    lo, hi = _year_bounds(cube, start, end)
+    return cube['yearly'].iloc[lo:hi]
+
+
+def range_rows(cube, start, end):
+    """구간의 원본 행 (태풍 단위)"""
+    lo, hi = _year_bounds(cube, start, end)
+    return cube['rows'].iloc[cube['row_start'][lo]:cube['row_start'][hi]]
+
+
+def range_corr(cube, start, end):
+    """재산피해(전남)와 복구액(전남)의 피어슨 상관계수 (표본이 부족하거나 분산이 0이면 NaN)"""
+    t = range_totals(cube, start, end)
+    n = t['건수']
+    cov = n * t['sxy'] - t['sx'] * t['sy']
+    var_x = n * t['sxx'] - t['sx'] ** 2
+    var_y = n * t['syy'] - t['sy'] ** 2
+    if n < 2 or var_x <= 0 or var_y <= 0:
+        return float('nan')
+    return float(cov / np.sqrt(var_x * var_y))
@@ -1,9 +1,13 @@
 import streamlit as st
-import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-import re
 import os
+import importlib.util
+
+from csv_loader import read_csv_auto
+from fig_cache import FigureCache, dataset_hash
+from shared_frame import enable_copy_on_write, session_view
+from teapung_core import add_damage_columns, build_year_cube, range_corr, range_rows, range_totals, range_yearly
 
 # [1. 페이지 기본 설정]
 st.set_page_config(
@@ -13,8 +17,12 @@ st.set_page_config(
 )
 
 # [2. 데이터 로드 및 전처리]
-@st.cache_data
+# 로드한 프레임은 모든 세션이 같은 객체를 공유하므로 수정 시 복사되도록 Copy-on-Write 사용
+enable_copy_on_write()
+
+@st.cache_resource
 def load_data():
+    """파싱된 원본 + 전남/전국 수치 컬럼 (세션 간 공유, 읽기 전용. 파생 컬럼은 로드 시 계산)"""
     # 파일명 확인 (업로드된 파일명과 정확히 일치해야 함)
     file_name = '전라남도_연도별 태풍피해 현황_20251104.csv'
     
@@ -22,144 +30,198 @@ def load_data():
         return None
 
     try:
-        # 한글 인코딩 문제 해결 (cp949 또는 utf-8-sig)
-        try:
-            df = pd.read_csv(file_name, encoding='utf-8-sig')
-        except:
-            df = pd.read_csv(file_name, encoding='cp949')
-
-        # 데이터 클렌징 함수 (더 견고한 파싱 로직)
-        def parse_val(text, data_type='jeonnam'):
-            if pd.isna(text): return 0.0
-            text = str(text).replace(',', '').strip()
-            
-            if data_type == 'jeonnam':
-                # 가로 안의 숫자 추출 (예: 15(2) -> 2)
-                match = re.search(r'\((\d+\.?\d*)\)', text)
-                return float(match.group(1)) if match else 0.0
-            else:
-                # 가로 앞의 숫자 추출 (예: 15(2) -> 15)
-                match = re.search(r'^(\d+\.?\d*)', text)
-                return float(match.group(1)) if match else 0.0
-
-        # 전남 및 전국 데이터 컬럼 생성 (기존 컬럼명 기준)
-        target_cols = {
-            '인명': '인명피해 규모 전국(전남)_명',
-            '재산': '재산피해규모 전국(전남)_억 원',
-            '복구': '복구액 전국(전남)_억 원'
-        }
-
-        for key, col in target_cols.items():
-            if col in df.columns:
-                df[f'{key}_전남'] = df[col].apply(lambda x: parse_val(x, 'jeonnam'))
-                df[f'{key}_전국'] = df[col].apply(lambda x: parse_val(x, 'national'))
+        # 한글 인코딩 자동 판별 후 한 번만 파싱 (utf-8-sig / utf-8 / cp949)
+        df, encoding = read_csv_auto(file_name)
+        if df is None:
+            st.error("파일 인코딩을 판별할 수 없습니다.")
+            return None
+        df.attrs['encoding'] = encoding
+
+        # 전남 및 전국 데이터 컬럼 생성 (벡터화된 단일 패스 파싱)
+        df = add_damage_columns(df)
         
         return df
     except Exception as e:
         st.error(f"데이터 처리 중 오류 발생: {e}")
         return None
 
-df = load_data()
+# statsmodels가 있을 때만 OLS 추세선 사용
+TRENDLINE = "ols" if importlib.util.find_spec("statsmodels") else None
+# 차트 템플릿 (figure 캐시 키에 포함)
+THEME = "plotly"
+
+@st.cache_resource
+def load_cube():
+    """연도별 집계/누적합 구조 (세션 간 공유, 읽기 전용)"""
+    df = load_data()
+    if df is None:
+        return None
+    cube = build_year_cube(df)
+    cube['hash'] = dataset_hash(df)
+    return cube
+
+@st.cache_resource
+def get_figure_cache():
+    """전체 세션이 공유하는 차트 JSON LRU 캐시 (FIG_CACHE_MAX_MB로 용량 설정)"""
+    return FigureCache()
+
+def cached_figure(name, start, end, build):
+    """(데이터셋 해시, 차트, 연도 구간, 테마) 단위로 캐시된 figure 반환"""
+    cube = load_cube()
+    cache = get_figure_cache()
+    key = cache.make_key(cube['hash'], name, (start, end), THEME)
+    return cache.get_figure(key, lambda: build(cube, start, end))
+
+# [연도 구간별 차트 생성 함수]
+def yearly_figure(cube, start, end):
+    # 연도별 합계 데이터는 미리 계산된 표를 슬라이싱
+    yearly_sum = range_yearly(cube, start, end)
+    
+    fig1 = go.Figure()
+    fig1.add_trace(go.Bar(x=yearly_sum['연도'], y=yearly_sum['재산_전남'], name='재산피해(억)', marker_color='#E74C3C'))
+    fig1.add_trace(go.Scatter(x=yearly_sum['연도'], y=yearly_sum['복구_전남'], name='복구액(억)', line=dict(color='#3498DB', width=3)))
+    fig1.update_layout(
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        hovermode="x unified",
+        xaxis_title="연도",
+        yaxis_title="금액 (억 원)",
+        template=THEME
+    )
+    return fig1
+
+def top10_figure(cube, start, end):
+    top10 = range_rows(cube, start, end).nlargest(10, '재산_전남')
+    fig2 = px.bar(
+        top10, x='재산_전남', y='태풍명', orientation='h', 
+        color='재산_전남', color_continuous_scale='Reds',
+        labels={'재산_전남':'재산피해(억 원)', '태풍명':'태풍 이름'},
+        text_auto='.1f', template=THEME
+    )
+    fig2.update_layout(yaxis={'categoryorder':'total ascending'})
+    return fig2
+
+def share_figure(cube, start, end):
+    fig3 = px.line(
+        range_rows(cube, start, end), x='연도', y='비중', markers=True, text='태풍명',
+        hover_data=['재산_전남', '재산_전국'],
+        title="태풍 발생 시 전국 피해 규모 대비 전남 비중", template=THEME
+    )
+    fig3.update_traces(textposition="top center")
+    return fig3
+
+def corr_figure(cube, start, end):
+    # statsmodels가 없으면 추세선 없이 생성
+    f_df = range_rows(cube, start, end)
+    if TRENDLINE:
+        return px.scatter(
+            f_df, x='재산_전남', y='복구_전남', trendline=TRENDLINE,
+            size='인명_전남', hover_name='태풍명', color='연도',
+            labels={'재산_전남': '재산피해(억)', '복구_전남': '복구액(억)'},
+            title="피해 규모와 복구 비용의 선형 관계", template=THEME
+        )
+    return px.scatter(f_df, x='재산_전남', y='복구_전남', size='인명_전남', hover_name='태풍명', template=THEME)
+
+# [분석 섹션 렌더링 함수 (선택된 섹션만 호출 가능)]
+def render_timeseries(cube, start, end):
+    st.subheader("연도별 피해 규모 변화 추이")
+    st.plotly_chart(cached_figure('yearly', start, end, yearly_figure), use_container_width=True)
+
+def render_ranking(cube, start, end):
+    st.subheader("가장 피해가 컸던 태풍 TOP 10 (전남 기준)")
+    st.plotly_chart(cached_figure('top10', start, end, top10_figure), use_container_width=True)
+
+def render_share(cube, start, end):
+    st.subheader("전국 피해액 중 전라남도 피해 비중 (%)")
+    st.plotly_chart(cached_figure('share', start, end, share_figure), use_container_width=True)
+    
+    totals = range_totals(cube, start, end)
+    avg_share = totals['비중'] / totals['건수']
+    st.info(f"선택 기간 내 전남 지역의 평균 재산 피해 비중은 약 **{avg_share:.2f}%** 입니다.")
+
+def render_correlation(cube, start, end):
+    st.subheader("재산 피해액과 복구비의 상관관계")
+    if not TRENDLINE:
+        st.warning("상관 분석 추세선을 보려면 `pip install statsmodels` 설치가 필요합니다.")
+    st.plotly_chart(cached_figure('corr', start, end, corr_figure), use_container_width=True)
+    
+    if TRENDLINE:
+        corr = range_corr(cube, start, end)
+        st.success(f"두 변수 간의 상관계수는 **{corr:.2f}**입니다. (1에 가까울수록 피해액만큼 복구비가 비례하여 발생함을 의미)")
+
+def render_detail(cube, start, end):
+    f_df = range_rows(cube, start, end)
+    st.dataframe(f_df[['연도', '태풍명', '발생기간', '인명_전남', '재산_전남', '복구_전남']].sort_values('연도', ascending=False))
+
+SECTIONS = {
+    "📅 시계열 추이": render_timeseries,
+    "🥇 피해 순위": render_ranking,
+    "⚖️ 전국 대비 비중": render_share,
+    "📈 상관관계 분석": render_correlation
+}
+DETAIL_TITLE = "📝 상세 데이터 리스트 (전라남도 수치 추출 결과)"
+
+# 공유 프레임의 세션용 뷰 (데이터 복사 없음)
+df = session_view(load_data())
 
 # [3. 대시보드 UI 구성]
 if df is not None:
     st.title("🌪️ 전라남도 연도별 태풍 피해 대시보드")
     
+    cube = load_cube()
+    
     # 사이드바: 연도 필터
     with st.sidebar:
         st.header("📊 분석 설정")
-        years = sorted(df['연도'].unique())
+        years = cube['years'].tolist()
         selected_years = st.select_slider(
             "분석 기간 선택", 
             options=years, 
             value=(min(years), max(years))
         )
         
+        # 켜면 선택한 분석 하나만 계산/렌더링 (첫 화면 표시 시간 단축)
+        lazy_mode = st.toggle("⚡ 선택한 분석만 계산", value=True, key="lazy_mode")
+        
+        st.caption(f"인코딩: {df.attrs.get('encoding', '알 수 없음')}")
         st.divider()
         st.info("💡 **실행 가이드**\n\nVS Code 터미널에서 아래 명령어를 입력하세요:\n`streamlit run typhoon_dashboard.py`")
 
-    # 선택된 연도 데이터 필터링
-    f_df = df[(df['연도'] >= selected_years[0]) & (df['연도'] <= selected_years[1])]
+    # 선택된 연도 구간 (합계는 누적합 차이로 O(1) 계산)
+    start, end = int(selected_years[0]), int(selected_years[1])
+    totals = range_totals(cube, start, end)
 
     # 상단 주요 지표 (KPI)
     c1, c2, c3, c4 = st.columns(4)
     with c1:
-        st.metric("총 태풍 횟수", f"{len(f_df)}건")
+        st.metric("총 태풍 횟수", f"{int(totals['건수'])}건")
     with c2:
-        st.metric("총 인명 피해(전남)", f"{int(f_df['인명_전남'].sum()):,}명")
+        st.metric("총 인명 피해(전남)", f"{int(totals['인명_전남']):,}명")
     with c3:
-        st.metric("총 재산 피해(전남)", f"{f_df['재산_전남'].sum():,.1f}억")
+        st.metric("총 재산 피해(전남)", f"{totals['재산_전남']:,.1f}억")
     with c4:
-        st.metric("총 복구액(전남)", f"{f_df['복구_전남'].sum():,.1f}억")
+        st.metric("총 복구액(전남)", f"{totals['복구_전남']:,.1f}억")
 
     st.divider()
 
-    # 4가지 분석 탭
-    t1, t2, t3, t4 = st.tabs(["📅 시계열 추이", "🥇 피해 순위", "⚖️ 전국 대비 비중", "📈 상관관계 분석"])
-
-    with t1:
-        st.subheader("연도별 피해 규모 변화 추이")
-        # 연도별 합계 데이터 계산
-        yearly_sum = f_df.groupby('연도').agg({'재산_전남':'sum', '복구_전남':'sum', '인명_전남':'sum'}).reset_index()
-        
-        fig1 = go.Figure()
-        fig1.add_trace(go.Bar(x=yearly_sum['연도'], y=yearly_sum['재산_전남'], name='재산피해(억)', marker_color='#E74C3C'))
-        fig1.add_trace(go.Scatter(x=yearly_sum['연도'], y=yearly_sum['복구_전남'], name='복구액(억)', line=dict(color='#3498DB', width=3)))
-        fig1.update_layout(
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-            hovermode="x unified",
-            xaxis_title="연도",
-            yaxis_title="금액 (억 원)"
-        )
-        st.plotly_chart(fig1, use_container_width=True)
-
-    with t2:
-        st.subheader("가장 피해가 컸던 태풍 TOP 10 (전남 기준)")
-        top10 = f_df.sort_values('재산_전남', ascending=False).head(10)
-        fig2 = px.bar(
-            top10, x='재산_전남', y='태풍명', orientation='h', 
-            color='재산_전남', color_continuous_scale='Reds',
-            labels={'재산_전남':'재산피해(억 원)', '태풍명':'태풍 이름'},
-            text_auto='.1f'
-        )
-        fig2.update_layout(yaxis={'categoryorder':'total ascending'})
-        st.plotly_chart(fig2, use_container_width=True)
-
-    with t3:
-        st.subheader("전국 피해액 중 전라남도 피해 비중 (%)")
-        f_df['비중'] = (f_df['재산_전남'] / f_df['재산_전국'] * 100).fillna(0)
-        
-        fig3 = px.line(
-            f_df, x='연도', y='비중', markers=True, text='태풍명',
-            hover_data=['재산_전남', '재산_전국'],
-            title="태풍 발생 시 전국 피해 규모 대비 전남 비중"
-        )
-        fig3.update_traces(textposition="top center")
-        st.plotly_chart(fig3, use_container_width=True)
-        
-        avg_share = f_df['비중'].mean()
-        st.info(f"선택 기간 내 전남 지역의 평균 재산 피해 비중은 약 **{avg_share:.2f}%** 입니다.")
-
-    with t4:
-        st.subheader("재산 피해액과 복구비의 상관관계")
-        try:
-            fig4 = px.scatter(
-                f_df, x='재산_전남', y='복구_전남', trendline="ols",
-                size='인명_전남', hover_name='태풍명', color='연도',
-                labels={'재산_전남': '재산피해(억)', '복구_전남': '복구액(억)'},
-                title="피해 규모와 복구 비용의 선형 관계"
-            )
-            st.plotly_chart(fig4, use_container_width=True)
-            
-            corr = f_df['재산_전남'].corr(f_df['복구_전남'])
-            st.success(f"두 변수 간의 상관계수는 **{corr:.2f}**입니다. (1에 가까울수록 피해액만큼 복구비가 비례하여 발생함을 의미)")
-        except:
-            st.warning("상관 분석 추세선을 보려면 `pip install statsmodels` 설치가 필요합니다.")
-            fig4 = px.scatter(f_df, x='재산_전남', y='복구_전남', size='인명_전남', hover_name='태풍명')
-            st.plotly_chart(fig4, use_container_width=True)
-
-    with st.expander("📝 상세 데이터 리스트 (전라남도 수치 추출 결과)"):
-        st.dataframe(f_df[['연도', '태풍명', '발생기간', '인명_전남', '재산_전남', '복구_전남']].sort_values('연도', ascending=False))
+    if lazy_mode:
+        # 선택된 섹션만 실행하고 나머지는 선택 시점에 계산
+        section = st.radio("분석 선택", list(SECTIONS) + [DETAIL_TITLE], horizontal=True, label_visibility="collapsed")
+        (SECTIONS.get(section) or render_detail)(cube, start, end)
+    else:
+        # 4가지 분석 탭 (모든 탭을 한 번에 계산)
+        tabs = st.tabs(list(SECTIONS))
+        for tab, render in zip(tabs, SECTIONS.values()):
+            with tab:
+                render(cube, start, end)
+
+        with st.expander(DETAIL_TITLE):
+            render_detail(cube, start, end)
+
+    # 차트 캐시 적중/미스 현황
+    with st.sidebar:
+        fig_stats = get_figure_cache().stats()
+        st.caption(f"차트 캐시: 적중 {fig_stats['hits']} · 미스 {fig_stats['misses']} · "
+                   f"{fig_stats['entries']}개 ({fig_stats['bytes'] / 2**20:.1f}/{fig_stats['max_bytes'] / 2**20:.0f}MB)")
 
 else:
     st.error("데이터 파일을 로드할 수 없습니다.")
@@ -0,0 +1,76 @@
+"""일괄 회귀(forecast_all)가 시계열별 np.polyfit과 같은 기울기/절편/예측값을 내는지 확인"""
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from budongsan_core import compact_frame, load_price_data, time_index
+from budongsan_forecast import TARGET_YEAR, forecast_all
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def make_series(points, seed=0):
+    """{(지역, 규모): [(연도, 월), ...]} -> 정규화된 프레임 (평당가는 추세 + 잡음)"""
+    rng = np.random.default_rng(seed)
+    rows = [(region, size, year, month) for (region, size), months in points.items() for year, month in months]
+    df = pd.DataFrame(rows, columns=['지역명', '규모구분', '연도', '월'])
+    df['분양가격'] = 3000 + (df['연도'] - 2000) * 120 + rng.normal(0, 300, len(df))
+    df['날짜'] = pd.to_datetime(dict(year=df['연도'], month=df['월'], day=1))
+    df['평당가'] = df['분양가격'] * 3.3
+    return compact_frame(df)
+
+
+def assert_matches_polyfit(df, table):
+    for (region, size), fc in table.iterrows():
+        series = df[(df['지역명'] == region) & (df['규모구분'] == size)]
+        y = series['평당가'].to_numpy(dtype='float64')
+        slope, intercept = np.polyfit(time_index(series), y, 1)
+        # 가격이 일정한 시계열은 기울기가 0 근처이므로 가격 크기 기준의 절대 오차도 허용
+        tol = 1e-9 * np.abs(y).max()
+        assert fc['n'] == len(series)
+        assert fc['slope'] == pytest.approx(slope, rel=1e-6, abs=tol)
+        assert fc['intercept'] == pytest.approx(intercept, rel=1e-6, abs=tol * TARGET_YEAR)
+        assert fc['pred_2026'] == pytest.approx(intercept + slope * TARGET_YEAR, rel=1e-9, abs=tol)
+
+
+def test_sample_csv_matches_polyfit():
+    df, err = load_price_data(os.path.join(ROOT, '한국부동산 가격 데이터.csv'), use_cache=False)
+    assert err is None, err
+    assert_matches_polyfit(df, forecast_all(df))
+
+
+def test_long_and_short_series_match_polyfit():
+    rng = np.random.default_rng(1)
+    points = {
+        # X_OFFSET(2000년) 이전부터 이어지는 긴 시계열 (시간축이 음수~양수)
+        ('서울', '모든면적'): [(y, m) for y in range(1985, 2026) for m in range(1, 13)],
+        # 두 달만 있는 시계열, 같은 달이 여러 번 나오는 시계열
+        ('부산', '모든면적'): [(2025, 1), (2025, 2)],
+        ('전남', '모든면적'): [(2024, 3)] * 5 + [(2025, 3)] * 5,
+        # 드문드문 관측된 시계열
+        ('제주', '모든면적'): sorted({(int(y), int(m)) for y, m in zip(rng.integers(2005, 2026, 30), rng.integers(1, 13, 30))}),
+    }
+    df = make_series(points)
+    table = forecast_all(df)
+    assert len(table) == len(points)
+    assert_matches_polyfit(df, table)
+
+
+def test_single_point_has_no_trend():
+    df = make_series({('서울', '모든면적'): [(2025, 6)]})
+    fc = forecast_all(df).iloc[0]
+    assert fc['n'] == 1
+    assert np.isnan(fc['slope']) and np.isnan(fc['intercept']) and np.isnan(fc['pred_2026'])
+    assert fc['last_val'] == pytest.approx(df['평당가'].iloc[0])
+
+
+@pytest.mark.parametrize('month', range(1, 13))
+@pytest.mark.parametrize('n', [2, 3, 7, 30])
+def test_constant_time_axis_has_no_trend(n, month):
+    # 모든 행이 같은 시점이면 n·Σx² - (Σx)²가 반올림 오차만 남으므로 기울기를 구하지 않아야 함
+    df = make_series({('서울', '모든면적'): [(2025, month)] * n})
+    fc = forecast_all(df).iloc[0]
+    assert fc['n'] == n
+    assert np.isnan(fc['slope']) and np.isnan(fc['pred_2026'])
@@ -0,0 +1,57 @@
+"""정규화 결과 확인: 벡터화 경로가 행 단위 구현과 같고, 어느 읽기 경로든 PRICE_SCHEMA를 따르는지 작은 표본으로 확인"""
+import os
+
+import pandas as pd
+import pytest
+
+from benchmarks.bench_budongsan_normalize import ROOT, check_identical, make_messy_frame
+from budongsan_core import PRICE_SCHEMA, load_price_data, normalize_frame, schema_errors
+from csv_loader import read_csv_auto
+
+SAMPLE_CSV = os.path.join(ROOT, '한국부동산 가격 데이터.csv')
+
+
+@pytest.fixture(scope='module')
+def sample():
+    df, _ = read_csv_auto(SAMPLE_CSV)
+    return df
+
+
+def test_sample_csv_matches_legacy(sample):
+    check_identical(sample)
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_messy_frame_matches_legacy(seed):
+    # 콤마/단위/공백/결측/잘못된 월이 섞인 수백 행
+    check_identical(make_messy_frame(400, seed=seed))
+
+
+def test_normalize_frame_follows_schema():
+    df, err = normalize_frame(make_messy_frame(300))
+    assert err is None, err
+    assert schema_errors(df) == []
+    assert list(df.columns) == list(PRICE_SCHEMA)
+
+
+def test_schema_errors_reports_drift():
+    df, _ = normalize_frame(make_messy_frame(50))
+    assert schema_errors(df.astype({'연도': 'int64'})) == ["연도: int64 != int16"]
+    assert schema_errors(df[list(reversed(df.columns))])[0].startswith("컬럼 순서 불일치")
+
+
+def test_streaming_and_cache_follow_schema(tmp_path):
+    full, err = load_price_data(SAMPLE_CSV, use_cache=False, chunksize=0)
+    assert err is None, err
+    # 조각 경계가 여러 번 생기도록 작은 chunksize로 스트리밍
+    streamed, err = load_price_data(SAMPLE_CSV, use_cache=False, chunksize=64)
+    assert err is None, err
+    assert schema_errors(full) == [] and schema_errors(streamed) == []
+    pd.testing.assert_frame_equal(full, streamed)
+
+    cache_dir = str(tmp_path / 'cache')
+    written, _ = load_price_data(SAMPLE_CSV, cache_dir=cache_dir, chunksize=0)
+    cached, _ = load_price_data(SAMPLE_CSV, cache_dir=cache_dir, chunksize=0)
+    assert len(os.listdir(cache_dir)) == 1
+    assert schema_errors(cached) == []
+    pd.testing.assert_frame_equal(cached, written)
@@ -0,0 +1,67 @@
+"""PriceStore 증분 갱신(새 달 추가, 기존 파일 교체)이 전체를 다시 읽어 계산한 결과와 같은지 확인"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from budongsan_forecast import forecast_all
+from budongsan_ingest import load_price_files
+from budongsan_store import sync_store
+
+REGIONS = ['서울', '부산', '전남']
+SIZES = ['모든면적', '전용면적 60제곱미터이하']
+
+
+def write_months(path, months, seed, encoding='utf-8-sig'):
+    """원본 CSV 형식으로 (연도, 월)마다 지역 x 규모 한 행씩 기록"""
+    rng = np.random.default_rng(seed)
+    rows = [(region, size, year, month, f"{rng.integers(2000, 9000):,}")
+            for year, month in months for region in REGIONS for size in SIZES]
+    df = pd.DataFrame(rows, columns=['지역명', '규모구분', '연도', '월', '분양가격(제곱미터)'])
+    df.to_csv(path, index=False, encoding=encoding)
+
+
+def bump_mtime(path):
+    # 같은 크기로 다시 써도 변경으로 인식되도록 수정 시각을 확실히 바꿈
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+
+def assert_matches_full_reload(store, paths):
+    expected, err = load_price_files(paths, workers=1)
+    assert err is None, err
+    actual = store.frame()
+    pd.testing.assert_frame_equal(actual.reset_index(drop=True), expected.reset_index(drop=True),
+                                  check_categorical=False)
+    pd.testing.assert_frame_equal(store.forecasts(), forecast_all(expected), check_exact=False, rtol=1e-9)
+    assert actual.attrs['encodings'] == expected.attrs['encodings']
+    assert actual.attrs['encoding'] == expected.attrs['encoding']
+
+
+def test_append_and_replace_match_full_refit(tmp_path, monkeypatch):
+    # 기본 캐시 폴더(상대 경로)가 임시 폴더 안에 생기도록
+    monkeypatch.chdir(tmp_path)
+    folder = tmp_path / 'data'
+    folder.mkdir()
+    history = [(y, m) for y in range(2018, 2025) for m in range(1, 13)]
+    a, b, c = (str(folder / name) for name in ('2024.csv', '2025a.csv', '2025b.csv'))
+    write_months(a, history, seed=0)
+    write_months(b, [(2025, m) for m in range(1, 7)], seed=1)
+
+    store, loaded = sync_store(None, [a, b])
+    assert loaded == [a, b]
+    assert_matches_full_reload(store, [a, b])
+
+    # 새 달 추가 + 지난달 정정분 (같은 키 대체): 새 파일만 추가로 읽음 (인코딩이 다른 파일)
+    write_months(c, [(2025, 6), (2025, 7)], seed=2, encoding='cp949')
+    same, loaded = sync_store(store, [a, b, c])
+    assert same is store and loaded == [c]
+    assert_matches_full_reload(store, [a, b, c])
+    assert len(set(store.frame().attrs['encodings'].values())) == 2
+
+    # 이미 적재한 파일을 교체하면 전체를 다시 읽은 새 저장소
+    write_months(b, [(2025, m) for m in range(1, 7)], seed=3)
+    bump_mtime(b)
+    rebuilt, loaded = sync_store(store, [a, b, c])
+    assert rebuilt is not store and loaded == [a, b, c]
+    assert_matches_full_reload(rebuilt, [a, b, c])
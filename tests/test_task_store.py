@@ -0,0 +1,121 @@
+"""TaskIndex 증분 카운터/인덱스를 임의의 추가/완료/삭제 순서로 검증"""
+import random
+import threading
+from datetime import date, timedelta
+
+import pytest
+
+from task_store import MemoryStore, SQLiteStore, TaskIndex, create_task
+
+START = date(2024, 12, 20)
+
+
+def random_ops(index, store, seed, steps=300):
+    """같은 변경을 TaskIndex(verify=True)와 SQLite 저장소에 적용 (변경마다 check_counts 실행)"""
+    rng = random.Random(seed)
+    for step in range(steps):
+        op = rng.random()
+        if op < 0.5 or not index.by_id:
+            task = create_task(f"할 일 {step}", rng.randint(1, 4), START + timedelta(days=rng.randint(0, 30)))
+            index.add(dict(task))
+            store.add(task)
+        elif op < 0.8:
+            task_id = rng.choice(list(index.by_id))
+            completed = rng.random() < 0.6
+            index.set_completed(task_id, completed)
+            store.set_completed(task_id, completed)
+        elif op < 0.97:
+            task_id = rng.choice(list(index.by_id))
+            index.delete(task_id)
+            store.delete(task_id)
+        else:
+            index.delete_completed()
+            store.delete_completed()
+        if step == steps // 3:
+            # 이후 변경은 Fenwick 트리도 함께 갱신되며 check_counts가 구간 합까지 비교
+            index.range_stats(START, START)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_counts_match_full_recount(seed, tmp_path):
+    index = TaskIndex(verify=True)
+    store = SQLiteStore(str(tmp_path / 'tasks.sqlite3'))
+    random_ops(index, store, seed)
+    index.check_counts()
+
+    end = START + timedelta(days=30)
+    assert index.stats() == store.range_stats(START, end)
+    assert index.range_stats(START, end) == store.range_stats(START, end)
+    assert index.daily_stats(START, end) == store.day_stats(START, end)
+    for q in range(1, 5):
+        assert [t['id'] for t in index.open_between(quadrant=q)] == [t['id'] for t in store.load_open(quadrant=q)]
+
+
+def test_check_counts_detects_drift():
+    index = TaskIndex([create_task("보고서", 1, START)])
+    index.counts['completed'] += 1
+    with pytest.raises(AssertionError):
+        index.check_counts()
+
+
+def test_load_limit_keeps_registration_order(tmp_path):
+    store = SQLiteStore(str(tmp_path / 'tasks.sqlite3'))
+    tasks = [create_task(f"할 일 {i}", 2, START) for i in range(10)]
+    for task in tasks:
+        store.add(task)
+    assert [t['id'] for t in store.load(quadrant=2, limit=4)] == [t['id'] for t in tasks[:4]]
+    # app1은 전체 날짜 구간의 집계로 사분면별 남은 개수를 표시
+    assert store.range_stats(date.min, date.max)['q2'] == 10
+
+
+def test_owners_share_file_but_not_tasks(tmp_path):
+    path = str(tmp_path / 'tasks.sqlite3')
+    alice, bob = SQLiteStore(path, 'alice'), SQLiteStore(path, 'bob')
+    mine = create_task("보고서", 1, START)
+    alice.add(mine)
+    alice.add(create_task("회의", 2, START))
+    alice.set_completed(mine['id'], True)
+    theirs = create_task("운동", 1, START)
+    bob.add(theirs)
+    bob.set_completed(theirs['id'], True)
+
+    # 다른 사용자의 할 일은 id를 알아도 바꾸거나 지울 수 없음
+    bob.set_completed(mine['id'], False)
+    bob.delete(mine['id'])
+    bob.delete_completed()
+    assert [t['text'] for t in alice.load()] == ["보고서", "회의"]
+    assert alice.range_stats(START, START)['completed'] == 1
+
+    bob.clear()
+    assert bob.load() == [] and bob.day_stats(START, START) == {}
+    assert alice.range_stats(START, START)['total'] == 2
+    # 소유자 컬럼은 조회 결과에 섞이지 않음 (MemoryStore와 같은 모양)
+    assert set(alice.load()[0]) == set(mine)
+
+
+def test_memory_store_shared_between_threads():
+    # st.cache_resource로 공유될 때처럼 여러 세션 스레드가 동시에 변경/조회
+    store = MemoryStore()
+    errors = []
+
+    def session(seed):
+        rng = random.Random(seed)
+        try:
+            for step in range(400):
+                task = create_task(f"할 일 {seed}-{step}", rng.randint(1, 4), START + timedelta(days=rng.randint(0, 30)))
+                store.add(task)
+                store.set_completed(task['id'], rng.random() < 0.5)
+                if rng.random() < 0.3:
+                    store.delete(task['id'])
+                store.load(START + timedelta(days=15), quadrant=rng.randint(1, 4))
+                store.range_stats(START, START + timedelta(days=30))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=session, args=(seed,)) for seed in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    store.index.check_counts()
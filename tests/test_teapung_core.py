@@ -0,0 +1,50 @@
+"""'전국(전남)' 컬럼 파서(parse_damage_column)가 셀 단위 기존 파서(parse_val)와 같은 값을 내는지 확인"""
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from csv_loader import read_csv_auto
+from teapung_core import TARGET_COLS, parse_damage_column, parse_val
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CELLS = [
+    # 숫자만 / 전국(전남) / 콤마·소수점
+    '15', 15, 15.0, '15(2)', '1,234(56.7)', '12,345,678(1,234.5)', '0(0)', '3.(1.)',
+    # 괄호 부분이 없거나 전국 값이 없는 경우
+    '1,234', '(7)', '-', '미집계',
+    # 빈 셀 / 결측
+    '', '   ', None, np.nan,
+    # 앞뒤·중간 공백, 줄바꿈
+    '  1,234(56.7)  ', '1,234 (56.7)', '1,234( 56.7 )', '\t15(2)\n', '15\n(2)',
+    # 괄호가 여러 개이거나 숫자가 아닌 괄호
+    '12(abc)(3)', '12(3)(4)', '5(약 2)',
+]
+
+
+def legacy(cells):
+    return ([parse_val(c, 'national') for c in cells], [parse_val(c, 'jeonnam') for c in cells])
+
+
+@pytest.mark.parametrize('cell', CELLS)
+def test_cell_matches_parse_val(cell):
+    national, jeonnam = parse_damage_column(pd.Series([cell], dtype=object))
+    assert national.tolist() == [parse_val(cell, 'national')]
+    assert jeonnam.tolist() == [parse_val(cell, 'jeonnam')]
+
+
+def test_column_keeps_index_and_dtype():
+    series = pd.Series(CELLS, index=range(100, 100 + len(CELLS)), dtype=object)
+    national, jeonnam = parse_damage_column(series)
+    assert national.dtype == 'float64' and jeonnam.dtype == 'float64'
+    assert national.index.equals(series.index) and jeonnam.index.equals(series.index)
+    assert (national.tolist(), jeonnam.tolist()) == legacy(CELLS)
+
+
+def test_sample_csv_matches_parse_val():
+    df, _ = read_csv_auto(os.path.join(ROOT, '전라남도_연도별 태풍피해 현황_20251104.csv'))
+    for col in TARGET_COLS.values():
+        national, jeonnam = parse_damage_column(df[col])
+        assert (national.tolist(), jeonnam.tolist()) == legacy(df[col].tolist())